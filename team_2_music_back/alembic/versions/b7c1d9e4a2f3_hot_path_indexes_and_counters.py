@@ -0,0 +1,125 @@
+"""Hot path indexes and denormalized counters
+
+Revision ID: b7c1d9e4a2f3
+Revises: 525f02d4354c
+Create Date: 2026-10-17 10:12:44.318027
+
+조회가 잦은 경로의 인덱스와 비정규화 카운터 컬럼을 추가합니다.
+  - Postgres에서는 인덱스를 CREATE INDEX CONCURRENTLY로 만들어 운영 중 테이블 쓰기를 막지 않습니다.
+  - create_all로 만든 DB에는 이미 있는 컬럼/인덱스를 건너뛰므로 어느 상태의 DB에서도 실행할 수 있습니다.
+  - 카운터 컬럼은 기존 데이터 기준으로 채웁니다 (reconcile_counters.py와 같은 집계).
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7c1d9e4a2f3'
+down_revision: Union[str, None] = '525f02d4354c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (테이블, 컬럼, 원본 테이블, 원본 FK)
+COUNTERS = [
+    ("tracks", "like_count", "likes", "track_id"),
+    ("tracks", "comment_count", "comments", "track_id"),
+    ("tracks", "play_count", "play_history", "track_id"),
+    ("user_profiles", "follower_count", "follows", "following_id"),
+    ("user_profiles", "following_count", "follows", "follower_id"),
+]
+
+# (인덱스 이름, 테이블, 컬럼)
+INDEXES = [
+    ("ix_likes_user_id_created_at", "likes", ["user_id", "created_at"]),
+    ("ix_likes_track_id_created_at", "likes", ["track_id", "created_at"]),
+    ("ix_comments_track_id_created_at", "comments", ["track_id", "created_at"]),
+    ("ix_follows_following_id_created_at", "follows", ["following_id", "created_at"]),
+    ("ix_follows_follower_id_created_at", "follows", ["follower_id", "created_at"]),
+    ("ix_playlist_tracks_playlist_id_track_order", "playlist_tracks", ["playlist_id", "track_order"]),
+    ("ix_play_history_user_id_played_at", "play_history", ["user_id", "played_at"]),
+    ("ix_play_history_track_id", "play_history", ["track_id"]),
+    ("ix_tracks_owner_user_id", "tracks", ["owner_user_id"]),
+    ("ix_playlists_owner_user_id_created_at", "playlists", ["owner_user_id", "created_at"]),
+]
+
+
+def _is_postgres() -> bool:
+    return op.get_context().dialect.name == "postgresql"
+
+
+def _existing(present_offline: bool):
+    """
+    현재 DB의 (테이블, 테이블별 컬럼 이름, 테이블별 인덱스 이름)
+    오프라인(--sql) 모드에서는 DB를 조회할 수 없으므로, present_offline에 따라
+    대상 컬럼/인덱스가 모두 있거나 모두 없다고 가정합니다.
+    """
+    tables = {table for table, *_ in COUNTERS} | {table for _, table, _ in INDEXES}
+    if context.is_offline_mode():
+        columns = {table: {column for t, column, *_ in COUNTERS if t == table} for table in tables}
+        indexes = {table: {name for name, t, _ in INDEXES if t == table} for table in tables}
+        if not present_offline:
+            columns = {table: set() for table in tables}
+            indexes = {table: set() for table in tables}
+        return tables, columns, indexes
+
+    inspector = sa.inspect(op.get_bind())
+    tables &= set(inspector.get_table_names())
+    columns = {table: {c["name"] for c in inspector.get_columns(table)} for table in tables}
+    indexes = {table: {i["name"] for i in inspector.get_indexes(table)} for table in tables}
+    return tables, columns, indexes
+
+
+def upgrade() -> None:
+    tables, columns, indexes = _existing(present_offline=False)
+
+    # 카운터 컬럼 추가 후 기존 데이터로 채우기
+    for table, column, source, source_fk in COUNTERS:
+        if table not in tables or column in columns[table]:
+            continue
+        op.add_column(table, sa.Column(column, sa.Integer(), nullable=False, server_default="0"))
+        if source in tables:
+            op.execute(
+                f"UPDATE {table} SET {column} = "
+                f"(SELECT count(*) FROM {source} WHERE {source}.{source_fk} = {table}.id)"
+            )
+
+    missing = [
+        (name, table, index_columns)
+        for name, table, index_columns in INDEXES
+        if table in tables and name not in indexes[table]
+    ]
+    if not missing:
+        return
+
+    if _is_postgres():
+        # CONCURRENTLY는 트랜잭션 안에서 실행할 수 없음
+        with op.get_context().autocommit_block():
+            for name, table, index_columns in missing:
+                op.create_index(name, table, index_columns, postgresql_concurrently=True, if_not_exists=True)
+    else:
+        for name, table, index_columns in missing:
+            op.create_index(name, table, index_columns)
+
+
+def downgrade() -> None:
+    tables, columns, indexes = _existing(present_offline=True)
+
+    existing = [
+        (name, table)
+        for name, table, _ in INDEXES
+        if table in tables and name in indexes[table]
+    ]
+    if _is_postgres():
+        with op.get_context().autocommit_block():
+            for name, table in existing:
+                op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+    else:
+        for name, table in existing:
+            op.drop_index(name, table_name=table)
+
+    for table, column, _, _ in COUNTERS:
+        if table in tables and column in columns[table]:
+            op.drop_column(table, column)
@@ -0,0 +1,106 @@
+"""Track full text search index
+
+Revision ID: d4e8f2a1c6b5
+Revises: b7c1d9e4a2f3
+Create Date: 2026-10-17 11:03:27.514820
+
+트랙 제목/아티스트/설명 전문 검색 인덱스를 추가합니다.
+  - Postgres: tsvector 생성 컬럼(search_vector) + GIN 인덱스 (CREATE INDEX CONCURRENTLY)
+  - SQLite: tracks를 원본으로 하는 FTS5 가상 테이블(tracks_fts) + 동기화 트리거, 기존 트랙으로 채움
+create_all로 이미 만들어진 경우는 건너뜁니다.
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4e8f2a1c6b5'
+down_revision: Union[str, None] = 'b7c1d9e4a2f3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(artist_name, '')), 'B') || "
+    "setweight(to_tsvector('simple', coalesce(description, '')), 'C')"
+)
+FTS_DELETE = (
+    "INSERT INTO tracks_fts(tracks_fts, rowid, title, artist_name, description) "
+    "VALUES ('delete', old.id, old.title, old.artist_name, old.description);"
+)
+FTS_INSERT = (
+    "INSERT INTO tracks_fts(rowid, title, artist_name, description) "
+    "VALUES (new.id, new.title, new.artist_name, new.description);"
+)
+SQLITE_TRIGGERS = ["tracks_fts_ai", "tracks_fts_ad", "tracks_fts_au"]
+
+
+def _is_postgres() -> bool:
+    return op.get_context().dialect.name == "postgresql"
+
+
+def _search_index_exists(present_offline: bool) -> bool:
+    """오프라인(--sql) 모드에서는 DB를 조회할 수 없으므로 present_offline을 가정"""
+    if context.is_offline_mode():
+        return present_offline
+    inspector = sa.inspect(op.get_bind())
+    if _is_postgres():
+        return any(c["name"] == "search_vector" for c in inspector.get_columns("tracks"))
+    return "tracks_fts" in inspector.get_table_names()
+
+
+def _tracks_exists() -> bool:
+    if context.is_offline_mode():
+        return True
+    return "tracks" in sa.inspect(op.get_bind()).get_table_names()
+
+
+def upgrade() -> None:
+    # tracks 테이블이 없으면 (create_all 전) create_all이 인덱스도 함께 만듦
+    if not _tracks_exists() or _search_index_exists(present_offline=False):
+        return
+
+    if _is_postgres():
+        op.execute(
+            f"ALTER TABLE tracks ADD COLUMN search_vector tsvector "
+            f"GENERATED ALWAYS AS ({SEARCH_VECTOR_SQL}) STORED"
+        )
+        # CONCURRENTLY는 트랜잭션 안에서 실행할 수 없음
+        with op.get_context().autocommit_block():
+            op.execute(
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_tracks_search_vector "
+                "ON tracks USING gin (search_vector)"
+            )
+        return
+
+    op.execute(
+        "CREATE VIRTUAL TABLE tracks_fts USING fts5("
+        "title, artist_name, description, content='tracks', content_rowid='id', "
+        "tokenize='unicode61 remove_diacritics 2', prefix='2 3')"
+    )
+    op.execute(f"CREATE TRIGGER tracks_fts_ai AFTER INSERT ON tracks BEGIN {FTS_INSERT} END")
+    op.execute(f"CREATE TRIGGER tracks_fts_ad AFTER DELETE ON tracks BEGIN {FTS_DELETE} END")
+    op.execute(
+        "CREATE TRIGGER tracks_fts_au AFTER UPDATE OF title, artist_name, description ON tracks "
+        f"BEGIN {FTS_DELETE} {FTS_INSERT} END"
+    )
+    # 기존 트랙으로 인덱스 채우기
+    op.execute("INSERT INTO tracks_fts(tracks_fts) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    if not _tracks_exists() or not _search_index_exists(present_offline=True):
+        return
+
+    if _is_postgres():
+        with op.get_context().autocommit_block():
+            op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_tracks_search_vector")
+        op.drop_column("tracks", "search_vector")
+        return
+
+    for trigger in SQLITE_TRIGGERS:
+        op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+    op.execute("DROP TABLE IF EXISTS tracks_fts")
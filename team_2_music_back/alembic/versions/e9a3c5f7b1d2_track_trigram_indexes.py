@@ -0,0 +1,62 @@
+"""Track trigram indexes for fuzzy search
+
+Revision ID: e9a3c5f7b1d2
+Revises: d4e8f2a1c6b5
+Create Date: 2026-10-17 14:21:08.331907
+
+오타 허용 검색용 트랙 제목/아티스트 trigram 인덱스를 추가합니다.
+  - Postgres: pg_trgm 확장 + gin_trgm_ops GIN 인덱스 (CREATE INDEX CONCURRENTLY)
+  - SQLite: 변경 없음 (프로세스 내 n-gram 인덱스 사용)
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e9a3c5f7b1d2'
+down_revision: Union[str, None] = 'd4e8f2a1c6b5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TRGM_INDEXES = [
+    ("ix_tracks_title_trgm", "title"),
+    ("ix_tracks_artist_name_trgm", "artist_name"),
+]
+
+
+def _is_postgres() -> bool:
+    return op.get_context().dialect.name == "postgresql"
+
+
+def _tracks_exists() -> bool:
+    if context.is_offline_mode():
+        return True
+    return "tracks" in sa.inspect(op.get_bind()).get_table_names()
+
+
+def upgrade() -> None:
+    # tracks 테이블이 없으면 (create_all 전) create_all이 인덱스도 함께 만듦
+    if not _is_postgres() or not _tracks_exists():
+        return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # CONCURRENTLY는 트랜잭션 안에서 실행할 수 없음
+    with op.get_context().autocommit_block():
+        for name, column in TRGM_INDEXES:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+                f"ON tracks USING gin ({column} gin_trgm_ops)"
+            )
+
+
+def downgrade() -> None:
+    if not _is_postgres() or not _tracks_exists():
+        return
+
+    # 확장은 다른 객체가 사용할 수 있으므로 남겨둠
+    with op.get_context().autocommit_block():
+        for name, _ in TRGM_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
@@ -0,0 +1,94 @@
+"""Tag track counts and track_tags tag index
+
+Revision ID: f2c7a9e1d4b8
+Revises: e9a3c5f7b1d2
+Create Date: 2026-10-17 15:02:51.774610
+
+태그 필터/인기 태그용 카운터 컬럼과 인덱스를 추가합니다.
+  - tags.track_count: 태그가 붙은 트랙 수 (기존 track_tags로 채움)
+  - ix_track_tags_tag_id_track_id: 태그별 트랙 목록 (PK는 track_id가 앞)
+  - ix_tags_track_count: 인기 태그 목록
+Postgres에서는 인덱스를 CREATE INDEX CONCURRENTLY로 만들며, 이미 있는 컬럼/인덱스는 건너뜁니다.
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2c7a9e1d4b8'
+down_revision: Union[str, None] = 'e9a3c5f7b1d2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (인덱스 이름, 테이블, 컬럼)
+INDEXES = [
+    ("ix_track_tags_tag_id_track_id", "track_tags", ["tag_id", "track_id"]),
+    ("ix_tags_track_count", "tags", ["track_count"]),
+]
+
+
+def _is_postgres() -> bool:
+    return op.get_context().dialect.name == "postgresql"
+
+
+def _existing(present_offline: bool):
+    """
+    (있는 테이블, tags 컬럼 이름, 테이블별 인덱스 이름)
+    오프라인(--sql) 모드에서는 present_offline에 따라 모두 있거나 모두 없다고 가정합니다.
+    """
+    tables = {table for _, table, _ in INDEXES}
+    if context.is_offline_mode():
+        if present_offline:
+            return tables, {"track_count"}, {table: {name for name, t, _ in INDEXES if t == table} for table in tables}
+        return tables, set(), {table: set() for table in tables}
+
+    inspector = sa.inspect(op.get_bind())
+    tables &= set(inspector.get_table_names())
+    columns = {c["name"] for c in inspector.get_columns("tags")} if "tags" in tables else set()
+    indexes = {table: {i["name"] for i in inspector.get_indexes(table)} for table in tables}
+    return tables, columns, indexes
+
+
+def upgrade() -> None:
+    tables, columns, indexes = _existing(present_offline=False)
+
+    if "tags" in tables and "track_count" not in columns:
+        op.add_column("tags", sa.Column("track_count", sa.Integer(), nullable=False, server_default="0"))
+        if "track_tags" in tables:
+            op.execute(
+                "UPDATE tags SET track_count = "
+                "(SELECT count(*) FROM track_tags WHERE track_tags.tag_id = tags.id)"
+            )
+
+    missing = [
+        (name, table, cols)
+        for name, table, cols in INDEXES
+        if table in tables and name not in indexes[table]
+    ]
+    if _is_postgres():
+        # CONCURRENTLY는 트랜잭션 안에서 실행할 수 없음
+        with op.get_context().autocommit_block():
+            for name, table, cols in missing:
+                op.create_index(name, table, cols, postgresql_concurrently=True, if_not_exists=True)
+    else:
+        for name, table, cols in missing:
+            op.create_index(name, table, cols)
+
+
+def downgrade() -> None:
+    tables, columns, indexes = _existing(present_offline=True)
+
+    existing = [(name, table) for name, table, _ in INDEXES if table in tables and name in indexes[table]]
+    if _is_postgres():
+        with op.get_context().autocommit_block():
+            for name, table in existing:
+                op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+    else:
+        for name, table in existing:
+            op.drop_index(name, table_name=table)
+
+    if "track_count" in columns:
+        op.drop_column("tags", "track_count")
@@ -1,12 +1,13 @@
 from fastapi import Depends, Header
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from typing import Optional, Dict, Any
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.jwt_utils import verify_token, extract_user_info
 from app.core.exceptions import AuthenticationError
-from app.db.database import get_db
-from app.crud import crud
+from app.core.profile_cache import profile_cache
+from app.db.database import get_async_db
+from app.crud import async_crud
 from app.schemas import schemas
 
 # HTTP Bearer 토큰 스키마
@@ -54,9 +55,44 @@ async def get_current_user(
     return user_info
 
 
+async def resolve_user_profile(
+    db: AsyncSession,
+    current_user: Dict[str, Any]
+) -> schemas.UserProfile:
+    """
+    JWT 사용자에 해당하는 DB 프로필을 반환합니다.
+    프로필 캐시를 먼저 확인하고, 없으면 조회(없으면 생성) 후 캐싱합니다.
+    
+    Args:
+        db: 데이터베이스 세션
+        current_user: JWT에서 추출한 사용자 정보
+        
+    Returns:
+        사용자 프로필
+    """
+    user_id = current_user["user_id"]
+    
+    cached_profile = await profile_cache.get(user_id)
+    if cached_profile is not None:
+        return schemas.UserProfile.model_validate(cached_profile)
+    
+    # DB에서 사용자 프로필 조회 (없으면 자동 생성)
+    user_profile_create = schemas.UserProfileCreate(
+        user_id=user_id,
+        nickname=current_user.get("nickname") or (current_user.get("email") or "").split("@")[0] or "User",
+        bio=None,
+        profile_image_url=None
+    )
+    db_user = await async_crud.get_or_create_user_profile(db, user=user_profile_create)
+    
+    profile = schemas.UserProfile.model_validate(db_user)
+    await profile_cache.set(user_id, profile.model_dump(mode="json"))
+    return profile
+
+
 async def get_current_active_user(
     current_user: Dict[str, Any] = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> Dict[str, Any]:
     """
     현재 사용자가 활성 상태인지 확인합니다.
@@ -72,26 +108,13 @@ async def get_current_active_user(
     Raises:
         AuthenticationError: 사용자가 비활성 상태인 경우
     """
-    user_id = current_user["user_id"]
-    
-    # DB에서 사용자 프로필 조회
-    db_user = crud.get_user_profile_by_user_id(db, user_id=user_id)
-    
-    # 프로필이 없으면 자동 생성
-    if not db_user:
-        user_profile_create = schemas.UserProfileCreate(
-            user_id=user_id,
-            nickname=current_user.get("nickname") or current_user.get("email", "").split("@")[0],
-            bio=None,
-            profile_image_url=None
-        )
-        db_user = crud.create_user_profile(db, user=user_profile_create)
+    db_user = await resolve_user_profile(db, current_user)
     
     # 비활성 사용자 체크
     if not db_user.is_active:
         raise AuthenticationError(
             message="비활성화된 계정입니다",
-            details={"user_id": user_id}
+            details={"user_id": current_user["user_id"]}
         )
     
     # 사용자 정보에 DB ID 추가
@@ -1,13 +1,13 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from sqlalchemy.exc import IntegrityError
-from typing import List
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
 
 from app.schemas import schemas
-from app.crud import crud
-from app.db.database import get_db
+from app.crud import async_crud
+from app.db.database import get_async_db
 from app.api.dependencies import get_current_active_user
-from app.core.exceptions import DuplicateResourceError, ResourceNotFoundError, ValidationError
+from app.core.exceptions import ResourceNotFoundError, ValidationError
+from app.core.pagination import decode_cursor
 
 router = APIRouter()
 
@@ -16,7 +16,7 @@ router = APIRouter()
 async def toggle_follow(
     follow_req: schemas.FollowRequest,
     current_user: dict = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     사용자를 팔로우/언팔로우 토글합니다.
@@ -28,44 +28,17 @@ async def toggle_follow(
     if user_id == current_user["db_user_id"]:
         raise ValidationError("자기 자신을 팔로우할 수 없습니다")
     
-    # 팔로우할 사용자 존재 확인
-    target_user = crud.get_user_profile(db, user_id=user_id)
-    if not target_user:
-        raise ResourceNotFoundError("사용자")
-    
-    # 이미 팔로우했는지 확인
-    existing_follow = crud.get_follow(
+    # 팔로우 토글 (대상 사용자가 없으면 None)
+    result = await async_crud.toggle_follow(
         db, 
         follower_id=current_user["db_user_id"], 
         following_id=user_id
     )
+    if result is None:
+        raise ResourceNotFoundError("사용자")
     
-    if existing_follow:
-        # 언팔로우
-        crud.delete_follow(
-            db, 
-            follower_id=current_user["db_user_id"], 
-            following_id=user_id
-        )
-        is_following = False
-        message = "언팔로우했습니다"
-    else:
-        # 팔로우
-        try:
-            crud.create_follow(
-                db, 
-                follower_id=current_user["db_user_id"], 
-                following_id=user_id
-            )
-            is_following = True
-            message = "팔로우했습니다"
-        except IntegrityError:
-            db.rollback()
-            raise DuplicateResourceError("팔로우")
-    
-    # 팔로워/팔로잉 수 조회
-    follower_count = crud.get_follower_count(db, user_id=user_id)
-    following_count = crud.get_following_count(db, user_id=current_user["db_user_id"])
+    is_following, follower_count, following_count = result
+    message = "팔로우했습니다" if is_following else "언팔로우했습니다"
     
     return {
         "message": message,
@@ -76,78 +49,70 @@ async def toggle_follow(
 
 
 @router.get("/{user_id}/followers", response_model=schemas.FollowListResponse)
-def get_user_followers(
+async def get_user_followers(
     user_id: int,
     skip: int = 0,
     limit: int = 50,
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
-    사용자의 팔로워 목록을 조회합니다.
+    사용자의 팔로워 목록을 조회합니다 (팔로우 최신순).
+    응답의 next_cursor를 cursor로 넘기면 다음 페이지를 조회합니다.
     공개 엔드포인트 (인증 불필요).
     """
-    # 사용자 존재 확인
-    user = crud.get_user_profile(db, user_id=user_id)
-    if not user:
+    page = await async_crud.get_followers(
+        db, user_id=user_id, limit=limit, cursor=decode_cursor(cursor), skip=skip
+    )
+    if page is None:
         raise ResourceNotFoundError("사용자")
-    
-    followers = crud.get_followers(db, user_id=user_id, skip=skip, limit=limit)
-    total = crud.get_follower_count(db, user_id=user_id)
-    
-    return {
-        "users": followers,
-        "total": total
-    }
+    return page
 
 
 @router.get("/{user_id}/following", response_model=schemas.FollowListResponse)
-def get_user_following(
+async def get_user_following(
     user_id: int,
     skip: int = 0,
     limit: int = 50,
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
-    사용자가 팔로우하는 사람들의 목록을 조회합니다.
+    사용자가 팔로우하는 사람들의 목록을 조회합니다 (팔로우 최신순).
+    응답의 next_cursor를 cursor로 넘기면 다음 페이지를 조회합니다.
     공개 엔드포인트 (인증 불필요).
     """
-    # 사용자 존재 확인
-    user = crud.get_user_profile(db, user_id=user_id)
-    if not user:
+    page = await async_crud.get_following(
+        db, user_id=user_id, limit=limit, cursor=decode_cursor(cursor), skip=skip
+    )
+    if page is None:
         raise ResourceNotFoundError("사용자")
-    
-    following = crud.get_following(db, user_id=user_id, skip=skip, limit=limit)
-    total = crud.get_following_count(db, user_id=user_id)
-    
-    return {
-        "users": following,
-        "total": total
-    }
+    return page
 
 
 @router.get("/{user_id}/follow-status")
 async def get_follow_status(
     user_id: int,
     current_user: dict = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     현재 사용자와 대상 사용자 간의 팔로우 상태를 확인합니다.
     인증 필요.
     """
     # 사용자 존재 확인
-    target_user = crud.get_user_profile(db, user_id=user_id)
+    target_user = await async_crud.get_user_profile_cached(db, user_id=user_id)
     if not target_user:
         raise ResourceNotFoundError("사용자")
     
     # 팔로우 상태 확인
-    is_following = crud.get_follow(
+    is_following = await async_crud.get_follow(
         db, 
         follower_id=current_user["db_user_id"], 
         following_id=user_id
     ) is not None
     
-    is_followed_by = crud.get_follow(
+    is_followed_by = await async_crud.get_follow(
         db, 
         follower_id=user_id, 
         following_id=current_user["db_user_id"]
@@ -156,6 +121,6 @@ async def get_follow_status(
     return {
         "is_following": is_following,  # 내가 상대방을 팔로우하는지
         "is_followed_by": is_followed_by,  # 상대방이 나를 팔로우하는지
-        "follower_count": crud.get_follower_count(db, user_id=user_id),
-        "following_count": crud.get_following_count(db, user_id=user_id)
+        "follower_count": await async_crud.get_follower_count(db, user_id=user_id),
+        "following_count": await async_crud.get_following_count(db, user_id=user_id)
     }
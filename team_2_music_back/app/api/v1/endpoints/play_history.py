@@ -1,12 +1,13 @@
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Depends, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
 
 from app.schemas import schemas
-from app.crud import crud
-from app.db.database import get_db
+from app.crud import async_crud
+from app.db.database import get_async_db
 from app.api.dependencies import get_current_active_user
 from app.core.exceptions import ResourceNotFoundError
+from app.core.pagination import NEXT_CURSOR_HEADER, decode_cursor, encode_cursor
 
 router = APIRouter()
 
@@ -15,19 +16,19 @@ router = APIRouter()
 async def record_play(
     track_id: int,
     current_user: dict = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     트랙 재생을 기록합니다.
     인증 필요.
     """
     # 트랙 존재 확인
-    track = crud.get_track(db, track_id=track_id)
+    track = await async_crud.get_track_cached(db, track_id=track_id)
     if not track:
         raise ResourceNotFoundError("트랙")
     
     # 재생 기록 생성
-    crud.create_play_history(db, user_id=current_user["db_user_id"], track_id=track_id)
+    await async_crud.create_play_history(db, user_id=current_user["db_user_id"], track_id=track_id)
     
     return {
         "message": "재생 기록이 저장되었습니다",
@@ -37,21 +38,27 @@ async def record_play(
 
 @router.get("/users/me/history", response_model=List[schemas.PlayHistory])
 async def get_my_play_history(
+    response: Response,
     skip: int = 0,
     limit: int = 50,
+    cursor: Optional[str] = None,
     current_user: dict = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     내 재생 기록을 조회합니다 (최신순).
+    다음 페이지가 있으면 X-Next-Cursor 헤더로 커서를 반환합니다.
     인증 필요.
     """
-    history = crud.get_user_play_history(
+    history, next_cursor = await async_crud.get_user_play_history(
         db, 
         user_id=current_user["db_user_id"], 
         skip=skip, 
-        limit=limit
+        limit=limit,
+        cursor=decode_cursor(cursor)
     )
+    if next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(next_cursor)
     return history
 
 
@@ -59,13 +66,13 @@ async def get_my_play_history(
 async def get_recently_played(
     limit: int = 20,
     current_user: dict = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     최근 재생한 트랙 목록을 조회합니다 (중복 제거).
     인증 필요.
     """
-    tracks = crud.get_recently_played_tracks(
+    tracks = await async_crud.get_recently_played_tracks(
         db, 
         user_id=current_user["db_user_id"], 
         limit=limit
@@ -74,20 +81,20 @@ async def get_recently_played(
 
 
 @router.get("/tracks/{track_id}/play-count")
-def get_track_play_count(
+async def get_track_play_count(
     track_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     트랙의 총 재생 수를 조회합니다.
     공개 엔드포인트 (인증 불필요).
     """
     # 트랙 존재 확인
-    track = crud.get_track(db, track_id=track_id)
+    track = await async_crud.get_track_cached(db, track_id=track_id)
     if not track:
         raise ResourceNotFoundError("트랙")
     
-    play_count = crud.get_play_count(db, track_id=track_id)
+    play_count = await async_crud.get_play_count(db, track_id=track_id)
     
     return {
         "track_id": track_id,
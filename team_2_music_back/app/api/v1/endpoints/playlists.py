@@ -1,13 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
-from typing import List
+from typing import List, Optional
 
 from app.schemas import schemas
-from app.crud import crud
-from app.db.database import get_db
+from app.crud import async_crud
+from app.db.database import get_async_db
 from app.api.dependencies import get_current_active_user, get_optional_user
 from app.core.exceptions import ResourceNotFoundError, AuthorizationError, DuplicateResourceError
+from app.core.pagination import NEXT_CURSOR_HEADER, decode_cursor, encode_cursor
 
 router = APIRouter()
 
@@ -16,27 +17,32 @@ router = APIRouter()
 async def create_playlist(
     playlist: schemas.PlaylistCreate,
     current_user: dict = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     플레이리스트를 생성합니다.
     인증 필요.
     """
-    db_playlist = crud.create_playlist(db, playlist=playlist, owner_id=current_user["db_user_id"])
+    db_playlist = await async_crud.create_playlist(db, playlist=playlist, owner_id=current_user["db_user_id"])
     return db_playlist
 
 
 @router.get("/{playlist_id}", response_model=schemas.PlaylistWithTracks)
 async def get_playlist(
     playlist_id: int,
+    track_offset: int = Query(0, ge=0),
+    track_limit: Optional[int] = Query(None, ge=1, le=500),
     current_user: dict = Depends(get_optional_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     플레이리스트를 조회합니다.
     공개 플레이리스트는 누구나 조회 가능, 비공개는 소유자만 가능.
+    트랙 수와 관계없이 플레이리스트(+소유자), 트랙(+소유자), 트랙 수 조회
+    최대 3개의 쿼리로 응답하며, 각각 캐시됩니다.
+    track_limit을 주면 track_offset부터 해당 개수의 트랙만 반환합니다.
     """
-    db_playlist = crud.get_playlist(db, playlist_id=playlist_id)
+    db_playlist = await async_crud.get_playlist_cached(db, playlist_id=playlist_id)
     if not db_playlist:
         raise ResourceNotFoundError("플레이리스트")
     
@@ -46,7 +52,10 @@ async def get_playlist(
             raise AuthorizationError("비공개 플레이리스트는 소유자만 조회할 수 있습니다")
     
     # 트랙 목록 추가
-    tracks = crud.get_playlist_tracks(db, playlist_id=playlist_id)
+    tracks = await async_crud.get_playlist_tracks(
+        db, playlist_id=playlist_id, offset=track_offset, limit=track_limit
+    )
+    track_count = await async_crud.get_playlist_track_count(db, playlist_id=playlist_id)
     
     # Pydantic 모델로 변환
     playlist_dict = {
@@ -57,7 +66,8 @@ async def get_playlist(
         "owner_user_id": db_playlist.owner_user_id,
         "created_at": db_playlist.created_at,
         "owner": db_playlist.owner,
-        "tracks": tracks
+        "tracks": tracks,
+        "track_count": track_count
     }
     
     return playlist_dict
@@ -68,13 +78,13 @@ async def update_playlist(
     playlist_id: int,
     playlist_update: schemas.PlaylistUpdate,
     current_user: dict = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     플레이리스트를 수정합니다.
     인증 필요 (소유자만 가능).
     """
-    db_playlist = crud.get_playlist(db, playlist_id=playlist_id)
+    db_playlist = await async_crud.get_playlist(db, playlist_id=playlist_id)
     if not db_playlist:
         raise ResourceNotFoundError("플레이리스트")
     
@@ -84,7 +94,7 @@ async def update_playlist(
     
     # 업데이트
     update_data = playlist_update.dict(exclude_unset=True)
-    updated_playlist = crud.update_playlist(db, playlist=db_playlist, update_data=update_data)
+    updated_playlist = await async_crud.update_playlist(db, playlist=db_playlist, update_data=update_data)
     
     return updated_playlist
 
@@ -93,13 +103,13 @@ async def update_playlist(
 async def delete_playlist(
     playlist_id: int,
     current_user: dict = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     플레이리스트를 삭제합니다.
     인증 필요 (소유자만 가능).
     """
-    db_playlist = crud.get_playlist(db, playlist_id=playlist_id)
+    db_playlist = await async_crud.get_playlist(db, playlist_id=playlist_id)
     if not db_playlist:
         raise ResourceNotFoundError("플레이리스트")
     
@@ -107,33 +117,43 @@ async def delete_playlist(
     if db_playlist.owner_user_id != current_user["db_user_id"]:
         raise AuthorizationError("플레이리스트 소유자만 삭제할 수 있습니다")
     
-    crud.delete_playlist(db, playlist=db_playlist)
+    await async_crud.delete_playlist(db, playlist=db_playlist)
     
     return {"message": "플레이리스트가 삭제되었습니다"}
 
 
 @router.get("/users/{user_id}/playlists", response_model=List[schemas.Playlist])
-def get_user_playlists(
+async def get_user_playlists(
     user_id: int,
+    response: Response,
     skip: int = 0,
     limit: int = 50,
+    cursor: Optional[str] = None,
     current_user: dict = Depends(get_optional_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
-    사용자의 플레이리스트 목록을 조회합니다.
+    사용자의 플레이리스트 목록을 조회합니다 (최신순).
     공개 플레이리스트는 누구나, 비공개는 본인만 조회 가능.
+    다음 페이지가 있으면 X-Next-Cursor 헤더로 커서를 반환합니다.
     """
     # 사용자 존재 확인
-    user = crud.get_user_profile(db, user_id=user_id)
+    user = await async_crud.get_user_profile_cached(db, user_id=user_id)
     if not user:
         raise ResourceNotFoundError("사용자")
     
-    playlists = crud.get_user_playlists(db, user_id=user_id, skip=skip, limit=limit)
-    
-    # 본인이 아니면 공개 플레이리스트만 필터링
-    if not current_user or current_user.get("db_user_id") != user_id:
-        playlists = [p for p in playlists if p.is_public]
+    # 본인이 아니면 공개 플레이리스트만 조회
+    is_owner = bool(current_user) and current_user.get("db_user_id") == user_id
+    playlists, next_cursor = await async_crud.get_user_playlists(
+        db,
+        user_id=user_id,
+        skip=skip,
+        limit=limit,
+        cursor=decode_cursor(cursor),
+        include_private=is_owner,
+    )
+    if next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(next_cursor)
     
     return playlists
 
@@ -143,14 +163,14 @@ async def add_track_to_playlist(
     playlist_id: int,
     request: schemas.AddTrackRequest,
     current_user: dict = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     플레이리스트에 트랙을 추가합니다.
     인증 필요 (소유자만 가능).
     """
     # 플레이리스트 존재 확인
-    db_playlist = crud.get_playlist(db, playlist_id=playlist_id)
+    db_playlist = await async_crud.get_playlist_cached(db, playlist_id=playlist_id)
     if not db_playlist:
         raise ResourceNotFoundError("플레이리스트")
     
@@ -159,18 +179,17 @@ async def add_track_to_playlist(
         raise AuthorizationError("플레이리스트 소유자만 트랙을 추가할 수 있습니다")
     
     # 트랙 존재 확인
-    track = crud.get_track(db, track_id=request.track_id)
+    track = await async_crud.get_track_cached(db, track_id=request.track_id)
     if not track:
         raise ResourceNotFoundError("트랙")
     
     # 트랙 추가
     try:
-        crud.add_track_to_playlist(db, playlist_id=playlist_id, track_id=request.track_id)
+        await async_crud.add_track_to_playlist(db, playlist_id=playlist_id, track_id=request.track_id)
     except IntegrityError:
-        db.rollback()
         raise DuplicateResourceError("플레이리스트에 이미 존재하는 트랙")
     
-    track_count = crud.get_playlist_track_count(db, playlist_id=playlist_id)
+    track_count = await async_crud.get_playlist_track_count(db, playlist_id=playlist_id)
     
     return {
         "message": "트랙이 추가되었습니다",
@@ -184,14 +203,14 @@ async def remove_track_from_playlist(
     playlist_id: int,
     track_id: int,
     current_user: dict = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     플레이리스트에서 트랙을 삭제합니다.
     인증 필요 (소유자만 가능).
     """
     # 플레이리스트 존재 확인
-    db_playlist = crud.get_playlist(db, playlist_id=playlist_id)
+    db_playlist = await async_crud.get_playlist_cached(db, playlist_id=playlist_id)
     if not db_playlist:
         raise ResourceNotFoundError("플레이리스트")
     
@@ -200,7 +219,7 @@ async def remove_track_from_playlist(
         raise AuthorizationError("플레이리스트 소유자만 트랙을 삭제할 수 있습니다")
     
     # 트랙 삭제
-    deleted = crud.remove_track_from_playlist(db, playlist_id=playlist_id, track_id=track_id)
+    deleted = await async_crud.remove_track_from_playlist(db, playlist_id=playlist_id, track_id=track_id)
     if not deleted:
         raise ResourceNotFoundError("플레이리스트에서 트랙")
     
@@ -212,14 +231,14 @@ async def reorder_playlist_tracks(
     playlist_id: int,
     request: schemas.ReorderTrackRequest,
     current_user: dict = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     플레이리스트 트랙의 순서를 변경합니다.
     인증 필요 (소유자만 가능).
     """
     # 플레이리스트 존재 확인
-    db_playlist = crud.get_playlist(db, playlist_id=playlist_id)
+    db_playlist = await async_crud.get_playlist_cached(db, playlist_id=playlist_id)
     if not db_playlist:
         raise ResourceNotFoundError("플레이리스트")
     
@@ -228,7 +247,7 @@ async def reorder_playlist_tracks(
         raise AuthorizationError("플레이리스트 소유자만 순서를 변경할 수 있습니다")
     
     # 순서 변경
-    success = crud.reorder_playlist_track(
+    success = await async_crud.reorder_playlist_track(
         db, 
         playlist_id=playlist_id, 
         track_id=request.track_id, 
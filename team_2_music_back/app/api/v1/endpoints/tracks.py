@@ -1,7 +1,7 @@
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, Request, Body
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, Request, Body, Response, Query
 from fastapi.responses import FileResponse, StreamingResponse
-from sqlalchemy.orm import Session
-from typing import List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Literal, Optional
 import boto3
 from botocore.exceptions import ClientError
 import uuid
@@ -10,11 +10,13 @@ from pathlib import Path
 from datetime import datetime
 
 from app.schemas import schemas
-from app.crud import crud
-from app.db.database import get_db
+from app.crud import async_crud
+from app.db.database import get_async_db
+from app.core.autocomplete import autocomplete_index
 from app.core.config import settings
-from app.api.dependencies import get_current_active_user, get_optional_user
+from app.api.dependencies import get_current_active_user, get_optional_user, resolve_user_profile
 from app.core.exceptions import ResourceNotFoundError, ValidationError
+from app.core.pagination import NEXT_CURSOR_HEADER, decode_cursor, encode_cursor
 
 router = APIRouter()
 
@@ -111,7 +113,7 @@ async def upload_to_local_storage(file_path: str, request: Request):
 async def finalize_upload(
     request: schemas.UploadFinalizeRequest,
     current_user: Optional[dict] = Depends(get_optional_user),  # Changed to optional for development
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     음악 업로드를 완료하고 DB에 트랙을 생성합니다.
@@ -121,14 +123,12 @@ async def finalize_upload(
         # 개발용: 인증 없는 경우 테스트 유저 사용
         if not current_user:
             # DB에서 테스트 유저 조회 또는 생성
-            test_user = crud.get_user_profile_by_user_id(db, "anonymous")
-            if not test_user:
-                test_user = crud.create_user_profile(db, schemas.UserProfileCreate(
-                    user_id="anonymous", 
-                    nickname="Anonymous",
-                    profile_image_url=None,
-                    bio="Development User"
-                ))
+            test_user = await async_crud.get_or_create_user_profile(db, schemas.UserProfileCreate(
+                user_id="anonymous", 
+                nickname="Anonymous",
+                profile_image_url=None,
+                bio="Development User"
+            ))
             
             current_user = {
                 "user_id": "anonymous",
@@ -156,17 +156,8 @@ async def finalize_upload(
         # 현재 사용자의 DB 프로필에서 닉네임 가져오기
         if "db_user" not in current_user:
             # get_optional_user를 통해 왔지만 DB 프로필이 없는 경우 (실제 토큰 사용 시)
-            user_id = current_user["user_id"]
-            db_user = crud.get_user_profile_by_user_id(db, user_id=user_id)
-            if not db_user:
-                # 프로필이 없으면 생성
-                user_profile_create = schemas.UserProfileCreate(
-                    user_id=user_id,
-                    nickname=current_user.get("nickname") or "User",
-                    bio=None,
-                    profile_image_url=None
-                )
-                db_user = crud.create_user_profile(db, user=user_profile_create)
+            # 프로필 캐시 확인 후 없으면 조회/생성
+            db_user = await resolve_user_profile(db, current_user)
             
             current_user["db_user"] = db_user
             current_user["db_user_id"] = db_user.id
@@ -181,8 +172,11 @@ async def finalize_upload(
             file_url=file_url
         )
         
-        # 트랙 생성 (owner_id는 현재 사용자의 DB ID)
-        return crud.create_track(db=db, track=track_create, owner_id=current_user["db_user_id"])
+        # 트랙 생성 (owner_id는 현재 사용자의 DB ID)과 태그 저장을 한 트랜잭션으로
+        async with async_crud.unit_of_work(db):
+            track = await async_crud.create_track(db=db, track=track_create, owner_id=current_user["db_user_id"])
+            await async_crud.add_track_tags(db, track.id, request.tags or [])
+        return track
         
     except Exception as e:
         import traceback
@@ -190,46 +184,77 @@ async def finalize_upload(
         raise HTTPException(status_code=500, detail=f"Internal Server Error: {str(e)}")
 
 
-@router.get("/search", response_model=List[schemas.Track])
-def search_tracks(
+@router.get("/search", response_model=List[schemas.TrackSearchResult])
+async def search_tracks(
     q: str,
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db)
+    fuzzy: bool = False,
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     트랙을 검색합니다 (제목, 아티스트, 설명).
+    모든 단어를 접두어로 포함하는 트랙을 관련도 높은 순으로 반환합니다.
+    fuzzy=true이면 제목/아티스트 오타를 허용하고, 유사도 점수(score) 순으로 반환합니다.
     공개 엔드포인트 (인증 불필요).
     """
-    tracks = crud.search_tracks(db, query=q, skip=skip, limit=limit)
+    if fuzzy:
+        return await async_crud.search_tracks_fuzzy(db, query=q, skip=skip, limit=limit)
+    tracks = await async_crud.search_tracks(db, query=q, skip=skip, limit=limit)
     return tracks
 
 
+@router.get("/autocomplete", response_model=List[schemas.AutocompleteSuggestion])
+async def autocomplete_tracks(
+    prefix: str = Query(..., max_length=100),
+    limit: int = Query(10, ge=1, le=settings.AUTOCOMPLETE_MAX_LIMIT),
+):
+    """
+    검색창 자동완성 추천어 (트랙 제목, 아티스트, 태그)를 반환합니다.
+    프로세스 내 접두어 인덱스에서 찾으므로 DB를 조회하지 않습니다.
+    한글은 입력 중인 글자와 초성("ㅅㄹ")으로도 찾을 수 있습니다.
+    공개 엔드포인트 (인증 불필요).
+    """
+    return autocomplete_index.suggest(prefix, limit)
+
+
+@router.get("/tags", response_model=List[schemas.Tag])
+async def read_popular_tags(
+    limit: int = Query(20, ge=1, le=100),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    트랙이 많이 붙은 순으로 태그 목록을 반환합니다.
+    공개 엔드포인트 (인증 불필요).
+    """
+    return await async_crud.get_popular_tags(db, limit=limit)
+
+
 @router.get("/{track_id}", response_model=schemas.Track)
-def read_track(track_id: int, db: Session = Depends(get_db)):
+async def read_track(track_id: int, db: AsyncSession = Depends(get_async_db)):
     """
     트랙 정보를 조회합니다.
     공개 엔드포인트 (인증 불필요).
     """
-    db_track = crud.get_track(db, track_id=track_id)
+    db_track = await async_crud.get_track_cached(db, track_id=track_id)
     if db_track is None:
         raise HTTPException(status_code=404, detail="트랙을 찾을 수 없습니다")
     return db_track
 
 
 @router.patch("/{track_id}", response_model=schemas.Track)
-def update_track(
+async def update_track(
     track_id: int,
     track_update: schemas.TrackUpdate,
     current_user: dict = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     트랙 정보를 업데이트합니다.
     트랙 소유자만 수정 가능합니다.
     """
     # 트랙 조회
-    db_track = crud.get_track(db, track_id=track_id)
+    db_track = await async_crud.get_track_cached(db, track_id=track_id)
     if not db_track:
         raise HTTPException(status_code=404, detail="트랙을 찾을 수 없습니다")
     
@@ -238,7 +263,7 @@ def update_track(
         raise HTTPException(status_code=403, detail="이 트랙을 수정할 권한이 없습니다")
     
     # 업데이트 수행
-    updated_track = crud.update_track(db, track_id=track_id, track_update=track_update)
+    updated_track = await async_crud.update_track(db, track_id=track_id, track_update=track_update)
     return updated_track
 
 
@@ -249,7 +274,7 @@ async def upload_track_local(
     artist_name: str = Form(...),
     description: str = Form(None),
     current_user: dict = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     로컬 파일 업로드 (테스트용).
@@ -291,7 +316,7 @@ async def upload_track_local(
         description=description
     )
     
-    db_track = crud.create_track(db, track=track_data, owner_id=current_user["db_user_id"])
+    db_track = await async_crud.create_track(db, track=track_data, owner_id=current_user["db_user_id"])
     
     return db_track
 
@@ -302,7 +327,7 @@ async def upload_track_test(
     title: str = Form(...),
     artist_name: str = Form(...),
     description: str = Form(None),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     테스트용 파일 업로드 (인증 불필요).
@@ -336,13 +361,11 @@ async def upload_track_test(
     file_url = f"/uploads/tracks/{unique_filename}"
     
     # 테스트용 사용자 생성 또는 가져오기
-    test_user = crud.get_user_profile_by_user_id(db, "test_user")
-    if not test_user:
-        test_user_data = schemas.UserProfileCreate(
-            user_id="test_user",
-            nickname="테스트 사용자"
-        )
-        test_user = crud.create_user_profile(db, test_user_data)
+    test_user_data = schemas.UserProfileCreate(
+        user_id="test_user",
+        nickname="테스트 사용자"
+    )
+    test_user = await async_crud.get_or_create_user_profile(db, test_user_data)
     
     # 트랙 생성
     track_data = schemas.TrackCreate(
@@ -352,7 +375,7 @@ async def upload_track_test(
         description=description
     )
     
-    db_track = crud.create_track(db, track=track_data, owner_id=test_user.id)
+    db_track = await async_crud.create_track(db, track=track_data, owner_id=test_user.id)
     
     return db_track
 
@@ -361,12 +384,30 @@ async def upload_track_test(
 
 
 @router.get("/", response_model=List[schemas.Track])
-def read_tracks(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+async def read_tracks(
+    response: Response,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    tags: Optional[str] = Query(None, max_length=500),
+    match: Literal["all", "any"] = "all",
+    db: AsyncSession = Depends(get_async_db)
+):
     """
-    트랙 목록을 조회합니다.
+    트랙 목록을 조회합니다 (최신순).
+    다음 페이지가 있으면 X-Next-Cursor 헤더로 커서를 반환하며, 이를 cursor로 넘기면
+    이어서 조회합니다.
+    tags(쉼표로 구분)를 주면 태그가 모두(match=all) 또는 하나 이상(match=any) 붙은 트랙만
+    반환하며, 이때는 skip/limit으로 페이지를 나눕니다.
     공개 엔드포인트 (인증 불필요).
     """
-    tracks = crud.get_tracks(db, skip=skip, limit=limit)
+    if tags is not None:
+        return await async_crud.get_tracks_by_tags(
+            db, tags.split(","), match_all=match == "all", skip=skip, limit=limit
+        )
+    tracks, next_cursor = await async_crud.get_tracks(db, skip=skip, limit=limit, cursor=decode_cursor(cursor))
+    if next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(next_cursor)
     return tracks
 
 
@@ -374,7 +415,7 @@ def read_tracks(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
 async def stream_track(
     track_id: int,
     current_user: dict = Depends(get_optional_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     트랙을 스트리밍합니다 (Proxy Streaming).
@@ -382,7 +423,7 @@ async def stream_track(
     공개 엔드포인트이지만, 인증된 사용자는 재생 기록이 저장됩니다.
     """
     # 트랙 조회
-    track = crud.get_track(db, track_id=track_id)
+    track = await async_crud.get_track_cached(db, track_id=track_id)
     if not track:
         raise ResourceNotFoundError("트랙")
     
@@ -417,7 +458,7 @@ async def stream_track(
     # 인증된 사용자의 경우 재생 기록 저장
     if current_user:
         try:
-            crud.create_play_history(db, user_id=current_user["db_user_id"], track_id=track_id)
+            await async_crud.create_play_history(db, user_id=current_user["db_user_id"], track_id=track_id)
         except Exception as e:
             # 재생 기록 저장 실패해도 스트리밍은 계속
             print(f"재생 기록 저장 실패: {e}")
@@ -1,8 +1,8 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.schemas import schemas
-from app.crud import crud
-from app.db.database import get_db
+from app.crud import async_crud
+from app.db.database import get_async_db
 from app.api.dependencies import get_current_active_user
 
 router = APIRouter()
@@ -23,44 +23,41 @@ async def read_current_user(
 async def update_current_user(
     user_update: schemas.UserProfileUpdate,
     current_user: dict = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     현재 로그인한 사용자의 프로필을 수정합니다.
     인증 필요.
     """
-    db_user = current_user["db_user"]
+    # current_user["db_user"]는 캐시된 프로필이므로 수정할 ORM 객체를 다시 조회
+    db_user = await async_crud.get_user_profile(db, user_id=current_user["db_user_id"])
     
-    # 업데이트할 필드만 적용
+    # 업데이트할 필드만 적용 (프로필 캐시는 crud에서 무효화)
     update_data = user_update.dict(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_user, field, value)
-    
-    db.commit()
-    db.refresh(db_user)
+    db_user = await async_crud.update_user_profile(db, db_user=db_user, update_data=update_data)
     
     return db_user
 
 
 @router.get("/{user_id}", response_model=schemas.UserProfile)
-def read_user_profile(user_id: int, db: Session = Depends(get_db)):
+async def read_user_profile(user_id: int, db: AsyncSession = Depends(get_async_db)):
     """
     특정 사용자의 프로필을 조회합니다.
     공개 엔드포인트 (인증 불필요).
     """
-    db_user = crud.get_user_profile(db, user_id=user_id)
+    db_user = await async_crud.get_user_profile_cached(db, user_id=user_id)
     if db_user is None:
         raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다")
     return db_user
 
 
 @router.post("/", response_model=schemas.UserProfile)
-def create_user_profile(user: schemas.UserProfileCreate, db: Session = Depends(get_db)):
+async def create_user_profile(user: schemas.UserProfileCreate, db: AsyncSession = Depends(get_async_db)):
     """
     사용자 프로필을 생성합니다.
     (주의: 실제로는 JWT 검증 시 자동 생성되므로 이 엔드포인트는 테스트/관리용)
     """
-    db_user = crud.get_user_profile_by_user_id(db, user_id=user.user_id)
+    db_user = await async_crud.get_user_profile_by_user_id(db, user_id=user.user_id)
     if db_user:
         raise HTTPException(status_code=400, detail="이미 등록된 사용자입니다")
-    return crud.create_user_profile(db=db, user=user)
+    return await async_crud.create_user_profile(db=db, user=user)
@@ -0,0 +1,415 @@
+"""
+검색창 자동완성용 프로세스 내 접두어 인덱스
+
+트랙 제목, 아티스트 이름, 태그 이름을 정규화한 키의 정렬 배열에 보관하고,
+입력한 접두어의 범위를 이진 탐색으로 찾아 DB 조회 없이 추천어를 반환합니다.
+  - 정규화: NFC, 대소문자 무시, 특수문자 제거 후 단어 사이 공백 하나
+  - 한글: 음절을 자모로 분해한 키로 비교하므로 입력 중인 글자도 일치
+    ("갈" -> "가래", "과" -> "과일")하고, 초성만 입력해도 검색 ("ㅅㄹ" -> "사랑")
+  - 단어 시작마다 키를 만들어 중간 단어로도 검색 ("walk" -> "Moonlit Walk")
+  - 순위: 짧은 접두어(키 앞 _RANKED_PREFIX_LENGTH 글자)마다 추천어를 인기순으로 유지해,
+    범위가 넓은 한두 글자 입력도 범위 전체를 훑지 않고 정확한 상위 추천어를 반환
+
+갱신/재구성 방식은 track_index.TrackIndex 참고
+"""
+import bisect
+import heapq
+import re
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from app.core.track_index import TrackIndex, TrackTerms
+
+CHOSUNG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+JUNGSUNG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+JONGSUNG = [
+    "", "ㄱ", "ㄲ", "ㄳ", "ㄴ", "ㄵ", "ㄶ", "ㄷ", "ㄹ", "ㄺ", "ㄻ", "ㄼ", "ㄽ", "ㄾ",
+    "ㄿ", "ㅀ", "ㅁ", "ㅂ", "ㅄ", "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ",
+]
+_HANGUL_BASE = 0xAC00
+_HANGUL_COUNT = 11172
+# 겹받침/이중모음은 입력 순서대로 나눔 ("닭"을 치는 중인 "달ㄱ"도 일치하도록)
+_SPLIT_COMPOUND = str.maketrans({
+    "ㄳ": "ㄱㅅ", "ㄵ": "ㄴㅈ", "ㄶ": "ㄴㅎ", "ㄺ": "ㄹㄱ", "ㄻ": "ㄹㅁ", "ㄼ": "ㄹㅂ",
+    "ㄽ": "ㄹㅅ", "ㄾ": "ㄹㅌ", "ㄿ": "ㄹㅍ", "ㅀ": "ㄹㅎ", "ㅄ": "ㅂㅅ",
+    "ㅘ": "ㅗㅏ", "ㅙ": "ㅗㅐ", "ㅚ": "ㅗㅣ", "ㅝ": "ㅜㅓ", "ㅞ": "ㅜㅔ", "ㅟ": "ㅜㅣ", "ㅢ": "ㅡㅣ",
+})
+_CHOSUNG_QUERY = set(CHOSUNG) | {" "}
+_MAX_CHAR = chr(0x10FFFF)
+_WORD = re.compile(r"\w+")
+
+# 추천어 종류 (동점이면 이 순서로)
+KINDS = ("track", "artist", "tag")
+_KIND_ORDER = {kind: i for i, kind in enumerate(KINDS)}
+# 인기순 추천어 목록을 유지하는 접두어 최대 길이 (자모/초성 키 기준)
+_RANKED_PREFIX_LENGTH = 3
+# 긴 접두어에서 범위를 직접 훑는 최대 키 수 (넘으면 짧은 접두어의 인기순 목록에서 찾음)
+_MAX_SCAN = 500
+# 접두어별 결과 캐시 크기 (인덱스가 바뀌면 비움)
+_RESULT_CACHE_SIZE = 10000
+
+def normalize(text: str) -> str:
+    """NFC, 대소문자 무시, 단어 사이 공백 하나로 정규화"""
+    return " ".join(_WORD.findall(unicodedata.normalize("NFC", text).casefold()))
+
+
+def decompose_jamo(text: str) -> str:
+    """한글 음절을 자모로 분해합니다 ("과일" -> "ㄱㅗㅏㅇㅣㄹ")."""
+    out = []
+    for char in text:
+        code = ord(char) - _HANGUL_BASE
+        if 0 <= code < _HANGUL_COUNT:
+            out.append(CHOSUNG[code // 588] + JUNGSUNG[code % 588 // 28] + JONGSUNG[code % 28])
+        else:
+            out.append(char)
+    return "".join(out).translate(_SPLIT_COMPOUND)
+
+
+def initials(text: str) -> str:
+    """한글 음절을 초성으로 바꿉니다 ("사랑 노래" -> "ㅅㄹ ㄴㄹ")."""
+    out = []
+    for char in text:
+        code = ord(char) - _HANGUL_BASE
+        out.append(CHOSUNG[code // 588] if 0 <= code < _HANGUL_COUNT else char)
+    return "".join(out)
+
+
+def _word_starts(key: str) -> List[str]:
+    """단어 시작 위치마다의 키 ("a b c" -> ["a b c", "b c", "c"])"""
+    words = key.split(" ")
+    return [" ".join(words[i:]) for i in range(len(words))]
+
+
+class _SortedKeys:
+    """
+    (키, 추천어 id) 정렬 배열
+
+    키 앞 _RANKED_PREFIX_LENGTH 글자까지의 접두어마다 그 접두어로 시작하는 추천어를
+    (순위, 추천어 id) 정렬 배열로 유지합니다. 순위는 rank(추천어 id)이며, 추천어의
+    인기가 바뀌면 rerank()로 옮깁니다.
+    """
+
+    def __init__(self, rank: Callable[[int], tuple]):
+        self._entries: List[Tuple[str, int]] = []
+        self._rank = rank
+        # 추천어 id -> 이 배열에 있는 키 목록 / 인기순 배열에 들어 있는 순위
+        self._term_keys: Dict[int, List[str]] = {}
+        self._ranks: Dict[int, tuple] = {}
+        # 짧은 접두어 -> 그 접두어로 시작하는 키가 있는 추천어의 (순위, 추천어 id) 정렬 배열
+        self._ranked: Dict[str, List[Tuple[tuple, int]]] = {}
+        # 전체 재구성 중에는 정렬하지 않고 모은 뒤 한 번에 정렬
+        self.bulk = False
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _short_prefixes(key: str) -> List[str]:
+        return [key[:end] for end in range(1, _RANKED_PREFIX_LENGTH + 1) if end <= len(key)]
+
+    def _term_prefixes(self, term_id: int) -> Set[str]:
+        return {p for key in self._term_keys.get(term_id, ()) for p in self._short_prefixes(key)}
+
+    def add(self, key: str, term_id: int) -> None:
+        if self.bulk:
+            self._term_keys.setdefault(term_id, []).append(key)
+            self._entries.append((key, term_id))
+            return
+        # 추천어의 다른 키가 이미 같은 접두어로 시작하면 인기순 배열에는 이미 있음
+        before = self._term_prefixes(term_id)
+        self._term_keys.setdefault(term_id, []).append(key)
+        bisect.insort(self._entries, (key, term_id))
+        rank = self._ranks.setdefault(term_id, self._rank(term_id))
+        for prefix in self._short_prefixes(key):
+            if prefix not in before:
+                bisect.insort(self._ranked.setdefault(prefix, []), (rank, term_id))
+
+    def finish_bulk(self) -> None:
+        self._entries.sort()
+        self._ranks = {term_id: self._rank(term_id) for term_id in self._term_keys}
+        # 전체를 인기순으로 한 번 정렬한 뒤 차례로 접두어별 배열에 넣으면 배열마다 정렬할 필요 없음
+        self._ranked = {}
+        for term_id in sorted(self._ranks, key=self._ranks.__getitem__):
+            entry = (self._ranks[term_id], term_id)
+            for prefix in self._term_prefixes(term_id):
+                self._ranked.setdefault(prefix, []).append(entry)
+        self.bulk = False
+
+    def _unrank(self, prefix: str, term_id: int) -> None:
+        ranked = self._ranked[prefix]
+        i = bisect.bisect_left(ranked, (self._ranks[term_id], term_id))
+        if i < len(ranked) and ranked[i][1] == term_id:
+            del ranked[i]
+        if not ranked:
+            del self._ranked[prefix]
+
+    def remove(self, key: str, term_id: int) -> None:
+        i = bisect.bisect_left(self._entries, (key, term_id))
+        if i < len(self._entries) and self._entries[i] == (key, term_id):
+            del self._entries[i]
+        keys = self._term_keys[term_id]
+        keys.remove(key)
+        remaining = self._term_prefixes(term_id)
+        for prefix in self._short_prefixes(key):
+            if prefix not in remaining:
+                self._unrank(prefix, term_id)
+        if not keys:
+            del self._term_keys[term_id]
+            del self._ranks[term_id]
+
+    def rerank(self, term_id: int) -> None:
+        """추천어의 인기가 바뀌었을 때 인기순 배열에서 위치를 옮깁니다."""
+        if self.bulk or term_id not in self._ranks:
+            return
+        rank = self._rank(term_id)
+        if rank == self._ranks[term_id]:
+            return
+        prefixes = self._term_prefixes(term_id)
+        for prefix in prefixes:
+            self._unrank(prefix, term_id)
+        self._ranks[term_id] = rank
+        for prefix in prefixes:
+            bisect.insort(self._ranked.setdefault(prefix, []), (rank, term_id))
+
+    def top_ids(self, prefix: str, limit: int) -> List[int]:
+        """접두어로 시작하는 키의 추천어 id를 인기순으로 최대 limit개"""
+        if len(prefix) <= _RANKED_PREFIX_LENGTH:
+            return [term_id for _, term_id in self._ranked.get(prefix, ())[:limit]]
+
+        start = bisect.bisect_left(self._entries, (prefix,))
+        end = bisect.bisect_left(self._entries, (prefix + _MAX_CHAR,), start)
+        if end - start <= _MAX_SCAN:
+            ids = {term_id for _, term_id in self._entries[start:end]}
+            return sorted(ids, key=lambda term_id: (self._ranks[term_id], term_id))[:limit]
+
+        # 범위가 넓은 긴 접두어: 앞부분 접두어의 인기순 배열에서 일치하는 추천어를 차례로 찾음
+        found = []
+        for _, term_id in self._ranked.get(prefix[:_RANKED_PREFIX_LENGTH], ()):
+            if any(key.startswith(prefix) for key in self._term_keys[term_id]):
+                found.append(term_id)
+                if len(found) == limit:
+                    break
+        return found
+
+
+class _Term:
+    __slots__ = ("kind", "text", "count", "keys", "tiebreak")
+
+    def __init__(self, kind: str, text: str, keys: List[Tuple[_SortedKeys, str]]):
+        self.kind = kind
+        self.text = text  # 처음 등록된 원래 표기
+        self.count = 0  # 이 추천어를 가진 트랙 수 (인기순 정렬)
+        self.keys = keys
+        # 인기가 같으면 종류 순, 짧은 추천어 먼저
+        self.tiebreak = (_KIND_ORDER[kind], len(text), text)
+
+
+class _IndexState:
+    """정렬 배열과 추천어/트랙 매핑 (재구성 시 새로 만들어 통째로 교체)"""
+
+    def __init__(self):
+        self.jamo_keys = _SortedKeys(self._rank)
+        self.initial_keys = _SortedKeys(self._rank)
+        self.terms: Dict[int, _Term] = {}
+        self.term_ids: Dict[Tuple[str, str], int] = {}
+        self.next_term_id = 0
+        # 트랙 id -> {"title", "artist_name", "tags"} 및 추천어 id 집합
+        self.track_fields: Dict[int, Dict[str, Any]] = {}
+        self.track_terms: Dict[int, Set[int]] = {}
+
+    def _rank(self, term_id: int) -> tuple:
+        """인기순 정렬 키 (트랙 수가 많을수록, 동점이면 tiebreak 순으로 앞)"""
+        term = self.terms[term_id]
+        return (-term.count, *term.tiebreak)
+
+    def _rerank(self, term_id: int) -> None:
+        self.jamo_keys.rerank(term_id)
+        self.initial_keys.rerank(term_id)
+
+    def _acquire(self, kind: str, text: str) -> Optional[int]:
+        key = normalize(text)
+        if not key:
+            return None
+        term_id = self.term_ids.get((kind, key))
+        if term_id is not None:
+            term = self.terms[term_id]
+            term.count += 1
+            self._rerank(term_id)
+            return term_id
+
+        term_id = self.next_term_id
+        self.next_term_id += 1
+        keys = [(self.jamo_keys, k) for k in _word_starts(decompose_jamo(key))]
+        if initials(key) != key:
+            keys += [(self.initial_keys, k) for k in _word_starts(initials(key))]
+        term = self.terms[term_id] = _Term(kind, text.strip(), keys)
+        term.count = 1
+        self.term_ids[(kind, key)] = term_id
+        for sorted_keys, k in keys:
+            sorted_keys.add(k, term_id)
+        return term_id
+
+    def _release(self, term_id: int) -> None:
+        term = self.terms[term_id]
+        term.count -= 1
+        if term.count > 0:
+            self._rerank(term_id)
+            return
+        for sorted_keys, k in term.keys:
+            sorted_keys.remove(k, term_id)
+        del self.terms[term_id]
+        del self.term_ids[(term.kind, normalize(term.text))]
+
+    def update_track(
+        self,
+        track_id: int,
+        title: Optional[str],
+        artist_name: Optional[str],
+        tags: Optional[Iterable[str]],
+    ) -> List[str]:
+        """트랙의 추천어를 갱신하고, 순위가 바뀔 수 있는 추천어의 키를 반환합니다."""
+        fields = self.track_fields.setdefault(track_id, {"title": None, "artist_name": None, "tags": ()})
+        if title is not None:
+            fields["title"] = title
+        if artist_name is not None:
+            fields["artist_name"] = artist_name
+        if tags is not None:
+            fields["tags"] = tuple(tags)
+
+        old_terms = self.track_terms.get(track_id, set())
+        new_terms: Set[int] = set()
+        for kind, texts in (
+            ("track", [fields["title"]]),
+            ("artist", [fields["artist_name"]]),
+            ("tag", fields["tags"]),
+        ):
+            for text in texts:
+                if text and (term_id := self._acquire(kind, text)) is not None:
+                    new_terms.add(term_id)
+        self.track_terms[track_id] = new_terms
+        return self._release_all(old_terms, keep=new_terms) + self._keys_of(new_terms - old_terms)
+
+    def remove_track(self, track_id: int) -> List[str]:
+        self.track_fields.pop(track_id, None)
+        return self._release_all(self.track_terms.pop(track_id, set()))
+
+    def _keys_of(self, term_ids: Iterable[int]) -> List[str]:
+        return [k for term_id in term_ids for _, k in self.terms[term_id].keys]
+
+    def _release_all(self, term_ids: Set[int], keep: Set[int] = frozenset()) -> List[str]:
+        # 새로 얻은 추천어는 참조 수가 그대로이므로 키도 그대로
+        changed = self._keys_of(term_ids - keep)
+        for term_id in term_ids:
+            self._release(term_id)
+        return changed
+
+    def search(self, query: str, limit: int) -> List[Dict[str, Any]]:
+        # 키 배열마다 상위 limit개를 모은 뒤 합쳐서 다시 상위 limit개
+        term_ids: Set[int] = set()
+        if query:
+            if set(query) <= _CHOSUNG_QUERY:
+                term_ids.update(self.initial_keys.top_ids(query, limit))
+            term_ids.update(self.jamo_keys.top_ids(decompose_jamo(query), limit))
+
+        terms = heapq.nsmallest(
+            limit,
+            (self.terms[term_id] for term_id in term_ids),
+            key=lambda t: (-t.count, t.tiebreak),
+        )
+        return [{"text": t.text, "type": t.kind} for t in terms]
+
+
+def _build_state(rows: Iterable[TrackTerms]) -> _IndexState:
+    """전체 추천어로 새 인덱스를 만듭니다 (키를 모은 뒤 한 번에 정렬)."""
+    state = _IndexState()
+    state.jamo_keys.bulk = state.initial_keys.bulk = True
+    for track_id, title, artist_name, tags in rows:
+        state.update_track(track_id, title, artist_name, tags)
+    state.jamo_keys.finish_bulk()
+    state.initial_keys.finish_bulk()
+    return state
+
+
+class AutocompleteIndex(TrackIndex):
+    """
+    트랙 제목/아티스트/태그 접두어 인덱스
+
+    같은 입력이 반복되는 경우가 많으므로 접두어별 결과를 캐싱하고, 추천어가 바뀌면
+    그 키의 접두어에 해당하는 결과만 지웁니다.
+    """
+
+    name = "자동완성"
+
+    def __init__(self):
+        super().__init__()
+        self._state = _IndexState()
+        # 자모 분해한 검색어 -> {limit: 결과}
+        self._results: "OrderedDict[str, Dict[int, List[Dict[str, Any]]]]" = OrderedDict()
+        self.lookups = 0
+        self.result_cache_hits = 0
+        self.lookup_time = 0.0
+
+    def _forget_results(self, keys: Iterable[str]) -> None:
+        """바뀐 키의 모든 접두어에 대한 캐시된 결과 제거"""
+        for key in keys:
+            for end in range(1, len(key) + 1):
+                self._results.pop(key[:end], None)
+
+    def _build(self, rows: Iterable[TrackTerms]) -> _IndexState:
+        return _build_state(rows)
+
+    def _install(self, state: _IndexState) -> None:
+        self._state = state
+        self._results.clear()
+
+    def _update(
+        self,
+        track_id: int,
+        title: Optional[str],
+        artist_name: Optional[str],
+        tags: Optional[Iterable[str]],
+    ) -> None:
+        # 이전 추천어와 비교해 바뀐 키만 정렬 배열에 추가/삭제
+        self._forget_results(self._state.update_track(track_id, title, artist_name, tags))
+
+    def _remove(self, track_id: int) -> None:
+        self._forget_results(self._state.remove_track(track_id))
+
+    def suggest(self, prefix: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        접두어와 일치하는 추천어를 인기순(같은 추천어를 가진 트랙 수)으로 반환합니다.
+        초성으로만 이루어진 입력은 초성 키에서도 찾습니다.
+        """
+        start = time.perf_counter()
+        query = normalize(prefix)
+        cache_key = decompose_jamo(query)
+        by_limit = self._results.get(cache_key)
+        results = by_limit.get(limit) if by_limit is not None else None
+        if results is None:
+            results = self._state.search(query, limit)
+            self._results.setdefault(cache_key, {})[limit] = results
+            while len(self._results) > _RESULT_CACHE_SIZE:
+                self._results.popitem(last=False)
+        else:
+            self.result_cache_hits += 1
+        self._results.move_to_end(cache_key)
+        self.lookups += 1
+        self.lookup_time += time.perf_counter() - start
+        return list(results)
+
+    def stats(self) -> Dict[str, Any]:
+        state = self._state
+        return {
+            "tracks": len(state.track_terms),
+            "terms": len(state.terms),
+            "keys": len(state.jamo_keys) + len(state.initial_keys),
+            "lookups": self.lookups,
+            "result_cache_hits": self.result_cache_hits,
+            "avg_lookup_us": round(self.lookup_time / self.lookups * 1e6, 1) if self.lookups else 0.0,
+            "refreshed_at": self.refreshed_at,
+        }
+
+
+autocomplete_index = AutocompleteIndex()
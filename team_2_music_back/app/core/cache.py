@@ -0,0 +1,451 @@
+"""
+2단계 캐시 레이어 (프로세스 내 LRU + Redis)
+
+조회가 많은 데이터(트랙, 사용자 프로필, 플레이리스트 등)를 먼저 프로세스 메모리에서
+찾고, 없으면 Redis, 그래도 없으면 호출자가 DB에서 읽어 채웁니다.
+데이터가 바뀌면 invalidate()가 Redis 키를 지우고 pub/sub으로 무효화 메시지를
+발행하여, 모든 uvicorn 워커가 자신의 로컬 캐시에서 해당 키를 제거합니다.
+
+CRUD 조회 함수는 @cached 데코레이터로 캐싱하고, 각 항목에 태그(예: track:1)를
+붙입니다. 쓰기 함수는 invalidate_tags()로 태그에 속한 키를 한 번에 제거합니다.
+"""
+import asyncio
+import functools
+import inspect
+import json
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from pydantic import TypeAdapter
+from redis.exceptions import RedisError
+
+from app.core.config import settings
+from app.core.redis_client import (
+    get_redis_client,
+    redis_breaker,
+    cache_get,
+    cache_set,
+    cache_delete,
+    cache_get_many,
+    cache_set_many,
+    cache_publish,
+    cache_set_add,
+    cache_set_add_members,
+    cache_set_pop_all,
+    cache_get_or_compute,
+)
+
+# 무효화 메시지 채널
+INVALIDATION_CHANNEL = "cache:invalidate"
+# 태그에 속한 캐시 키 집합 (Redis SET)
+TAG_KEY = "tag:{tag}"
+
+
+class LocalLRUCache:
+    """크기와 TTL로 제한되는 프로세스 내 LRU 캐시"""
+
+    def __init__(self, max_size: int, ttl: float, on_remove: Optional[Callable[[str], None]] = None):
+        self.max_size = max_size
+        self.ttl = ttl
+        # 항목이 만료/축출/삭제될 때 호출 (태그 인덱스 정리용)
+        self.on_remove = on_remove
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+
+    def _removed(self, key: str) -> None:
+        if self.on_remove is not None:
+            self.on_remove(key)
+
+    def get(self, key: str) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            self._removed(key)
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        self._entries[key] = (time.monotonic() + (ttl if ttl is not None else self.ttl), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            evicted, _ = self._entries.popitem(last=False)
+            self._removed(evicted)
+
+    def delete(self, key: str) -> None:
+        if self._entries.pop(key, None) is not None:
+            self._removed(key)
+
+    def clear(self) -> None:
+        keys = list(self._entries)
+        self._entries.clear()
+        for key in keys:
+            self._removed(key)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class TwoTierCache:
+    """
+    로컬 LRU + Redis 2단계 캐시
+
+    값은 JSON 직렬화 가능한 형태(예: 스키마의 model_dump(mode="json"))로 저장합니다.
+    로컬 TTL은 Redis TTL보다 짧게 두어, pub/sub 메시지를 놓친 경우에도
+    다른 워커의 오래된 값이 로컬 TTL 이상 남지 않도록 합니다.
+    """
+
+    def __init__(self, local_max_size: int, local_ttl: float, default_ttl: int):
+        self.local = LocalLRUCache(local_max_size, local_ttl, on_remove=self._unindex)
+        self.default_ttl = default_ttl
+        # 로컬 태그 인덱스 (태그 -> 키, 키 -> 태그)
+        self._tag_keys: Dict[str, Set[str]] = {}
+        self._key_tags: Dict[str, Tuple[str, ...]] = {}
+        # 자신이 보낸 무효화 메시지를 구분하기 위한 인스턴스 ID
+        self.instance_id = uuid.uuid4().hex
+        self.local_hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+        self._listener_task: Optional[asyncio.Task] = None
+
+    async def get(self, key: str) -> Optional[Any]:
+        """로컬 -> Redis 순서로 값을 찾습니다. 없으면 None."""
+        value = self.local.get(key)
+        if value is not None:
+            self.local_hits += 1
+            return value
+
+        value = await cache_get(key)
+        if value is not None:
+            self.redis_hits += 1
+            self.local.set(key, value)
+            return value
+
+        self.misses += 1
+        return None
+
+    async def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """여러 키를 로컬에서 찾고, 나머지는 Redis MGET 한 번으로 가져옵니다."""
+        found: Dict[str, Any] = {}
+        missing: List[str] = []
+        for key in keys:
+            value = self.local.get(key)
+            if value is not None:
+                self.local_hits += 1
+                found[key] = value
+            else:
+                missing.append(key)
+
+        if missing:
+            from_redis = await cache_get_many(missing)
+            for key, value in from_redis.items():
+                self.local.set(key, value)
+            self.redis_hits += len(from_redis)
+            self.misses += len(missing) - len(from_redis)
+            found.update(from_redis)
+        return found
+
+    def _index(self, key: str, tags: Tuple[str, ...]) -> None:
+        self._unindex(key)
+        if not tags:
+            return
+        self._key_tags[key] = tags
+        for tag in tags:
+            self._tag_keys.setdefault(tag, set()).add(key)
+
+    def _unindex(self, key: str) -> None:
+        for tag in self._key_tags.pop(key, ()):
+            keys = self._tag_keys.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tag_keys[tag]
+
+    def _drop_local_tags(self, tags: Iterable[str]) -> Set[str]:
+        """태그에 속한 로컬 항목을 제거하고, 제거한 키를 반환합니다."""
+        keys: Set[str] = set()
+        for tag in tags:
+            keys.update(self._tag_keys.get(tag, ()))
+        for key in keys:
+            self.local.delete(key)
+        return keys
+
+    async def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[int] = None,
+        tags: Iterable[str] = (),
+    ) -> None:
+        """
+        로컬과 Redis에 값을 저장합니다.
+        tags를 주면 invalidate_tags()로 함께 제거할 수 있도록 태그 인덱스에 기록합니다.
+        """
+        self.local.set(key, value)
+        await cache_set(key, value, ttl=ttl or self.default_ttl)
+        await self.add_tags(key, tags)
+
+    async def set_many(
+        self,
+        items: Dict[str, Any],
+        ttl: Optional[int] = None,
+        tags: Optional[Dict[str, Iterable[str]]] = None,
+    ) -> None:
+        """
+        여러 값을 로컬과 Redis에 저장합니다 (Redis 값 저장, 태그 인덱스 기록 각각 왕복 1회).
+        tags는 {키: 태그 목록}으로, 키마다 set()의 tags와 같은 의미입니다.
+        """
+        if not items:
+            return
+        for key, value in items.items():
+            self.local.set(key, value)
+        await cache_set_many(items, ttl=ttl or self.default_ttl)
+
+        members: Dict[str, List[str]] = {}
+        for key, key_tags in (tags or {}).items():
+            key_tags = tuple(dict.fromkeys(tag for tag in key_tags if tag))
+            self._index(key, key_tags)
+            for tag in key_tags:
+                members.setdefault(TAG_KEY.format(tag=tag), []).append(key)
+        await cache_set_add_members(members, ttl=settings.CACHE_TAG_TTL)
+
+    async def add_tags(self, key: str, tags: Iterable[str]) -> None:
+        """저장된 키를 태그 인덱스(로컬 + Redis 집합)에 기록합니다."""
+        tags = tuple(dict.fromkeys(tag for tag in tags if tag))
+        self._index(key, tags)
+        if tags:
+            await cache_set_add(
+                [TAG_KEY.format(tag=tag) for tag in tags], key, ttl=settings.CACHE_TAG_TTL
+            )
+
+    async def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+        ttl: Optional[int] = None,
+    ) -> Tuple[Any, bool]:
+        """
+        로컬 캐시를 먼저 보고, 없으면 스탬피드 방지 로직(조기 재계산, 재계산 락,
+        stale-while-revalidate)으로 Redis 값을 읽거나 compute()로 계산합니다.
+        인기 목록처럼 만료 순간에 요청이 몰리는 키에 사용합니다.
+
+        Returns:
+            (값, 이번 호출에서 계산했는지 여부)
+        """
+        value = self.local.get(key)
+        if value is not None:
+            self.local_hits += 1
+            return value, False
+
+        value, computed = await cache_get_or_compute(key, compute, ttl=ttl or self.default_ttl)
+        if computed:
+            self.misses += 1
+        else:
+            self.redis_hits += 1
+        if value is not None:
+            self.local.set(key, value)
+        return value, computed
+
+    async def invalidate(self, *keys: str) -> None:
+        """
+        키를 로컬/Redis에서 제거하고 다른 워커에도 무효화를 알립니다.
+        """
+        keys = [key for key in keys if key]
+        if not keys:
+            return
+        for key in keys:
+            self.local.delete(key)
+        await cache_delete(*keys)
+        await cache_publish(
+            INVALIDATION_CHANNEL,
+            json.dumps({"origin": self.instance_id, "keys": keys}),
+        )
+
+    async def invalidate_tags(self, *tags: str) -> None:
+        """
+        태그가 붙은 모든 캐시 항목을 로컬/Redis에서 제거하고 다른 워커에도 알립니다.
+        Redis의 태그 집합에는 모든 워커가 저장한 키가 모여 있으므로 그 키들을 지우고,
+        다른 워커는 메시지의 태그로 자신의 로컬 인덱스에서도 한 번 더 찾아 제거합니다.
+        """
+        tags = [tag for tag in dict.fromkeys(tags) if tag]
+        if not tags:
+            return
+        keys = self._drop_local_tags(tags)
+        keys |= await cache_set_pop_all(TAG_KEY.format(tag=tag) for tag in tags)
+        for key in keys:
+            self.local.delete(key)
+        if keys:
+            await cache_delete(*keys)
+        await cache_publish(
+            INVALIDATION_CHANNEL,
+            json.dumps({"origin": self.instance_id, "keys": sorted(keys), "tags": tags}),
+        )
+
+    def _handle_message(self, data: str) -> None:
+        try:
+            message = json.loads(data)
+        except (TypeError, json.JSONDecodeError):
+            return
+        if message.get("origin") == self.instance_id:
+            return
+        for key in message.get("keys", []):
+            self.local.delete(key)
+        self._drop_local_tags(message.get("tags", []))
+
+    async def _listen(self) -> None:
+        while True:
+            if not redis_breaker.allow():
+                # Redis 장애 중에는 메시지를 받을 수 없으므로 로컬 TTL에 맡김
+                await asyncio.sleep(settings.REDIS_BREAKER_PROBE_INTERVAL)
+                continue
+            pubsub = get_redis_client().pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.subscribe(INVALIDATION_CHANNEL)
+                # (재)구독 전에 놓친 무효화 메시지가 있을 수 있으므로 로컬 캐시를 비움
+                self.local.clear()
+                while True:
+                    message = await pubsub.get_message(timeout=1.0)
+                    if message and message.get("type") == "message":
+                        self._handle_message(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except (RedisError, OSError) as e:
+                print(f"캐시 무효화 구독 오류: {e}")
+                await asyncio.sleep(1.0)
+            finally:
+                try:
+                    await pubsub.aclose()
+                except Exception:
+                    pass
+
+    def start_invalidation_listener(self) -> None:
+        """pub/sub 무효화 메시지 구독을 시작합니다."""
+        if self._listener_task is None or self._listener_task.done():
+            self._listener_task = asyncio.create_task(self._listen())
+
+    async def stop_invalidation_listener(self) -> None:
+        if self._listener_task is not None:
+            self._listener_task.cancel()
+            try:
+                await self._listener_task
+            except asyncio.CancelledError:
+                pass
+            self._listener_task = None
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.local_hits + self.redis_hits + self.misses
+        return {
+            "local_size": len(self.local),
+            "local_tags": len(self._tag_keys),
+            "local_hits": self.local_hits,
+            "redis_hits": self.redis_hits,
+            "misses": self.misses,
+            "hit_rate": round((self.local_hits + self.redis_hits) / total, 4) if total else 0.0,
+        }
+
+
+cache = TwoTierCache(
+    local_max_size=settings.CACHE_LOCAL_MAX_SIZE,
+    local_ttl=settings.CACHE_LOCAL_TTL,
+    default_ttl=settings.CACHE_DEFAULT_TTL,
+)
+
+
+def _format_all(templates: Iterable[str], params: Dict[str, Any]) -> List[str]:
+    return [template.format(**params) for template in templates]
+
+
+def cached(
+    response_type: Any,
+    key: Optional[str] = None,
+    tags: Iterable[str] = (),
+    result_tags: Optional[Callable[[Any], Iterable[str]]] = None,
+    ttl: Optional[int] = None,
+    stampede: bool = False,
+):
+    """
+    비동기 CRUD 조회 함수의 결과를 2단계 캐시에 저장하는 데코레이터
+
+    결과는 response_type(예: schemas.Track, List[schemas.Comment])으로 변환하여
+    JSON 형태로 저장하고, 캐시 적중/미스와 관계없이 항상 스키마 인스턴스를 반환합니다.
+    None 결과(존재하지 않는 리소스)는 캐싱하지 않습니다.
+
+    Args:
+        response_type: 반환 타입 (pydantic TypeAdapter로 직렬화/검증)
+        key: 캐시 키 템플릿 (예: "track:{track_id}"), 생략 시 함수 이름과 인자로 생성
+        tags: 태그 템플릿 목록 (예: ["track:{track_id}"]), 함수 인자로 포맷
+        result_tags: 결과 값에서 추가 태그를 계산하는 함수
+            (예: 중첩된 작성자 정보가 바뀌면 무효화되도록 user:{id} 태그 부여)
+        ttl: Redis TTL (초), 생략 시 캐시 기본 TTL
+        stampede: True면 만료 시 스탬피드 방지 로직 사용 (인기 목록 등 요청이 몰리는 키)
+
+    사용 예:
+        @cached(schemas.Track, tags=["track:{track_id}"])
+        async def get_track_cached(db, track_id): ...
+    """
+    adapter = TypeAdapter(response_type)
+    tags = tuple(tags)
+
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        def cache_params(args, kwargs) -> Dict[str, Any]:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            # DB 세션은 키에 포함하지 않음
+            return {name: value for name, value in bound.arguments.items() if name != "db"}
+
+        def cache_key(params: Dict[str, Any]) -> str:
+            if key is not None:
+                return key.format(**params)
+            parts = ":".join(f"{name}={value}" for name, value in params.items())
+            return f"{func.__name__}:{parts}"
+
+        def item_tags(params: Dict[str, Any], value: Any) -> List[str]:
+            names = _format_all(tags, params)
+            if result_tags is not None:
+                names.extend(result_tags(value))
+            return names
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            params = cache_params(args, kwargs)
+            item_key = cache_key(params)
+
+            if stampede:
+                computed_value = None
+
+                async def compute():
+                    nonlocal computed_value
+                    result = await func(*args, **kwargs)
+                    if result is None:
+                        return None
+                    computed_value = adapter.validate_python(result, from_attributes=True)
+                    return adapter.dump_python(computed_value, mode="json")
+
+                data, computed = await cache.get_or_compute(item_key, compute, ttl=ttl)
+                if data is None:
+                    return None
+                if computed:
+                    await cache.add_tags(item_key, item_tags(params, computed_value))
+                    return computed_value
+                return adapter.validate_python(data)
+
+            data = await cache.get(item_key)
+            if data is not None:
+                return adapter.validate_python(data)
+
+            result = await func(*args, **kwargs)
+            if result is None:
+                return None
+            value = adapter.validate_python(result, from_attributes=True)
+            await cache.set(item_key, adapter.dump_python(value, mode="json"), ttl=ttl, tags=item_tags(params, value))
+            return value
+
+        return wrapper
+
+    return decorator
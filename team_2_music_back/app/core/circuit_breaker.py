@@ -0,0 +1,105 @@
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+
+class CircuitBreaker:
+    """
+    외부 의존성(Redis 등) 장애 시 빠르게 실패하기 위한 서킷 브레이커
+
+    - closed: 정상 상태, 모든 호출 허용
+    - open: 연속 실패가 failure_threshold에 도달하면 열림, 호출을 바로 건너뜀
+    - 열려 있는 동안 백그라운드에서 probe_interval마다 probe를 실행하고,
+      성공하면 다시 closed로 전환합니다.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int,
+        probe_interval: float,
+        probe: Optional[Callable[[], Awaitable[Any]]] = None,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.probe_interval = probe_interval
+        self.probe = probe
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self._probe_task: Optional[asyncio.Task] = None
+
+    def allow(self) -> bool:
+        """호출을 시도해도 되는지 여부 (open 상태면 False)"""
+        return self.state == self.CLOSED
+
+    def record_success(self) -> None:
+        self.consecutive_failures = 0
+
+    def record_failure(self, error: Optional[Exception] = None) -> None:
+        self.consecutive_failures += 1
+        if error is not None:
+            self.last_error = str(error)
+        if self.state == self.CLOSED and self.consecutive_failures >= self.failure_threshold:
+            self.trip()
+
+    def trip(self, error: Optional[Exception] = None) -> None:
+        """브레이커를 즉시 엽니다 (예: 시작 시 연결 실패)."""
+        if error is not None:
+            self.last_error = str(error)
+        if self.state != self.OPEN:
+            print(f"⚠️ {self.name} 서킷 브레이커 열림: {self.last_error}")
+        self.state = self.OPEN
+        self.opened_at = time.time()
+        self._start_probe()
+
+    def reset(self) -> None:
+        """브레이커를 닫습니다."""
+        if self.state == self.OPEN:
+            print(f"✅ {self.name} 서킷 브레이커 닫힘 (복구됨)")
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = None
+
+    def _start_probe(self) -> None:
+        if self.probe is None:
+            return
+        if self._probe_task is not None and not self._probe_task.done():
+            return
+        try:
+            self._probe_task = asyncio.get_running_loop().create_task(self._probe_loop())
+        except RuntimeError:
+            # 실행 중인 이벤트 루프가 없으면 probe 없이 open 상태 유지
+            self._probe_task = None
+
+    async def _probe_loop(self) -> None:
+        while self.state == self.OPEN:
+            await asyncio.sleep(self.probe_interval)
+            try:
+                await self.probe()
+            except Exception as e:
+                self.last_error = str(e)
+                continue
+            self.reset()
+
+    async def stop(self) -> None:
+        """백그라운드 probe 작업을 중지합니다."""
+        if self._probe_task is not None:
+            self._probe_task.cancel()
+            try:
+                await self._probe_task
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._probe_task = None
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "opened_at": self.opened_at,
+            "last_error": self.last_error,
+        }
@@ -0,0 +1,156 @@
+"""
+Redis 캐시 값 직렬화 코덱
+
+값은 [형식 1바이트][압축 1바이트][본문] 형태의 바이트로 저장합니다.
+  - 형식: j = JSON (orjson 또는 표준 json), m = msgpack
+  - 압축: n = 없음, z = zlib, l = lz4
+헤더로 형식을 판별하므로 CACHE_CODEC 설정을 바꿔도 기존 값을 그대로 읽을 수 있고,
+압축은 CACHE_COMPRESS_MIN_SIZE 이상인 큰 값(트랙 목록, 플레이리스트 등)에만 적용합니다.
+
+datetime/date/UUID/Enum/pydantic 모델은 JSON 호환 값(ISO 문자열 등)으로 저장되며,
+조회 측(@cached 데코레이터)에서 응답 스키마로 다시 검증할 때 원래 타입으로 복원됩니다.
+"""
+import json
+import zlib
+from datetime import date, datetime, time
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Callable, Dict, Tuple
+from uuid import UUID
+
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - 선택 의존성
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - 선택 의존성
+    msgpack = None
+
+try:
+    import lz4.frame as lz4_frame
+except ImportError:  # pragma: no cover - 선택 의존성
+    lz4_frame = None
+
+
+class CodecError(ValueError):
+    """캐시 값을 해석할 수 없을 때 발생"""
+
+
+def _default(value: Any) -> Any:
+    """기본 직렬화기가 처리하지 못하는 타입을 JSON 호환 값으로 변환"""
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (UUID, Decimal)):
+        return str(value)
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not serializable")
+
+
+def _json_dumps(value: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(value, default=_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(value, default=_default, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def _json_loads(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _msgpack_dumps(value: Any) -> bytes:
+    return msgpack.packb(value, default=_default, use_bin_type=True)
+
+
+def _msgpack_loads(data: bytes) -> Any:
+    return msgpack.unpackb(data, raw=False, strict_map_key=False)
+
+
+_FORMATS: Dict[bytes, Tuple[Callable[[Any], bytes], Callable[[bytes], Any]]] = {
+    b"j": (_json_dumps, _json_loads),
+}
+if msgpack is not None:
+    _FORMATS[b"m"] = (_msgpack_dumps, _msgpack_loads)
+
+_COMPRESSORS: Dict[bytes, Tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]] = {
+    b"z": (lambda data: zlib.compress(data, 1), zlib.decompress),
+}
+if lz4_frame is not None:
+    _COMPRESSORS[b"l"] = (lz4_frame.compress, lz4_frame.decompress)
+
+_NO_COMPRESSION = b"n"
+
+
+class CacheCodec:
+    """
+    캐시 값 인코더/디코더
+
+    Args:
+        serializer: "orjson", "json", "msgpack" 중 하나 (orjson/json은 같은 JSON 형식)
+        compression: "zlib", "lz4", "none" 중 하나
+        compress_min_size: 이 크기(바이트) 이상인 본문만 압축
+    """
+
+    def __init__(self, serializer: str = "orjson", compression: str = "zlib", compress_min_size: int = 1024):
+        if serializer == "msgpack" and msgpack is not None:
+            self.format = b"m"
+        else:
+            if serializer == "msgpack":
+                print("⚠️ msgpack이 설치되지 않아 JSON 코덱을 사용합니다")
+            self.format = b"j"
+
+        if compression == "lz4" and lz4_frame is None:
+            print("⚠️ lz4가 설치되지 않아 zlib 압축을 사용합니다")
+            compression = "zlib"
+        self.compression = {"zlib": b"z", "lz4": b"l"}.get(compression, _NO_COMPRESSION)
+        self.compress_min_size = compress_min_size
+
+    @property
+    def name(self) -> str:
+        return f"{self.format.decode()}{self.compression.decode()}"
+
+    def encode(self, value: Any) -> bytes:
+        """값을 헤더가 붙은 바이트로 변환합니다."""
+        dumps, _ = _FORMATS[self.format]
+        body = dumps(value)
+        compression = _NO_COMPRESSION
+        if self.compression != _NO_COMPRESSION and len(body) >= self.compress_min_size:
+            compress, _ = _COMPRESSORS[self.compression]
+            compressed = compress(body)
+            # 압축 효과가 없으면 원본 저장
+            if len(compressed) < len(body):
+                body = compressed
+                compression = self.compression
+        return self.format + compression + body
+
+    def decode(self, data: bytes) -> Any:
+        """encode()로 만든 바이트를 값으로 복원합니다."""
+        if isinstance(data, str):
+            data = data.encode()
+        if len(data) < 2:
+            raise CodecError("캐시 값 헤더가 없습니다")
+        fmt, compression, body = data[:1], data[1:2], data[2:]
+        if fmt not in _FORMATS:
+            raise CodecError(f"알 수 없는 직렬화 형식: {fmt!r}")
+        if compression != _NO_COMPRESSION:
+            if compression not in _COMPRESSORS:
+                raise CodecError(f"알 수 없는 압축 형식: {compression!r}")
+            _, decompress = _COMPRESSORS[compression]
+            try:
+                body = decompress(body)
+            except Exception as e:
+                raise CodecError(f"압축 해제 실패: {e}") from e
+        _, loads = _FORMATS[fmt]
+        try:
+            return loads(body)
+        except Exception as e:
+            raise CodecError(f"역직렬화 실패: {e}") from e
@@ -7,11 +7,62 @@ load_dotenv()
 class Settings(BaseSettings):
     # Database
     DATABASE_URL: str = os.getenv("DATABASE_URL", "sqlite:///./test.db")
-    
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", 10))  # 엔진별 상시 유지 커넥션 수
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", 20))  # 풀이 가득 찼을 때 추가로 여는 커넥션 수
+    DB_POOL_TIMEOUT: float = float(os.getenv("DB_POOL_TIMEOUT", 10.0))  # 커넥션 체크아웃 최대 대기 시간 (초)
+    DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", 1800))  # 이 시간(초)보다 오래된 커넥션은 다시 연결
+    DB_POOL_PRE_PING: bool = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"  # 체크아웃 시 끊긴 커넥션 감지
+    DB_STATEMENT_TIMEOUT_MS: int = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", 30000))  # Postgres statement_timeout (0이면 무제한)
+    SQLITE_JOURNAL_MODE: str = "WAL"  # 읽기와 쓰기가 서로를 막지 않도록 WAL 사용
+    SQLITE_SYNCHRONOUS: str = "NORMAL"  # WAL에서는 NORMAL로도 손상 없이 커밋 fsync를 줄일 수 있음
+    SQLITE_MMAP_SIZE: int = 256 * 1024 * 1024  # 메모리 매핑 읽기 크기 (바이트)
+    SQLITE_CACHE_SIZE_KB: int = 64 * 1024  # 연결별 페이지 캐시 크기 (KiB)
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000  # 다른 쓰기 작업의 락 해제를 기다리는 시간
+
     # Redis
     REDIS_HOST: str = os.getenv("REDIS_HOST", "localhost")
     REDIS_PORT: int = int(os.getenv("REDIS_PORT", 6379))
+    REDIS_MAX_CONNECTIONS: int = int(os.getenv("REDIS_MAX_CONNECTIONS", 50))  # 워커당 커넥션 풀 크기
+    REDIS_POOL_TIMEOUT: float = 1.0  # 풀이 가득 찼을 때 커넥션 대기 시간 (초)
+    REDIS_SOCKET_TIMEOUT: float = 5.0
+    REDIS_SOCKET_CONNECT_TIMEOUT: float = 1.0
+    REDIS_BREAKER_FAILURE_THRESHOLD: int = 3  # 연속 실패 시 서킷 브레이커 열림
+    REDIS_BREAKER_PROBE_INTERVAL: float = 5.0  # 열린 동안 복구 확인 주기 (초)
     REDIS_CACHE_TTL_JWKS: int = 3600  # 1시간
+    JWKS_REFRESH_MARGIN: int = 300  # 만료 5분 전에 백그라운드 갱신
+    JWKS_UNKNOWN_KID_COOLDOWN: int = 30  # 모르는 kid로 인한 재조회 최소 간격 (초)
+    VERIFIED_TOKEN_CACHE_SIZE: int = 10000  # 검증된 토큰 페이로드 LRU 최대 개수
+    PROFILE_CACHE_TTL: int = 300  # 사용자 프로필 Redis 캐시 (5분)
+    
+    # 2단계 캐시 (프로세스 내 LRU + Redis)
+    CACHE_LOCAL_MAX_SIZE: int = 10000  # 프로세스 내 LRU 최대 항목 수
+    CACHE_LOCAL_TTL: int = 30  # 프로세스 내 캐시 TTL (pub/sub 유실 시 최대 지연)
+    CACHE_DEFAULT_TTL: int = 300  # Redis 캐시 기본 TTL
+    CACHE_TTL_TRACK: int = 600
+    CACHE_TTL_PLAYLIST: int = 300
+    CACHE_TTL_LIST: int = 120  # 댓글/좋아요/팔로워/플레이리스트 트랙 목록
+    CACHE_TAG_TTL: int = 3600  # 태그 -> 키 인덱스 TTL (모든 캐시 TTL보다 길어야 함)
+    CACHE_KEY_VERSION: str = "v1"  # Redis 키 접두사 (값 형식/스키마 변경 시 올림)
+    CACHE_CODEC: str = os.getenv("CACHE_CODEC", "orjson")  # orjson | json | msgpack
+    CACHE_COMPRESSION: str = os.getenv("CACHE_COMPRESSION", "zlib")  # zlib | lz4 | none
+    CACHE_COMPRESS_MIN_SIZE: int = 1024  # 이 크기(바이트) 이상인 값만 압축
+    CACHE_STALE_TTL: int = 60  # 만료 후에도 재계산 중에는 이전 값을 응답하는 시간 (초)
+    CACHE_EARLY_RECOMPUTE_BETA: float = 1.0  # 확률적 조기 재계산 강도 (클수록 일찍 갱신)
+    CACHE_LOCK_TTL: int = 10  # 재계산 락(SET NX) 만료 시간 (초)
+    CACHE_LOCK_WAIT: float = 2.0  # 값이 없을 때 다른 워커의 재계산을 기다리는 최대 시간 (초)
+
+    # 프로세스 내 검색 인덱스 (자동완성 접두어 인덱스, 오타 허용 trigram 인덱스)
+    SEARCH_INDEX_REFRESH_INTERVAL: int = 300  # 다른 워커의 변경을 반영하는 전체 재구성 주기 (초)
+    AUTOCOMPLETE_MAX_LIMIT: int = 20  # 한 번에 반환하는 최대 추천어 수
+    SEARCH_FUZZY_THRESHOLD: float = 0.4  # 오타 허용 검색 최소 점수 (검색어 trigram 중 일치 비율)
+    SEARCH_FUZZY_MAX_CANDIDATES: int = 2000  # 오타 허용 검색에서 점수를 계산하는 최대 후보 수
+    SEARCH_CACHE_TTL: int = 60  # 검색 결과 트랙 id 목록 캐시 TTL (해당 단어의 트랙이 바뀌면 바로 삭제)
+
+    # 태그 필터 (Redis 태그별 트랙 id 집합)
+    TAG_POSTING_TTL: int = 3600  # 태그별 트랙 id 집합 TTL (만료되면 DB에서 다시 채움)
+    TAG_FILTER_TTL: int = 60  # 여러 태그의 교집합/합집합 결과 TTL (태그가 새로 붙으면 바로 삭제)
+    TAG_NAME_MAX_LENGTH: int = 50
+    TAG_MAX_PER_TRACK: int = 10
     
     # AWS S3
     AWS_ACCESS_KEY_ID: str = os.getenv("AWS_ACCESS_KEY_ID", "")
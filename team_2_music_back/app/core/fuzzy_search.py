@@ -0,0 +1,206 @@
+"""
+오타 허용 트랙 검색용 프로세스 내 trigram 역색인 (SQLite 등 pg_trgm이 없는 DB용)
+
+트랙 제목과 아티스트 이름을 pg_trgm과 같은 방식으로 단어별 trigram으로 나누고,
+trigram -> 트랙 id 정렬 배열(posting)로 보관합니다.
+  - 한글은 자모로 분해해 나누므로 받침/모음 하나 틀린 입력도 가깝게 일치 ("아이우" -> "아이유")
+  - 점수: 검색어 trigram 중 트랙에 있는 비율 (같으면 트랙 trigram이 적은 쪽, 최신 트랙 먼저)
+
+검색어 trigram을 트랙이 적은 순으로 정렬해, 점수 기준을 넘으려면 반드시 하나는 포함해야 하는
+앞쪽 trigram의 posting에서만 후보를 모으고, 나머지는 후보마다 포함 여부만 확인합니다.
+흔한 trigram만으로 이루어진 검색어는 후보를 SEARCH_FUZZY_MAX_CANDIDATES개(최신 트랙 우선)로
+제한하므로, 카탈로그 크기와 관계없이 검색 시간이 일정 범위를 넘지 않습니다.
+
+갱신/재구성 방식은 track_index.TrackIndex 참고
+"""
+import bisect
+import heapq
+import math
+import time
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from app.core.autocomplete import decompose_jamo, normalize
+from app.core.config import settings
+from app.core.track_index import TrackIndex, TrackTerms
+
+
+def trigrams(text: str) -> Set[str]:
+    """단어마다 앞에 공백 둘, 뒤에 공백 하나를 붙여 나눈 trigram 집합 (pg_trgm 방식)"""
+    grams = set()
+    for word in decompose_jamo(normalize(text)).split():
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def _hits(posting: array, track_ids: Dict[int, int], end: int) -> Iterable[int]:
+    """track_ids 중 posting[:end]에 있는 id (posting이 짧으면 훑고, 길면 id마다 이진 탐색)"""
+    if end < len(track_ids) * 8:
+        return [track_id for track_id in posting[:end] if track_id in track_ids]
+    hits = []
+    for track_id in track_ids:
+        i = bisect.bisect_left(posting, track_id, 0, end)
+        if i < end and posting[i] == track_id:
+            hits.append(track_id)
+    return hits
+
+
+class _TrigramState:
+    """trigram posting과 트랙별 필드 (재구성 시 새로 만들어 통째로 교체)"""
+
+    def __init__(self):
+        self.postings: Dict[str, array] = {}
+        # 트랙 id -> (제목, 아티스트 이름), trigram 수
+        self.track_fields: Dict[int, Tuple[Optional[str], Optional[str]]] = {}
+        self.gram_counts: Dict[int, int] = {}
+
+    def _grams_of(self, track_id: int) -> Set[str]:
+        title, artist_name = self.track_fields.get(track_id, (None, None))
+        return trigrams(title or "") | trigrams(artist_name or "")
+
+    def update_track(self, track_id: int, title: Optional[str], artist_name: Optional[str]) -> None:
+        old_grams = self._grams_of(track_id)
+        old_title, old_artist_name = self.track_fields.get(track_id, (None, None))
+        self.track_fields[track_id] = (
+            old_title if title is None else title,
+            old_artist_name if artist_name is None else artist_name,
+        )
+        new_grams = self._grams_of(track_id)
+        for gram in old_grams - new_grams:
+            self._discard(gram, track_id)
+        for gram in new_grams - old_grams:
+            posting = self.postings.setdefault(gram, array("I"))
+            i = bisect.bisect_left(posting, track_id)
+            if i == len(posting) or posting[i] != track_id:
+                posting.insert(i, track_id)
+        self.gram_counts[track_id] = len(new_grams)
+
+    def remove_track(self, track_id: int) -> None:
+        for gram in self._grams_of(track_id):
+            self._discard(gram, track_id)
+        self.track_fields.pop(track_id, None)
+        self.gram_counts.pop(track_id, None)
+
+    def _discard(self, gram: str, track_id: int) -> None:
+        posting = self.postings.get(gram)
+        if posting is None:
+            return
+        i = bisect.bisect_left(posting, track_id)
+        if i < len(posting) and posting[i] == track_id:
+            del posting[i]
+        if not posting:
+            del self.postings[gram]
+
+    def search(
+        self, query: str, threshold: float, max_candidates: int, limit: int
+    ) -> List[Tuple[int, float]]:
+        grams = trigrams(query)
+        if not grams:
+            return []
+        # 트랙이 적은 trigram부터
+        ordered = sorted(grams, key=lambda g: len(self.postings.get(g, ())))
+        needed = max(1, math.ceil(threshold * len(ordered)))
+        # 앞쪽 len - needed + 1개 중 하나도 없는 트랙은 needed개를 채울 수 없음
+        split = len(ordered) - needed + 1
+
+        counts: Dict[int, int] = {}
+        for gram in ordered[:split]:
+            posting = self.postings.get(gram, array("I"))
+            # 후보가 넘치면 최신 트랙(큰 id)부터 새 후보로 받고, 나머지는 기존 후보만 확인
+            cut = max(0, len(posting) - (max_candidates - len(counts)))
+            if cut:
+                for track_id in _hits(posting, counts, cut):
+                    counts[track_id] += 1
+            for track_id in posting[cut:]:
+                counts[track_id] = counts.get(track_id, 0) + 1
+
+        remaining = len(ordered) - split
+        for gram in ordered[split:]:
+            posting = self.postings.get(gram, array("I"))
+            remaining -= 1
+            for track_id in _hits(posting, counts, len(posting)):
+                counts[track_id] += 1
+            # 남은 trigram을 모두 포함해도 기준에 못 미치면 제외
+            counts = {
+                track_id: count for track_id, count in counts.items()
+                if count + remaining >= needed
+            }
+
+        total = len(ordered)
+        matches = (
+            (count / total, count / (total + self.gram_counts[track_id] - count), track_id)
+            for track_id, count in counts.items()
+            if count >= needed
+        )
+        return [(track_id, round(score, 4)) for score, _, track_id in heapq.nlargest(limit, matches)]
+
+
+def _build_state(rows: Iterable[TrackTerms]) -> _TrigramState:
+    """전체 트랙으로 새 인덱스를 만듭니다 (posting을 모은 뒤 한 번에 정렬)."""
+    state = _TrigramState()
+    postings: Dict[str, List[int]] = {}
+    for track_id, title, artist_name, _ in rows:
+        state.track_fields[track_id] = (title, artist_name)
+        grams = state._grams_of(track_id)
+        state.gram_counts[track_id] = len(grams)
+        for gram in grams:
+            postings.setdefault(gram, []).append(track_id)
+    state.postings = {gram: array("I", sorted(ids)) for gram, ids in postings.items()}
+    return state
+
+
+class TrigramIndex(TrackIndex):
+    """트랙 제목/아티스트 trigram 인덱스"""
+
+    name = "오타 허용 검색"
+
+    def __init__(self):
+        super().__init__()
+        self._state = _TrigramState()
+        self.lookups = 0
+        self.lookup_time = 0.0
+
+    def _build(self, rows: Iterable[TrackTerms]) -> _TrigramState:
+        return _build_state(rows)
+
+    def _install(self, state: _TrigramState) -> None:
+        self._state = state
+
+    def _update(
+        self,
+        track_id: int,
+        title: Optional[str],
+        artist_name: Optional[str],
+        tags: Optional[Iterable[str]],
+    ) -> None:
+        self._state.update_track(track_id, title, artist_name)
+
+    def _remove(self, track_id: int) -> None:
+        self._state.remove_track(track_id)
+
+    def search(self, query: str, skip: int = 0, limit: int = 100) -> List[Tuple[int, float]]:
+        """검색어와 비슷한 트랙의 (id, 점수) 목록을 점수 높은 순으로 반환합니다."""
+        start = time.perf_counter()
+        results = self._state.search(
+            query,
+            settings.SEARCH_FUZZY_THRESHOLD,
+            settings.SEARCH_FUZZY_MAX_CANDIDATES,
+            skip + limit,
+        )
+        self.lookups += 1
+        self.lookup_time += time.perf_counter() - start
+        return results[skip:]
+
+    def stats(self) -> Dict[str, Any]:
+        state = self._state
+        return {
+            "tracks": len(state.track_fields),
+            "trigrams": len(state.postings),
+            "lookups": self.lookups,
+            "avg_lookup_us": round(self.lookup_time / self.lookups * 1e6, 1) if self.lookups else 0.0,
+            "refreshed_at": self.refreshed_at,
+        }
+
+
+fuzzy_index = TrigramIndex()
@@ -1,32 +1,46 @@
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
 import httpx
-from jose import jwt, JWTError
-from jose.exceptions import ExpiredSignatureError, JWTClaimsError
-from typing import Dict, Any, Optional
+from jose import jwt, jwk, JWTError
+from jose.backends.base import Key
+from jose.exceptions import ExpiredSignatureError, JWTClaimsError, JWKError
+from typing import Dict, Any, Optional, Tuple
 from app.core.config import settings
-from app.core.redis_client import cache_get, cache_set
+from app.core.redis_client import cache_get_or_compute
 from app.core.exceptions import AuthenticationError
 
 # 캐시 키
 JWKS_CACHE_KEY = "jwks:cache"
 
 
-async def get_jwks() -> Dict[str, Any]:
+async def get_jwks(force_refresh: bool = False) -> Dict[str, Any]:
     """
     권한 서버에서 JWKS(JSON Web Key Set)를 가져옵니다.
     Redis에 캐싱되어 있으면 캐시에서 반환하고, 없으면 서버에서 가져와 캐싱합니다.
+    만료 시 한 워커만 다시 가져오고(재계산 락), 나머지는 이전 값을 응답합니다.
     
+    Args:
+        force_refresh: True면 Redis 캐시를 건너뛰고 서버에서 다시 가져옴
+        
     Returns:
         JWKS 딕셔너리
         
     Raises:
         AuthenticationError: JWKS를 가져오는데 실패한 경우
     """
-    # 캐시 확인
-    cached_jwks = cache_get(JWKS_CACHE_KEY)
-    if cached_jwks:
-        return cached_jwks
-    
-    # 권한 서버에서 JWKS 가져오기
+    jwks, _ = await cache_get_or_compute(
+        JWKS_CACHE_KEY,
+        _fetch_jwks,
+        ttl=settings.REDIS_CACHE_TTL_JWKS,
+        force=force_refresh,
+    )
+    return jwks
+
+
+async def _fetch_jwks() -> Dict[str, Any]:
+    """권한 서버에서 JWKS 가져오기"""
     try:
         async with httpx.AsyncClient() as client:
             response = await client.get(
@@ -34,12 +48,7 @@ async def get_jwks() -> Dict[str, Any]:
                 timeout=10.0
             )
             response.raise_for_status()
-            jwks = response.json()
-            
-            # Redis에 캐싱 (1시간)
-            cache_set(JWKS_CACHE_KEY, jwks, ttl=settings.REDIS_CACHE_TTL_JWKS)
-            
-            return jwks
+            return response.json()
     except httpx.HTTPError as e:
         raise AuthenticationError(
             message="JWKS를 가져오는데 실패했습니다",
@@ -47,37 +56,201 @@ async def get_jwks() -> Dict[str, Any]:
         )
 
 
-def get_public_key_from_jwks(token: str, jwks: Dict[str, Any]) -> Optional[str]:
+class JWKSStore:
+    """
+    프로세스 내 JWKS 키 저장소
+    
+    kid -> 미리 생성된 공개키 객체(jose Key)를 보관하여, 정상 상태에서는
+    토큰 검증 시 Redis/네트워크 호출이 발생하지 않도록 합니다.
+    - REDIS_CACHE_TTL_JWKS 만료 전에 백그라운드에서 갱신
+    - 모르는 kid가 오면 한 번만 재조회 (키 교체 대응, 최소 간격 제한)
+    - single-flight: 동시에 캐시 미스가 나도 JWKS 요청은 한 번만 수행
+    """
+
+    def __init__(self):
+        self._keys: Dict[str, Key] = {}
+        self._expires_at: float = 0.0
+        self._last_unknown_kid_refresh: float = 0.0
+        self._generation: int = 0
+        self._lock = asyncio.Lock()
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    def _is_fresh(self) -> bool:
+        return bool(self._keys) and time.monotonic() < self._expires_at
+
+    def _load(self, jwks: Dict[str, Any]) -> None:
+        keys = {}
+        for key_data in jwks.get("keys", []):
+            kid = key_data.get("kid")
+            if not kid:
+                continue
+            try:
+                keys[kid] = jwk.construct(key_data, key_data.get("alg", settings.JWT_ALGORITHM))
+            except JWKError as e:
+                print(f"JWKS key 파싱 실패 (kid={kid}): {e}")
+        self._keys = keys
+        self._expires_at = time.monotonic() + max(
+            settings.REDIS_CACHE_TTL_JWKS - settings.JWKS_REFRESH_MARGIN, 0
+        )
+        self._generation += 1
+
+    async def refresh(self, force: bool = False) -> None:
+        """
+        JWKS를 다시 로딩합니다 (single-flight).
+        
+        대기 중에 다른 코루틴이 이미 갱신을 끝냈다면 요청을 다시 보내지 않습니다.
+        """
+        generation = self._generation
+        async with self._lock:
+            if self._generation != generation:
+                return
+            if not force and self._is_fresh():
+                return
+            # 처음 로딩할 때는 다른 워커가 Redis에 넣어둔 값을 재사용
+            jwks = await get_jwks(force_refresh=bool(self._keys) or force)
+            self._load(jwks)
+
+    async def get_key(self, kid: str) -> Optional[Key]:
+        """
+        kid에 해당하는 공개키를 반환합니다.
+        
+        Returns:
+            공개키 객체 또는 None (재조회 후에도 없는 경우)
+        """
+        if not self._is_fresh():
+            try:
+                await self.refresh()
+            except AuthenticationError:
+                # 갱신에 실패해도 기존 키가 있으면 계속 사용
+                if not self._keys:
+                    raise
+
+        key = self._keys.get(kid)
+        if key is not None:
+            return key
+
+        # 모르는 kid: 키 교체 가능성이 있으므로 한 번만 재조회
+        now = time.monotonic()
+        if now - self._last_unknown_kid_refresh < settings.JWKS_UNKNOWN_KID_COOLDOWN:
+            return None
+        self._last_unknown_kid_refresh = now
+        await self.refresh(force=True)
+        return self._keys.get(kid)
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            delay = max(self._expires_at - time.monotonic(), 0)
+            await asyncio.sleep(delay)
+            try:
+                await self.refresh(force=True)
+            except Exception as e:
+                print(f"JWKS 백그라운드 갱신 실패: {e}")
+                # 실패 시 잠시 후 재시도 (기존 키는 유지)
+                self._expires_at = time.monotonic() + 30
+
+    def start_background_refresh(self) -> None:
+        """만료 전에 JWKS를 갱신하는 백그라운드 작업을 시작합니다."""
+        if not settings.AUTH_SERVER_JWKS_URL:
+            return
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh_loop())
+
+    async def stop_background_refresh(self) -> None:
+        """백그라운드 갱신 작업을 중지합니다."""
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+            self._refresh_task = None
+
+
+jwks_store = JWKSStore()
+
+
+def get_token_kid(token: str) -> Optional[str]:
     """
-    JWT 토큰의 헤더에서 kid를 추출하고, JWKS에서 해당하는 공개키를 찾습니다.
+    JWT 토큰의 헤더에서 kid를 추출합니다 (검증 없이).
     
     Args:
         token: JWT 토큰
-        jwks: JWKS 딕셔너리
         
     Returns:
-        공개키 (PEM 형식) 또는 None
+        kid 또는 None
     """
     try:
-        # 토큰 헤더 디코딩 (검증 없이)
         unverified_header = jwt.get_unverified_header(token)
-        kid = unverified_header.get("kid")
-        
-        if not kid:
-            return None
-        
-        # JWKS에서 kid에 해당하는 키 찾기
-        for key in jwks.get("keys", []):
-            if key.get("kid") == kid:
-                # JWK를 PEM 형식으로 변환하여 반환
-                # python-jose는 JWK 딕셔너리를 직접 사용할 수 있음
-                return key
-        
-        return None
+        return unverified_header.get("kid")
     except JWTError:
         return None
 
 
+class VerifiedTokenCache:
+    """
+    검증이 끝난 토큰 페이로드의 LRU 캐시
+    
+    키는 토큰의 SHA-256 해시이며 (원문 토큰은 보관하지 않음),
+    항목은 토큰의 exp 시각에 만료됩니다. 같은 토큰으로 반복 요청하는
+    클라이언트는 첫 요청 이후 RS256 서명 검증을 건너뜁니다.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+    @staticmethod
+    def _digest(token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    def get(self, token: str) -> Optional[Dict[str, Any]]:
+        digest = self._digest(token)
+        entry = self._entries.get(digest)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, payload = entry
+        if time.time() >= expires_at:
+            del self._entries[digest]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(digest)
+        self.hits += 1
+        return dict(payload)
+
+    def set(self, token: str, payload: Dict[str, Any]) -> None:
+        exp = payload.get("exp")
+        # exp가 없는 토큰은 만료 시점을 알 수 없으므로 캐싱하지 않음
+        if not isinstance(exp, (int, float)) or exp <= time.time():
+            return
+
+        digest = self._digest(token)
+        self._entries[digest] = (float(exp), dict(payload))
+        self._entries.move_to_end(digest)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+        }
+
+
+token_cache = VerifiedTokenCache(settings.VERIFIED_TOKEN_CACHE_SIZE)
+
+
 async def verify_token(token: str) -> Dict[str, Any]:
     """
     JWT 토큰을 검증하고 페이로드를 반환합니다.
@@ -91,12 +264,15 @@ async def verify_token(token: str) -> Dict[str, Any]:
     Raises:
         AuthenticationError: 토큰이 유효하지 않은 경우
     """
+    # 이미 검증된 토큰이면 서명 검증 생략
+    cached_payload = token_cache.get(token)
+    if cached_payload is not None:
+        return cached_payload
+    
     try:
-        # JWKS 가져오기
-        jwks = await get_jwks()
-        
-        # 공개키 찾기
-        public_key = get_public_key_from_jwks(token, jwks)
+        # 공개키 찾기 (프로세스 내 JWKS 저장소)
+        kid = get_token_kid(token)
+        public_key = await jwks_store.get_key(kid) if kid else None
         if not public_key:
             raise AuthenticationError(
                 message="토큰의 서명 키를 찾을 수 없습니다",
@@ -112,6 +288,7 @@ async def verify_token(token: str) -> Dict[str, Any]:
             issuer=settings.JWT_ISSUER if settings.JWT_ISSUER else None,
         )
         
+        token_cache.set(token, payload)
         return payload
         
     except ExpiredSignatureError:
@@ -0,0 +1,46 @@
+"""
+커서(keyset) 페이지네이션 도우미
+
+커서는 마지막 항목의 (정렬 시각, id)를 URL-safe base64로 인코딩한 문자열입니다.
+OFFSET과 달리 페이지가 깊어져도 인덱스 범위 검색으로 바로 다음 항목을 찾습니다.
+"""
+import base64
+import json
+from datetime import datetime
+from typing import NamedTuple, Optional
+
+from app.core.exceptions import ValidationError
+
+# 다음 페이지 커서를 전달하는 응답 헤더 (목록을 그대로 반환하는 엔드포인트용)
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+class Cursor(NamedTuple):
+    """정렬 기준 시각과 동률을 구분하는 id"""
+    sort_value: datetime
+    id: int
+
+
+def encode_cursor(cursor: Optional[Cursor]) -> Optional[str]:
+    """커서를 문자열로 인코딩합니다 (None이면 None)."""
+    if cursor is None:
+        return None
+    raw = json.dumps([cursor.sort_value.isoformat(), cursor.id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(value: Optional[str]) -> Optional[Cursor]:
+    """
+    문자열 커서를 해석합니다 (None/빈 문자열이면 None).
+
+    Raises:
+        ValidationError: 형식이 잘못된 커서
+    """
+    if not value:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(value + "=" * (-len(value) % 4))
+        sort_value, item_id = json.loads(raw)
+        return Cursor(datetime.fromisoformat(sort_value), int(item_id))
+    except (ValueError, TypeError) as e:
+        raise ValidationError("잘못된 커서입니다", details={"cursor": value}) from e
@@ -0,0 +1,45 @@
+from typing import Any, Dict, Optional
+from app.core.config import settings
+from app.core.cache import cache
+
+# 캐시 키 (권한 서버 user_id 기준)
+PROFILE_CACHE_KEY = "user_profile:{user_id}"
+
+
+class ProfileCache:
+    """
+    권한 서버 user_id -> DB 사용자 프로필 캐시
+
+    인증이 필요한 모든 요청에서 프로필 조회 쿼리를 생략하기 위해
+    2단계 캐시(프로세스 내 LRU + Redis)에 저장합니다.
+    프로필 수정/비활성화 시 invalidate()로 모든 워커에서 즉시 제거합니다.
+    항목에 user:{id} 태그를 붙여 두므로 프로필 태그 무효화로도 함께 제거됩니다.
+    """
+
+    def __init__(self, ttl: int):
+        self.ttl = ttl
+
+    async def get(self, user_id: str) -> Optional[Dict[str, Any]]:
+        """
+        캐시된 프로필을 반환합니다.
+
+        Returns:
+            프로필 딕셔너리 (schemas.UserProfile 직렬화 값) 또는 None
+        """
+        return await cache.get(PROFILE_CACHE_KEY.format(user_id=user_id))
+
+    async def set(self, user_id: str, profile: Dict[str, Any]) -> None:
+        """프로필을 캐시에 저장합니다."""
+        await cache.set(
+            PROFILE_CACHE_KEY.format(user_id=user_id),
+            profile,
+            ttl=self.ttl,
+            tags=[f"user:{profile['id']}"],
+        )
+
+    async def invalidate(self, user_id: str) -> None:
+        """프로필 캐시를 제거합니다 (프로필 수정, 비활성화 시)."""
+        await cache.invalidate(PROFILE_CACHE_KEY.format(user_id=user_id))
+
+
+profile_cache = ProfileCache(ttl=settings.PROFILE_CACHE_TTL)
@@ -1,92 +1,653 @@
-import redis
-import json
-from typing import Optional, Any
+import asyncio
+import math
+import random
+import time
+import uuid
+import redis.asyncio as redis
+from redis.exceptions import RedisError
+from typing import Optional, Any, Awaitable, Callable, Dict, Iterable, List, Set, Tuple
 from app.core.config import settings
+from app.core.circuit_breaker import CircuitBreaker
+from app.core.codec import CacheCodec, CodecError
 
-# Redis 클라이언트 인스턴스
+# Redis 클라이언트 인스턴스 (비동기, 커넥션 풀 공유)
 _redis_client: Optional[redis.Redis] = None
+# 클라이언트를 생성한 이벤트 루프 (루프가 바뀌면 커넥션을 재사용할 수 없음)
+_redis_loop: Optional[asyncio.AbstractEventLoop] = None
+
+# 캐시 값 코덱 (바이트로 저장하므로 클라이언트는 decode_responses=False)
+codec = CacheCodec(
+    serializer=settings.CACHE_CODEC,
+    compression=settings.CACHE_COMPRESSION,
+    compress_min_size=settings.CACHE_COMPRESS_MIN_SIZE,
+)
+
+
+def versioned_key(key: str) -> str:
+    """
+    Redis 키에 버전 접두사를 붙입니다 (예: v1:track:1).
+    CACHE_KEY_VERSION을 올리면 이전 형식으로 저장된 값을 읽지 않습니다.
+    """
+    return f"{settings.CACHE_KEY_VERSION}:{key}"
+
+
+def _versioned_keys(keys: Iterable[str]) -> List[str]:
+    return [versioned_key(key) for key in keys]
 
 
 def get_redis_client() -> redis.Redis:
-    """Redis 클라이언트 인스턴스를 반환합니다."""
-    global _redis_client
-    if _redis_client is None:
-        _redis_client = redis.Redis(
+    """
+    비동기 Redis 클라이언트 인스턴스를 반환합니다.
+    커넥션 풀 크기는 REDIS_MAX_CONNECTIONS로 고정되며, 풀이 모두 사용 중이면
+    REDIS_POOL_TIMEOUT 동안 반환을 기다립니다.
+    """
+    global _redis_client, _redis_loop
+    loop = asyncio.get_running_loop()
+    if _redis_client is None or _redis_loop is not loop:
+        pool = redis.BlockingConnectionPool(
             host=settings.REDIS_HOST,
             port=settings.REDIS_PORT,
             db=0,
-            decode_responses=True,
-            socket_connect_timeout=5,
-            socket_timeout=5,
+            decode_responses=False,
+            max_connections=settings.REDIS_MAX_CONNECTIONS,
+            timeout=settings.REDIS_POOL_TIMEOUT,
+            socket_connect_timeout=settings.REDIS_SOCKET_CONNECT_TIMEOUT,
+            socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
         )
+        _redis_client = redis.Redis(connection_pool=pool)
+        _redis_loop = loop
     return _redis_client
 
 
-def close_redis_client():
+async def _probe_redis():
+    await get_redis_client().ping()
+
+
+# Redis 장애 시 연결 대기 없이 바로 캐시를 건너뛰기 위한 서킷 브레이커
+redis_breaker = CircuitBreaker(
+    name="Redis",
+    failure_threshold=settings.REDIS_BREAKER_FAILURE_THRESHOLD,
+    probe_interval=settings.REDIS_BREAKER_PROBE_INTERVAL,
+    probe=_probe_redis,
+)
+
+
+async def close_redis_client():
     """Redis 연결을 닫습니다."""
-    global _redis_client
+    global _redis_client, _redis_loop
     if _redis_client is not None:
-        _redis_client.close()
+        await _redis_client.aclose()
+        await _redis_client.connection_pool.disconnect()
         _redis_client = None
+        _redis_loop = None
 
 
-def cache_get(key: str) -> Optional[Any]:
+async def cache_get(key: str) -> Optional[Any]:
     """
     Redis에서 캐시된 값을 가져옵니다.
-    
+
     Args:
         key: 캐시 키
-        
+
     Returns:
-        캐시된 값 (JSON 디코딩됨) 또는 None
+        캐시된 값 (코덱으로 디코딩됨) 또는 None
     """
+    if not redis_breaker.allow():
+        return None
     try:
         client = get_redis_client()
-        value = client.get(key)
+        value = await client.get(versioned_key(key))
+        redis_breaker.record_success()
         if value:
-            return json.loads(value)
+            return codec.decode(value)
+        return None
+    except RedisError as e:
+        redis_breaker.record_failure(e)
+        print(f"Redis cache_get error: {e}")
         return None
-    except (redis.RedisError, json.JSONDecodeError) as e:
+    except CodecError as e:
         print(f"Redis cache_get error: {e}")
         return None
 
 
-def cache_set(key: str, value: Any, ttl: int = 3600) -> bool:
+async def cache_set(key: str, value: Any, ttl: int = 3600) -> bool:
     """
     Redis에 값을 캐싱합니다.
-    
+
     Args:
         key: 캐시 키
-        value: 캐싱할 값 (JSON 직렬화 가능해야 함)
+        value: 캐싱할 값 (JSON 호환 값, datetime 등은 ISO 문자열로 저장)
         ttl: 만료 시간 (초), 기본값 1시간
-        
+
     Returns:
         성공 여부
     """
+    if not redis_breaker.allow():
+        return False
     try:
         client = get_redis_client()
-        serialized_value = json.dumps(value)
-        client.setex(key, ttl, serialized_value)
+        serialized_value = codec.encode(value)
+        await client.set(versioned_key(key), serialized_value, ex=ttl)
+        redis_breaker.record_success()
         return True
-    except (redis.RedisError, TypeError) as e:
+    except RedisError as e:
+        redis_breaker.record_failure(e)
+        print(f"Redis cache_set error: {e}")
+        return False
+    except TypeError as e:
         print(f"Redis cache_set error: {e}")
         return False
 
 
-def cache_delete(key: str) -> bool:
+async def cache_delete(key: str, *keys: str) -> bool:
     """
     Redis에서 캐시를 삭제합니다.
-    
+
     Args:
         key: 삭제할 캐시 키
-        
+        keys: 함께 삭제할 추가 키 (DEL 한 번으로 처리)
+
     Returns:
         성공 여부
     """
+    if not redis_breaker.allow():
+        return False
     try:
         client = get_redis_client()
-        client.delete(key)
+        await client.delete(*_versioned_keys((key, *keys)))
+        redis_breaker.record_success()
         return True
-    except redis.RedisError as e:
+    except RedisError as e:
+        redis_breaker.record_failure(e)
         print(f"Redis cache_delete error: {e}")
         return False
+
+
+async def cache_get_many(keys: Iterable[str]) -> Dict[str, Any]:
+    """
+    여러 키를 MGET 한 번으로 가져옵니다.
+
+    Args:
+        keys: 캐시 키 목록
+
+    Returns:
+        {키: 값} 딕셔너리 (캐시에 있는 키만 포함)
+    """
+    keys = list(keys)
+    if not keys or not redis_breaker.allow():
+        return {}
+    try:
+        client = get_redis_client()
+        values = await client.mget(_versioned_keys(keys))
+        redis_breaker.record_success()
+    except RedisError as e:
+        redis_breaker.record_failure(e)
+        print(f"Redis cache_get_many error: {e}")
+        return {}
+
+    result = {}
+    for key, value in zip(keys, values):
+        if not value:
+            continue
+        try:
+            result[key] = codec.decode(value)
+        except CodecError:
+            continue
+    return result
+
+
+async def cache_set_many(items: Dict[str, Any], ttl: int = 3600) -> bool:
+    """
+    여러 값을 파이프라인으로 한 번에 캐싱합니다 (왕복 1회).
+
+    Args:
+        items: {키: 값} 딕셔너리
+        ttl: 만료 시간 (초), 기본값 1시간
+
+    Returns:
+        성공 여부
+    """
+    if not items:
+        return True
+    if not redis_breaker.allow():
+        return False
+    try:
+        client = get_redis_client()
+        async with client.pipeline(transaction=False) as pipe:
+            for key, value in items.items():
+                pipe.set(versioned_key(key), codec.encode(value), ex=ttl)
+            await pipe.execute()
+        redis_breaker.record_success()
+        return True
+    except RedisError as e:
+        redis_breaker.record_failure(e)
+        print(f"Redis cache_set_many error: {e}")
+        return False
+    except TypeError as e:
+        print(f"Redis cache_set_many error: {e}")
+        return False
+
+
+async def cache_publish(channel: str, message: str) -> bool:
+    """
+    Redis pub/sub 채널에 메시지를 발행합니다.
+
+    Args:
+        channel: 채널 이름
+        message: 메시지 (문자열)
+
+    Returns:
+        성공 여부
+    """
+    if not redis_breaker.allow():
+        return False
+    try:
+        client = get_redis_client()
+        await client.publish(channel, message)
+        redis_breaker.record_success()
+        return True
+    except RedisError as e:
+        redis_breaker.record_failure(e)
+        print(f"Redis cache_publish error: {e}")
+        return False
+
+
+async def cache_set_add(set_keys: Iterable[str], member: str, ttl: int) -> bool:
+    """
+    여러 Redis 집합에 같은 멤버를 추가합니다 (파이프라인, 왕복 1회).
+    태그 -> 캐시 키 인덱스를 기록할 때 사용합니다.
+
+    Args:
+        set_keys: 집합 키 목록
+        member: 추가할 멤버
+        ttl: 집합 만료 시간 (초)
+
+    Returns:
+        성공 여부
+    """
+    set_keys = list(set_keys)
+    if not set_keys:
+        return True
+    if not redis_breaker.allow():
+        return False
+    try:
+        client = get_redis_client()
+        async with client.pipeline(transaction=False) as pipe:
+            for set_key in _versioned_keys(set_keys):
+                pipe.sadd(set_key, member)
+                pipe.expire(set_key, ttl)
+            await pipe.execute()
+        redis_breaker.record_success()
+        return True
+    except RedisError as e:
+        redis_breaker.record_failure(e)
+        print(f"Redis cache_set_add error: {e}")
+        return False
+
+
+async def cache_set_add_members(members_by_set: Dict[str, Iterable[str]], ttl: int) -> bool:
+    """
+    여러 Redis 집합에 각각의 멤버들을 추가합니다 (파이프라인, 왕복 1회).
+    여러 캐시 키를 한 번에 태그 인덱스에 기록할 때 사용합니다.
+
+    Args:
+        members_by_set: {집합 키: 추가할 멤버 목록}
+        ttl: 집합 만료 시간 (초)
+
+    Returns:
+        성공 여부
+    """
+    members_by_set = {key: list(members) for key, members in members_by_set.items() if members}
+    if not members_by_set:
+        return True
+    if not redis_breaker.allow():
+        return False
+    try:
+        client = get_redis_client()
+        async with client.pipeline(transaction=False) as pipe:
+            for set_key, members in members_by_set.items():
+                set_key = versioned_key(set_key)
+                pipe.sadd(set_key, *members)
+                pipe.expire(set_key, ttl)
+            await pipe.execute()
+        redis_breaker.record_success()
+        return True
+    except RedisError as e:
+        redis_breaker.record_failure(e)
+        print(f"Redis cache_set_add_members error: {e}")
+        return False
+
+
+async def cache_set_pop_all(set_keys: Iterable[str]) -> Set[str]:
+    """
+    여러 Redis 집합의 멤버를 모두 가져오고 집합을 삭제합니다 (MULTI, 왕복 1회).
+
+    Args:
+        set_keys: 집합 키 목록
+
+    Returns:
+        모든 집합 멤버의 합집합
+    """
+    set_keys = _versioned_keys(set_keys)
+    if not set_keys or not redis_breaker.allow():
+        return set()
+    try:
+        client = get_redis_client()
+        async with client.pipeline(transaction=True) as pipe:
+            for set_key in set_keys:
+                pipe.smembers(set_key)
+            pipe.delete(*set_keys)
+            results = await pipe.execute()
+        redis_breaker.record_success()
+    except RedisError as e:
+        redis_breaker.record_failure(e)
+        print(f"Redis cache_set_pop_all error: {e}")
+        return set()
+
+    members: Set[str] = set()
+    for result in results[:-1]:
+        members.update(member.decode() if isinstance(member, bytes) else member for member in result)
+    return members
+
+
+# 원본 집합에서 만든 결과 집합 키를 모아두는 집합 (원본 키 + 접미사)
+_DERIVED_SUFFIX = ":derived"
+# 원본 집합에 멤버를 추가할 때마다 올리는 세대 번호 (원본 키 + 접미사)
+# 집합을 DB 스냅숏으로 채우는 동안 추가된 멤버가 빠지지 않도록 채우기 전후 값을 비교
+_GENERATION_SUFFIX = ":gen"
+# 결과 집합(KEYS[1])이 없으면 원본 집합(KEYS[2:])의 교집합/합집합으로 만들고, 큰 값부터 한 페이지 반환
+# 원본 집합 중 없는 것이 있으면 만들지 않고 {0, 없는 원본의 위치(0부터), 그 원본의 세대 번호} 반환
+_SET_COMBINE_PAGE_SCRIPT = """
+if redis.call('exists', KEYS[1]) == 0 then
+    local missing = {}
+    local generations = {}
+    for i = 2, #KEYS do
+        if redis.call('exists', KEYS[i]) == 0 then
+            missing[#missing + 1] = i - 2
+            generations[#generations + 1] = redis.call('get', KEYS[i] .. ARGV[6]) or '0'
+        end
+    end
+    if #missing > 0 then
+        return {0, missing, generations}
+    end
+    redis.call(ARGV[1], KEYS[1], unpack(KEYS, 2))
+    redis.call('expire', KEYS[1], ARGV[2])
+    for i = 2, #KEYS do
+        local derived = KEYS[i] .. ARGV[5]
+        redis.call('sadd', derived, KEYS[1])
+        local ttl = redis.call('ttl', KEYS[i])
+        if ttl > 0 then
+            redis.call('expire', derived, ttl)
+        end
+    end
+end
+return {1, redis.call('sort', KEYS[1], 'desc', 'limit', ARGV[3], ARGV[4])}
+"""
+# 이미 있는 집합에만 멤버를 추가하고 (일부만 채워진 집합이 생기지 않도록), 그 집합으로 만든 결과 집합은 삭제
+# 집합이 없어도 세대 번호를 올려, 추가 전에 읽은 스냅숏으로 집합을 채우지 못하게 함
+_SET_ADD_EXISTING_SCRIPT = """
+for i = 1, #KEYS do
+    if redis.call('exists', KEYS[i]) == 1 then
+        redis.call('sadd', KEYS[i], ARGV[1])
+    end
+    local generation = KEYS[i] .. ARGV[3]
+    redis.call('incr', generation)
+    redis.call('expire', generation, ARGV[4])
+    local derived = KEYS[i] .. ARGV[2]
+    local keys = redis.call('smembers', derived)
+    if #keys > 0 then
+        redis.call('del', unpack(keys))
+    end
+    redis.call('del', derived)
+end
+return 0
+"""
+# 집합을 채울 때 SADD 한 번에 넣는 최대 멤버 수 (Lua unpack 인자 수 제한보다 작게)
+_SET_FILL_CHUNK = 5000
+# 세대 번호(KEYS[2])가 ARGV[1]과 같을 때만 집합(KEYS[1])에 멤버(ARGV[3:])를 더하고 ttl(ARGV[2]) 설정
+# 기존 멤버는 지우지 않으므로, 먼저 채워진 집합에 더해져도 추가된 멤버가 빠지지 않음
+_SET_FILL_SCRIPT = """
+if (redis.call('get', KEYS[2]) or '0') ~= ARGV[1] then
+    return 0
+end
+for i = 3, #ARGV, CHUNK do
+    redis.call('sadd', KEYS[1], unpack(ARGV, i, math.min(i + CHUNK - 1, #ARGV)))
+end
+redis.call('expire', KEYS[1], ARGV[2])
+return 1
+""".replace("CHUNK", str(_SET_FILL_CHUNK))
+
+
+async def cache_set_fill(set_key: str, members: Iterable[Any], ttl: int, generation: str) -> bool:
+    """
+    DB에서 읽은 members로 Redis 집합을 채웁니다 (Lua 스크립트, 왕복 1회).
+    generation은 DB를 읽기 전에 cache_set_combine_page가 알려준 세대 번호로, 그 사이
+    cache_set_add_existing으로 멤버가 추가됐다면 스냅숏에 빠져 있을 수 있으므로 채우지 않습니다.
+    members가 비어 있으면 집합을 만들 수 없으므로 채우지 않습니다.
+
+    Returns:
+        채웠는지 여부 (False면 호출자가 DB에서 직접 조회)
+    """
+    members = list(members)
+    if not members or not redis_breaker.allow():
+        return False
+    key = versioned_key(set_key)
+    try:
+        client = get_redis_client()
+        filled = await client.eval(
+            _SET_FILL_SCRIPT, 2, key, key + _GENERATION_SUFFIX, generation, ttl, *members,
+        )
+        redis_breaker.record_success()
+        return bool(filled)
+    except RedisError as e:
+        redis_breaker.record_failure(e)
+        print(f"Redis cache_set_fill error: {e}")
+        return False
+
+
+async def cache_set_add_existing(set_keys: Iterable[str], member: Any, ttl: int) -> bool:
+    """
+    이미 있는 Redis 집합에만 멤버를 추가하고, 그 집합으로 만든 결과 집합
+    (cache_set_combine_page)을 삭제합니다. 없는 집합은 다음 조회 때 처음부터 채웁니다.
+    집합마다 세대 번호를 올려(ttl 동안 유지), 추가 전에 읽은 DB 스냅숏으로 채우는 것을 막습니다.
+
+    Returns:
+        성공 여부
+    """
+    set_keys = _versioned_keys(set_keys)
+    if not set_keys:
+        return True
+    if not redis_breaker.allow():
+        return False
+    try:
+        client = get_redis_client()
+        await client.eval(
+            _SET_ADD_EXISTING_SCRIPT, len(set_keys), *set_keys,
+            member, _DERIVED_SUFFIX, _GENERATION_SUFFIX, ttl,
+        )
+        redis_breaker.record_success()
+        return True
+    except RedisError as e:
+        redis_breaker.record_failure(e)
+        print(f"Redis cache_set_add_existing error: {e}")
+        return False
+
+
+async def cache_set_combine_page(
+    dest_key: str,
+    set_keys: List[str],
+    union: bool,
+    ttl: int,
+    offset: int,
+    count: int,
+) -> Optional[Tuple[List[int], Dict[int, str]]]:
+    """
+    여러 정수 집합의 교집합(SINTERSTORE) 또는 합집합(SUNIONSTORE)을 dest_key에 ttl 동안
+    저장해 두고, 큰 값부터 offset/count 한 페이지를 반환합니다 (Lua 스크립트, 왕복 1회).
+    원본 집합에 멤버가 추가되면(cache_set_add_existing) 결과 집합도 삭제됩니다.
+
+    Returns:
+        (페이지의 멤버 목록, {없는 원본 집합의 위치: 세대 번호}), Redis를 사용할 수 없으면 None.
+        없는 원본 집합이 있으면 결과를 만들지 않으므로, 세대 번호로 cache_set_fill을 호출해 채운 뒤
+        다시 호출합니다.
+    """
+    if not redis_breaker.allow():
+        return None
+    keys = _versioned_keys([dest_key, *set_keys])
+    try:
+        client = get_redis_client()
+        found, values, *generations = await client.eval(
+            _SET_COMBINE_PAGE_SCRIPT, len(keys), *keys,
+            "sunionstore" if union else "sinterstore", ttl, offset, count, _DERIVED_SUFFIX, _GENERATION_SUFFIX,
+        )
+        redis_breaker.record_success()
+    except RedisError as e:
+        redis_breaker.record_failure(e)
+        print(f"Redis cache_set_combine_page error: {e}")
+        return None
+
+    if not found:
+        return [], {
+            int(i): generation.decode() if isinstance(generation, bytes) else str(generation)
+            for i, generation in zip(values, generations[0])
+        }
+    return [int(value) for value in values], {}
+
+
+# 재계산 락 키
+LOCK_KEY = "lock:{key}"
+# 자신이 잡은 락만 해제 (토큰 비교 후 삭제)
+_RELEASE_LOCK_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+# Redis 오류로 락을 확인할 수 없을 때의 토큰 (락 없이 진행)
+_NO_LOCK = ""
+
+
+async def cache_acquire_lock(key: str, ttl: int) -> Optional[str]:
+    """
+    SET NX로 짧은 락을 잡습니다.
+
+    Returns:
+        락 토큰 (해제 시 사용), 다른 워커가 이미 잡고 있으면 None.
+        Redis 오류 시에는 락 없이 진행하도록 빈 토큰을 반환합니다.
+    """
+    if not redis_breaker.allow():
+        return _NO_LOCK
+    token = uuid.uuid4().hex
+    try:
+        client = get_redis_client()
+        acquired = await client.set(versioned_key(LOCK_KEY.format(key=key)), token, nx=True, ex=ttl)
+        redis_breaker.record_success()
+        return token if acquired else None
+    except RedisError as e:
+        redis_breaker.record_failure(e)
+        print(f"Redis cache_acquire_lock error: {e}")
+        return _NO_LOCK
+
+
+async def cache_release_lock(key: str, token: str) -> None:
+    """cache_acquire_lock()으로 잡은 락을 해제합니다."""
+    if not token or not redis_breaker.allow():
+        return
+    try:
+        client = get_redis_client()
+        await client.eval(_RELEASE_LOCK_SCRIPT, 1, versioned_key(LOCK_KEY.format(key=key)), token)
+        redis_breaker.record_success()
+    except RedisError as e:
+        redis_breaker.record_failure(e)
+        print(f"Redis cache_release_lock error: {e}")
+
+
+def _should_recompute(entry: Dict[str, Any], beta: float) -> bool:
+    """
+    확률적 조기 재계산 (XFetch)
+    만료가 가까울수록, 재계산 비용(delta)이 클수록 높은 확률로 True를 반환하여
+    만료 시점에 모든 요청이 한꺼번에 미스 나지 않도록 갱신 시점을 분산합니다.
+    """
+    # 1 - random()은 (0, 1] 범위이므로 log가 항상 정의됨
+    return time.time() - entry["delta"] * beta * math.log(1.0 - random.random()) >= entry["expiry"]
+
+
+def _is_entry(entry: Any) -> bool:
+    return isinstance(entry, dict) and {"value", "delta", "expiry"} <= entry.keys()
+
+
+async def _compute_and_store(
+    key: str,
+    compute: Callable[[], Awaitable[Any]],
+    ttl: int,
+    stale_ttl: int,
+) -> Any:
+    started = time.monotonic()
+    value = await compute()
+    if value is not None:
+        entry = {"value": value, "delta": time.monotonic() - started, "expiry": time.time() + ttl}
+        # 논리적 만료(expiry) 이후에도 stale_ttl 동안은 이전 값을 응답할 수 있도록 보관
+        await cache_set(key, entry, ttl=ttl + stale_ttl)
+    return value
+
+
+async def cache_get_or_compute(
+    key: str,
+    compute: Callable[[], Awaitable[Any]],
+    ttl: int,
+    stale_ttl: Optional[int] = None,
+    force: bool = False,
+) -> Tuple[Any, bool]:
+    """
+    캐시 스탬피드를 방지하며 값을 조회하고, 필요하면 compute()로 다시 계산합니다.
+
+    - 확률적 조기 재계산: 만료 전에 한 요청이 미리 값을 갱신
+    - 재계산 락(SET NX): 한 번에 한 워커만 compute() 실행
+    - stale-while-revalidate: 다른 워커가 재계산하는 동안 이전 값을 응답
+    - 값이 아예 없으면 락을 잡은 워커의 결과를 CACHE_LOCK_WAIT 동안 기다림
+
+    Args:
+        key: 캐시 키
+        compute: 값을 계산하는 코루틴 함수 (None을 반환하면 캐싱하지 않음)
+        ttl: 논리적 만료 시간 (초)
+        stale_ttl: 만료 후 이전 값을 응답할 수 있는 시간 (초), 기본값 CACHE_STALE_TTL
+        force: True면 캐시를 읽지 않고 다시 계산
+
+    Returns:
+        (값, 이번 호출에서 계산했는지 여부)
+    """
+    stale_ttl = settings.CACHE_STALE_TTL if stale_ttl is None else stale_ttl
+    if not redis_breaker.allow():
+        return await compute(), True
+    if force:
+        return await _compute_and_store(key, compute, ttl, stale_ttl), True
+
+    entry = await cache_get(key)
+    if not _is_entry(entry):
+        entry = None
+    if entry is not None and not _should_recompute(entry, settings.CACHE_EARLY_RECOMPUTE_BETA):
+        return entry["value"], False
+
+    token = await cache_acquire_lock(key, settings.CACHE_LOCK_TTL)
+    if token is None:
+        if entry is not None:
+            # 다른 워커가 재계산 중이므로 이전 값 응답
+            return entry["value"], False
+        deadline = time.monotonic() + settings.CACHE_LOCK_WAIT
+        while time.monotonic() < deadline:
+            await asyncio.sleep(0.05)
+            waited = await cache_get(key)
+            if _is_entry(waited):
+                return waited["value"], False
+        # 락을 잡은 워커가 늦어지면 직접 계산
+
+    try:
+        return await _compute_and_store(key, compute, ttl, stale_ttl), True
+    except Exception:
+        if entry is not None:
+            # 재계산 실패 시 이전 값으로 응답
+            print(f"캐시 재계산 실패, 이전 값 응답: {key}")
+            return entry["value"], False
+        raise
+    finally:
+        await cache_release_lock(key, token or _NO_LOCK)
@@ -0,0 +1,120 @@
+"""
+트랙 필드로 만드는 프로세스 내 검색 인덱스의 공통 부분 (자동완성, 오타 허용 검색)
+
+시작 시 DB에서 전체를 읽어 만들고, 이 워커의 트랙 생성/수정은 커밋 직후 update_track으로
+바로 반영하며, 다른 워커의 변경은 SEARCH_INDEX_REFRESH_INTERVAL마다 백그라운드 재구성으로
+반영합니다. 재구성은 이벤트 루프를 막지 않도록 스레드에서 새 인덱스를 만든 뒤 통째로 교체합니다.
+"""
+import asyncio
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Awaitable, Callable, Iterable, List, Optional, Tuple
+
+from app.core.config import settings
+
+# (트랙 id, 제목, 아티스트 이름, 태그 이름 목록)
+TrackTerms = Tuple[int, Optional[str], Optional[str], Iterable[str]]
+
+
+class TrackIndex(ABC):
+    """
+    하위 클래스는 _build(전체 행 -> 새 상태), _install(상태 교체),
+    _update/_remove(현재 상태에 한 트랙 반영)를 구현합니다.
+    (빠뜨리면 백그라운드 재구성 중이 아니라 인스턴스를 만들 때 TypeError)
+    """
+
+    name = "트랙"
+
+    def __init__(self):
+        self.refreshed_at: Optional[float] = None
+        self._loader: Optional[Callable[[], Awaitable[Iterable[TrackTerms]]]] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+        # 재구성 중(DB 조회, 새 인덱스 생성) 들어온 변경 (교체 후 다시 적용)
+        self._pending: Optional[List[Tuple[str, tuple]]] = None
+
+    @abstractmethod
+    def _build(self, rows: Iterable[TrackTerms]) -> Any:
+        """전체 행으로 새 상태를 만듭니다 (스레드에서 실행되므로 현재 상태는 건드리지 않음)."""
+
+    @abstractmethod
+    def _install(self, state: Any) -> None:
+        """_build로 만든 상태로 교체합니다."""
+
+    @abstractmethod
+    def _update(
+        self,
+        track_id: int,
+        title: Optional[str],
+        artist_name: Optional[str],
+        tags: Optional[Iterable[str]],
+    ) -> None:
+        """현재 상태에 트랙 하나를 반영합니다 (None인 항목은 기존 값 유지)."""
+
+    @abstractmethod
+    def _remove(self, track_id: int) -> None:
+        """현재 상태에서 트랙을 뺍니다."""
+
+    def update_track(
+        self,
+        track_id: int,
+        title: Optional[str] = None,
+        artist_name: Optional[str] = None,
+        tags: Optional[Iterable[str]] = None,
+    ) -> None:
+        """트랙을 인덱스에 반영합니다 (None인 항목은 기존 값 유지)."""
+        if self._pending is not None:
+            self._pending.append(("update", (track_id, title, artist_name, tags)))
+        self._update(track_id, title, artist_name, tags)
+
+    def remove_track(self, track_id: int) -> None:
+        if self._pending is not None:
+            self._pending.append(("remove", (track_id,)))
+        self._remove(track_id)
+
+    def replace_all(self, rows: Iterable[TrackTerms]) -> None:
+        """전체 트랙으로 인덱스를 다시 만듭니다."""
+        self._install(self._build(rows))
+        self.refreshed_at = time.time()
+
+    async def refresh(self) -> None:
+        """loader로 DB에서 전체 트랙을 읽어 인덱스를 다시 만듭니다."""
+        if self._loader is None:
+            return
+        self._pending = []
+        try:
+            rows = await self._loader()
+            state = await asyncio.to_thread(self._build, rows)
+            pending = self._pending
+        finally:
+            self._pending = None
+        self._install(state)
+        self.refreshed_at = time.time()
+        # 재구성하는 동안 이 워커에서 반영한 변경을 다시 적용
+        for action, args in pending:
+            if action == "update":
+                self._update(*args)
+            else:
+                self._remove(*args)
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            try:
+                await self.refresh()
+            except Exception as e:
+                print(f"{self.name} 인덱스 재구성 실패: {e}")
+            await asyncio.sleep(settings.SEARCH_INDEX_REFRESH_INTERVAL)
+
+    def start_background_refresh(self, loader: Callable[[], Awaitable[Iterable[TrackTerms]]]) -> None:
+        """인덱스를 만들고 주기적으로 다시 만드는 백그라운드 작업을 시작합니다."""
+        self._loader = loader
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh_loop())
+
+    async def stop_background_refresh(self) -> None:
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+            self._refresh_task = None
@@ -0,0 +1,1362 @@
+"""
+비동기 CRUD 함수 모음 (AsyncSession 사용)
+
+crud.py와 동일한 함수 구성을 가지며, async 엔드포인트에서 DB I/O가
+이벤트 루프를 막지 않도록 사용합니다.
+AsyncSession에서는 응답 직렬화 시점의 lazy loading이 불가능하므로,
+응답 스키마에 중첩되는 관계는 조회 시 함께 로딩합니다.
+다대일 관계(작성자, 소유자 등)는 joinedload로 같은 쿼리에서 가져와,
+목록 조회의 쿼리 수가 페이지 크기와 관계없이 일정하도록 합니다.
+
+쓰기 함수는 서버 기본값(id, created_at 등)을 INSERT/UPDATE ... RETURNING으로 받아오므로
+커밋 후 다시 조회하지 않고, 응답에 중첩되는 관계만 로딩합니다. 여러 쓰기를 하는 요청은
+unit_of_work()로 묶어 커밋을 한 번만 합니다.
+
+엔드포인트가 그대로 응답하는 조회 함수는 @cached로 캐싱하며, 스키마 인스턴스를
+반환합니다. 쓰기 함수는 커밋 후 관련 태그를 무효화합니다.
+  - tracks                     트랙 전체 목록 (새 트랙 생성 시)
+  - user:{id}                  프로필 (및 프로필이 중첩된 모든 목록)
+  - track:{id}                 트랙 (및 트랙이 포함된 플레이리스트 트랙 목록)
+  - track:{id}:likes           좋아요 목록/수
+  - track:{id}:comments        댓글 목록/수
+  - user:{id}:followers        팔로워 목록/수
+  - user:{id}:following        팔로잉 목록/수
+  - playlist:{id}              플레이리스트
+  - playlist:{id}:tracks       플레이리스트 트랙 목록/수
+  - tags                       인기 태그 목록 (트랙에 태그를 붙일 때)
+  - search:term:{접두어}        검색 결과 (트랙 생성/수정 시 제목/아티스트/설명 단어의 접두어로)
+  - search:fuzzy               오타 허용 검색 결과 (트랙 생성/수정 시)
+"""
+import inspect
+from contextlib import asynccontextmanager
+from datetime import datetime
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func, desc, literal, tuple_, insert, update, delete, case
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import joinedload
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.dialects import postgresql, sqlite
+from app.core.autocomplete import autocomplete_index
+from app.core.cache import cache, cached
+from app.core.config import settings
+from app.core.fuzzy_search import fuzzy_index
+from app.core.pagination import Cursor, encode_cursor
+from app.core.redis_client import cache_set_add_existing, cache_set_combine_page, cache_set_fill
+from app.core.track_index import TrackTerms
+from app.crud import search_cache, tag_filter, track_search
+from app.models import models
+from app.schemas import schemas
+from typing import AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+# unit_of_work 블록 안에서 커밋 후로 미룬 무효화 태그와 작업 (AsyncSession.info에 보관)
+_PENDING_TAGS = "pending_invalidation_tags"
+_PENDING_CALLBACKS = "pending_after_commit"
+
+
+@asynccontextmanager
+async def unit_of_work(db: AsyncSession) -> AsyncIterator[AsyncSession]:
+    """
+    한 요청의 여러 쓰기를 트랜잭션 하나로 묶습니다.
+
+    블록 안에서 호출한 쓰기 함수는 커밋 대신 flush만 하고 캐시 무효화를 미뤄 두며,
+    블록이 정상 종료되면 한 번 커밋한 뒤 모아둔 태그를 무효화합니다.
+    예외가 발생하면 롤백하고 무효화하지 않습니다. 중첩하면 가장 바깥 블록이 커밋합니다.
+
+    사용 예:
+        async with async_crud.unit_of_work(db):
+            track = await async_crud.create_track(db, ...)
+            await async_crud.add_track_to_playlist(db, ...)
+    """
+    if _PENDING_TAGS in db.info:
+        yield db
+        return
+
+    pending = db.info[_PENDING_TAGS] = []
+    callbacks = db.info[_PENDING_CALLBACKS] = []
+    try:
+        yield db
+        await db.commit()
+    except BaseException:
+        await db.rollback()
+        raise
+    finally:
+        del db.info[_PENDING_TAGS]
+        del db.info[_PENDING_CALLBACKS]
+    if pending:
+        await cache.invalidate_tags(*dict.fromkeys(pending))
+    for callback in callbacks:
+        result = callback()
+        if inspect.isawaitable(result):
+            await result
+
+
+async def _commit(db: AsyncSession, *tags: str) -> None:
+    """
+    쓰기 마무리: 커밋 후 tags 무효화
+    unit_of_work 블록 안에서는 flush만 하고 무효화는 블록 종료 시점으로 미룹니다.
+    """
+    pending = db.info.get(_PENDING_TAGS)
+    if pending is not None:
+        await db.flush()
+        pending.extend(tags)
+        return
+    await db.commit()
+    if tags:
+        await cache.invalidate_tags(*tags)
+
+
+async def _after_commit(db: AsyncSession, callback: Callable[[], Optional[Awaitable[None]]]) -> None:
+    """
+    커밋된 내용을 프로세스 내 인덱스, Redis 태그 집합 등에 반영하는 작업 실행 (코루틴이면 await)
+    unit_of_work 블록 안에서는 블록이 커밋된 뒤로 미루고, 롤백되면 실행하지 않습니다.
+    """
+    callbacks = db.info.get(_PENDING_CALLBACKS)
+    if callbacks is not None:
+        callbacks.append(callback)
+        return
+    result = callback()
+    if inspect.isawaitable(result):
+        await result
+
+
+@asynccontextmanager
+async def _savepoint(db: AsyncSession) -> AsyncIterator[None]:
+    """
+    무결성 오류가 날 수 있는 쓰기를 감쌉니다. 예외가 나면 그 쓰기만 되돌리고 예외를 다시 올립니다.
+    unit_of_work 블록 안에서는 세이브포인트만 롤백해 블록의 앞선 쓰기를 유지하고,
+    블록 밖에서는 (앞선 쓰기가 없으므로) 세이브포인트 없이 트랜잭션을 롤백합니다.
+    """
+    if _PENDING_TAGS in db.info:
+        async with db.begin_nested():
+            yield
+        return
+    try:
+        yield
+    except BaseException:
+        await db.rollback()
+        raise
+
+
+async def _load(db: AsyncSession, obj, *relationships: str) -> None:
+    """
+    응답에 중첩되는 관계만 로딩
+    (컬럼 서버 기본값은 INSERT ... RETURNING으로 이미 채워져 있음)
+    """
+    await db.refresh(obj, attribute_names=list(relationships))
+
+
+def _insert(db: AsyncSession, model):
+    """DB 방언에 맞는 INSERT 구문 (ON CONFLICT 지원)"""
+    if db.get_bind().dialect.name == "postgresql":
+        return postgresql.insert(model)
+    return sqlite.insert(model)
+
+
+def _datetime_param(db: AsyncSession, value: datetime):
+    """
+    커서 비교용 시각 파라미터
+    SQLite는 DATETIME을 문자열로 비교하므로 CURRENT_TIMESTAMP 저장 형식
+    (YYYY-MM-DD HH:MM:SS)에 맞춘 문자열로 바인딩해야 같은 시각이 같다고 판단됩니다.
+    """
+    if db.get_bind().dialect.name != "sqlite":
+        return value
+    text = value.strftime("%Y-%m-%d %H:%M:%S")
+    if value.microsecond:
+        text += f".{value.microsecond:06d}"
+    return literal(text)
+
+
+def _before_cursor(db: AsyncSession, sort_column, id_column, cursor: Cursor):
+    """(sort_column, id_column) 내림차순 정렬에서 커서 이후 항목 조건"""
+    return tuple_(sort_column, id_column) < tuple_(_datetime_param(db, cursor.sort_value), cursor.id)
+
+
+async def _paginate(
+    db: AsyncSession,
+    query,
+    sort_column,
+    id_column,
+    skip: int,
+    limit: int,
+    cursor: Optional[Cursor],
+) -> Tuple[list, Optional[Cursor]]:
+    """
+    (sort_column, id_column) 최신순 keyset 페이지네이션
+
+    커서가 있으면 (정렬 시각, id) < 커서 조건으로 인덱스 범위 검색을 하므로
+    페이지가 깊어져도 첫 페이지와 비용이 같습니다. 커서가 없으면 기존처럼 skip을 사용합니다.
+    limit + 1개를 읽어 다음 페이지 존재 여부를 판단합니다.
+
+    Returns:
+        (첫 번째 선택 대상 목록, 다음 페이지 커서 또는 None)
+    """
+    query = (
+        query.add_columns(sort_column, id_column)
+        .order_by(desc(sort_column), desc(id_column))
+        .limit(limit + 1)
+    )
+    if cursor is not None:
+        query = query.where(_before_cursor(db, sort_column, id_column, cursor))
+    elif skip:
+        query = query.offset(skip)
+
+    rows = (await db.execute(query)).all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = Cursor(rows[-1][-2], rows[-1][-1])
+    return [row[0] for row in rows], next_cursor
+
+
+def _user_tags(items, attr: str = "id") -> List[str]:
+    """목록에 중첩된 사용자 프로필의 태그 (닉네임 등 변경 시 목록도 무효화)"""
+    return [f"user:{getattr(item, attr)}" for item in items]
+
+
+def _track_tags(tracks) -> List[str]:
+    return [f"track:{track.id}" for track in tracks] + _user_tags(tracks, "owner_user_id")
+
+
+# UserProfile CRUD
+async def get_user_profile(db: AsyncSession, user_id: int):
+    result = await db.execute(select(models.UserProfile).where(models.UserProfile.id == user_id))
+    return result.scalars().first()
+
+
+@cached(schemas.UserProfile, key="user:{user_id}", tags=["user:{user_id}"])
+async def get_user_profile_cached(db: AsyncSession, user_id: int) -> Optional[schemas.UserProfile]:
+    """사용자 프로필 조회 (2단계 캐시 사용)"""
+    return await get_user_profile(db, user_id=user_id)
+
+
+async def get_user_profile_by_user_id(db: AsyncSession, user_id: str):
+    result = await db.execute(select(models.UserProfile).where(models.UserProfile.user_id == user_id))
+    return result.scalars().first()
+
+
+async def create_user_profile(db: AsyncSession, user: schemas.UserProfileCreate):
+    db_user = models.UserProfile(
+        user_id=user.user_id,
+        nickname=user.nickname,
+        profile_image_url=user.profile_image_url,
+        bio=user.bio
+    )
+    db.add(db_user)
+    await _commit(db)
+    return db_user
+
+
+async def get_or_create_user_profile(db: AsyncSession, user: schemas.UserProfileCreate):
+    """
+    사용자 프로필 조회, 없으면 생성
+    INSERT ... ON CONFLICT DO NOTHING으로 동시에 들어온 첫 요청끼리 경쟁해도
+    중복 생성이나 IntegrityError 없이 같은 프로필을 반환합니다.
+    """
+    db_user = await get_user_profile_by_user_id(db, user_id=user.user_id)
+    if db_user:
+        return db_user
+
+    await db.execute(
+        _insert(db, models.UserProfile)
+        .values(
+            user_id=user.user_id,
+            nickname=user.nickname,
+            profile_image_url=user.profile_image_url,
+            bio=user.bio,
+            is_active=True,
+        )
+        .on_conflict_do_nothing(index_elements=[models.UserProfile.user_id])
+    )
+    await _commit(db)
+    return await get_user_profile_by_user_id(db, user_id=user.user_id)
+
+
+async def update_user_profile(db: AsyncSession, db_user: models.UserProfile, update_data: dict):
+    """사용자 프로필 수정 (is_active 변경으로 인한 비활성화 포함)"""
+    for field, value in update_data.items():
+        setattr(db_user, field, value)
+    # 프로필 캐시(profile_cache)도 user:{id} 태그로 함께 제거
+    await _commit(db, f"user:{db_user.id}")
+    return db_user
+
+
+# Track CRUD
+async def get_track(db: AsyncSession, track_id: int):
+    result = await db.execute(
+        select(models.Track)
+        .options(joinedload(models.Track.owner))
+        .where(models.Track.id == track_id)
+    )
+    return result.scalars().first()
+
+
+@cached(
+    schemas.Track,
+    key="track:{track_id}",
+    tags=["track:{track_id}"],
+    result_tags=lambda track: _user_tags([track], "owner_user_id"),
+    ttl=settings.CACHE_TTL_TRACK,
+)
+async def get_track_cached(db: AsyncSession, track_id: int) -> Optional[schemas.Track]:
+    """트랙 조회 (2단계 캐시 사용, 인기 트랙은 로컬 메모리에서 응답)"""
+    return await get_track(db, track_id=track_id)
+
+
+@cached(
+    Tuple[List[schemas.Track], Optional[Cursor]],
+    tags=["tracks"],
+    result_tags=lambda page: _track_tags(page[0]),
+    ttl=settings.CACHE_TTL_LIST,
+    stampede=True,
+)
+async def get_tracks(
+    db: AsyncSession,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[Cursor] = None,
+) -> Tuple[List[schemas.Track], Optional[Cursor]]:
+    """트랙 목록 (최신순), (목록, 다음 페이지 커서) 반환"""
+    return await _paginate(
+        db,
+        select(models.Track).options(joinedload(models.Track.owner)),
+        models.Track.created_at, models.Track.id,
+        skip, limit, cursor,
+    )
+
+
+async def _cache_tracks(db_tracks: Iterable[models.Track]) -> Dict[int, schemas.Track]:
+    """조회한 트랙을 get_track_cached와 같은 키/태그로 한 번에 캐싱"""
+    tracks = {track.id: schemas.Track.model_validate(track) for track in db_tracks}
+    keys = {track_id: f"track:{track_id}" for track_id in tracks}
+    await cache.set_many(
+        {keys[track_id]: track.model_dump(mode="json") for track_id, track in tracks.items()},
+        ttl=settings.CACHE_TTL_TRACK,
+        tags={keys[track_id]: [keys[track_id], *_user_tags([track], "owner_user_id")] for track_id, track in tracks.items()},
+    )
+    return tracks
+
+
+async def _hydrate_tracks(db: AsyncSession, track_ids: List[int]) -> Dict[int, schemas.Track]:
+    """
+    트랙 본문을 track:{id} 캐시에서 한 번에(로컬 -> Redis MGET) 가져오고,
+    캐시에 없는 트랙만 DB에서 IN 쿼리 한 번으로 조회해 채웁니다. (삭제된 트랙은 빠짐)
+    """
+    found = await cache.get_many(f"track:{track_id}" for track_id in track_ids)
+    tracks = {
+        track_id: schemas.Track.model_validate(found[f"track:{track_id}"])
+        for track_id in track_ids if f"track:{track_id}" in found
+    }
+    missing = [track_id for track_id in track_ids if track_id not in tracks]
+    if missing:
+        result = await db.execute(
+            select(models.Track)
+            .options(joinedload(models.Track.owner))
+            .where(models.Track.id.in_(missing))
+        )
+        tracks.update(await _cache_tracks(result.scalars()))
+    return tracks
+
+
+async def _cached_search(
+    db: AsyncSession,
+    query: str,
+    fuzzy: bool,
+    skip: int,
+    limit: int,
+    search: Callable[[str], Awaitable[List[Tuple[models.Track, Optional[float]]]]],
+) -> List[schemas.TrackSearchResult]:
+    """
+    정규화한 검색어와 페이지로 결과 (트랙 id, 점수) 목록을 캐싱하는 검색 공통 처리
+    캐시 미스면 search(정규화한 검색어)로 조회해 결과 목록과 트랙 본문을 함께 캐싱하고,
+    적중하면 트랙 본문을 _hydrate_tracks로 채웁니다.
+    """
+    normalized = search_cache.normalize_query(query, fuzzy)
+    if not normalized:
+        return []
+    key = search_cache.result_key(normalized, fuzzy, skip, limit)
+    hits = await cache.get(key)
+    search_cache.search_stats.record(normalized, hit=hits is not None)
+
+    if hits is None:
+        rows = await search(normalized)
+        tracks = await _cache_tracks(track for track, _ in rows)
+        hits = [[track.id, score] for track, score in rows]
+        await cache.set(key, hits, ttl=settings.SEARCH_CACHE_TTL, tags=search_cache.result_tags(normalized, fuzzy))
+    else:
+        tracks = await _hydrate_tracks(db, [track_id for track_id, _ in hits])
+
+    return [
+        schemas.TrackSearchResult.model_validate(tracks[track_id]).model_copy(update={"score": score})
+        for track_id, score in hits if track_id in tracks
+    ]
+
+
+async def search_tracks(
+    db: AsyncSession, query: str, skip: int = 0, limit: int = 100
+) -> List[schemas.TrackSearchResult]:
+    """트랙 전문 검색 (제목, 아티스트, 설명), 관련도 순"""
+    async def search(normalized: str):
+        result = await db.execute(
+            track_search.ranked_search(db.get_bind().dialect.name, normalized.split())
+            .options(joinedload(models.Track.owner))
+            .offset(skip).limit(limit)
+        )
+        return [(track, None) for track in result.scalars()]
+
+    return await _cached_search(db, query, False, skip, limit, search)
+
+
+def uses_fuzzy_index(db: AsyncSession) -> bool:
+    """pg_trgm이 없는 DB는 프로세스 내 trigram 인덱스로 오타 허용 검색"""
+    return db.get_bind().dialect.name != "postgresql"
+
+
+async def search_tracks_fuzzy(
+    db: AsyncSession, query: str, skip: int = 0, limit: int = 100
+) -> List[schemas.TrackSearchResult]:
+    """트랙 오타 허용 검색 (제목, 아티스트), 유사도 점수 순"""
+    async def search(normalized: str):
+        if uses_fuzzy_index(db):
+            scores = dict(fuzzy_index.search(normalized, skip, limit))
+            if not scores:
+                return []
+            result = await db.execute(
+                select(models.Track)
+                .options(joinedload(models.Track.owner))
+                .where(models.Track.id.in_(scores))
+            )
+            return sorted(
+                ((track, scores[track.id]) for track in result.scalars()),
+                key=lambda row: (-row[1], -row[0].id),
+            )
+        await db.execute(track_search.fuzzy_threshold(settings.SEARCH_FUZZY_THRESHOLD))
+        result = await db.execute(
+            track_search.fuzzy_search(normalized)
+            .options(joinedload(models.Track.owner))
+            .offset(skip).limit(limit)
+        )
+        return [tuple(row) for row in result.all()]
+
+    return await _cached_search(db, query, True, skip, limit, search)
+
+
+async def _index_track(db: AsyncSession, db_track: models.Track) -> None:
+    """커밋 후 트랙을 프로세스 내 검색 인덱스에 반영"""
+    track_id, title, artist_name = db_track.id, db_track.title, db_track.artist_name
+    fuzzy = uses_fuzzy_index(db)
+
+    def index() -> None:
+        autocomplete_index.update_track(track_id, title=title, artist_name=artist_name)
+        if fuzzy:
+            fuzzy_index.update_track(track_id, title=title, artist_name=artist_name)
+
+    await _after_commit(db, index)
+
+
+def _search_tags(db_track: models.Track) -> List[str]:
+    """트랙 텍스트로 찾을 수 있는 검색 결과 캐시의 태그"""
+    return search_cache.track_text_tags(db_track.title, db_track.artist_name, db_track.description)
+
+
+async def create_track(db: AsyncSession, track: schemas.TrackCreate, owner_id: int):
+    db_track = models.Track(**track.model_dump(), owner_user_id=owner_id)
+    db.add(db_track)
+    await _commit(db, "tracks", *_search_tags(db_track))
+    await _index_track(db, db_track)
+    await _load(db, db_track, "owner")
+    return db_track
+
+
+async def update_track(db: AsyncSession, track_id: int, track_update: schemas.TrackUpdate):
+    """트랙 정보 업데이트"""
+    db_track = await get_track(db, track_id=track_id)
+    if not db_track:
+        return None
+
+    # 수정 전 텍스트로 찾은 검색 결과도 무효화
+    old_search_tags = _search_tags(db_track)
+    # 업데이트할 필드만 적용
+    update_data = track_update.model_dump(exclude_unset=True)
+    for field, value in update_data.items():
+        setattr(db_track, field, value)
+
+    await _commit(db, f"track:{track_id}", *old_search_tags, *_search_tags(db_track))
+    await _index_track(db, db_track)
+    return db_track
+
+
+async def get_track_index_terms(db: AsyncSession) -> List[TrackTerms]:
+    """프로세스 내 검색 인덱스 재구성용 (트랙 id, 제목, 아티스트 이름, 태그 이름 목록)"""
+    tag_names = {}
+    tag_rows = await db.execute(
+        select(models.TrackTag.track_id, models.Tag.name)
+        .join(models.Tag, models.Tag.id == models.TrackTag.tag_id)
+    )
+    for track_id, name in tag_rows:
+        tag_names.setdefault(track_id, []).append(name)
+
+    track_rows = await db.execute(select(models.Track.id, models.Track.title, models.Track.artist_name))
+    return [
+        (track_id, title, artist_name, tag_names.get(track_id, []))
+        for track_id, title, artist_name in track_rows
+    ]
+
+
+# Tag CRUD
+async def add_track_tags(db: AsyncSession, track_id: int, names: Iterable[str]) -> List[str]:
+    """
+    트랙에 태그를 붙입니다 (없는 태그는 새로 만듦).
+
+    태그와 트랙-태그 연결을 각각 INSERT ... ON CONFLICT DO NOTHING 한 문장으로 넣고,
+    새로 연결된 태그의 track_count만 올립니다. 커밋 후 Redis의 태그별 트랙 집합
+    (이미 만들어진 것만)과 자동완성 인덱스에 반영합니다.
+
+    Returns:
+        정규화된 태그 이름 목록
+    """
+    names = tag_filter.normalize_tag_names(names)
+    if not names:
+        return []
+
+    await db.execute(
+        _insert(db, models.Tag)
+        .values([{"name": name} for name in names])
+        .on_conflict_do_nothing(index_elements=[models.Tag.name])
+    )
+    tag_ids = (await db.execute(select(models.Tag.id).where(models.Tag.name.in_(names)))).scalars().all()
+    added = (await db.execute(
+        _insert(db, models.TrackTag)
+        .values([{"track_id": track_id, "tag_id": tag_id} for tag_id in tag_ids])
+        .on_conflict_do_nothing()
+        .returning(models.TrackTag.tag_id)
+    )).scalars().all()
+    if not added:
+        return names
+
+    await db.execute(
+        update(models.Tag)
+        .where(models.Tag.id.in_(added))
+        .values(track_count=models.Tag.track_count + 1)
+        .execution_options(synchronize_session=False)
+    )
+    track_tag_names = (await db.execute(
+        select(models.Tag.name)
+        .join(models.TrackTag, models.TrackTag.tag_id == models.Tag.id)
+        .where(models.TrackTag.track_id == track_id)
+    )).scalars().all()
+    await _commit(db, "tags")
+
+    posting_keys = [tag_filter.TAG_TRACKS_KEY.format(tag_id=tag_id) for tag_id in added]
+    await _after_commit(db, lambda: autocomplete_index.update_track(track_id, tags=track_tag_names))
+    await _after_commit(db, lambda: cache_set_add_existing(posting_keys, track_id, ttl=settings.TAG_POSTING_TTL))
+    return names
+
+
+@cached(
+    List[schemas.Tag],
+    key="tags:popular:{limit}",
+    tags=["tags"],
+    ttl=settings.CACHE_TTL_LIST,
+)
+async def get_popular_tags(db: AsyncSession, limit: int = 20) -> List[models.Tag]:
+    """트랙이 많이 붙은 태그 순 목록"""
+    result = await db.execute(
+        select(models.Tag)
+        .where(models.Tag.track_count > 0)
+        .order_by(desc(models.Tag.track_count), models.Tag.name)
+        .limit(limit)
+    )
+    return result.scalars().all()
+
+
+async def _tag_filter_page(
+    db: AsyncSession, tag_ids: List[int], match_all: bool, skip: int, limit: int
+) -> Optional[List[int]]:
+    """
+    Redis 태그 집합으로 필터 결과 한 페이지의 트랙 id 조회 (없는 태그 집합은 DB에서 채움)
+    Redis를 사용할 수 없으면 None
+    """
+    posting_keys = [tag_filter.TAG_TRACKS_KEY.format(tag_id=tag_id) for tag_id in tag_ids]
+    dest_key = tag_filter.filter_key(tag_ids, match_all)
+    # 처음 조회에서 없는 집합을 채우고 한 번 더 조회
+    for _ in range(2):
+        page = await cache_set_combine_page(
+            dest_key, posting_keys, union=not match_all,
+            ttl=settings.TAG_FILTER_TTL, offset=skip, count=limit,
+        )
+        if page is None:
+            return None
+        track_ids, missing = page
+        if not missing:
+            return track_ids
+        for i, generation in missing.items():
+            members = (await db.execute(
+                select(models.TrackTag.track_id).where(models.TrackTag.tag_id == tag_ids[i])
+            )).scalars().all()
+            # 조회 중에 태그가 새로 붙었으면 채우지 않고 DB 결과로 응답
+            if not await cache_set_fill(
+                posting_keys[i], members, ttl=settings.TAG_POSTING_TTL, generation=generation
+            ):
+                return None
+    # 카운터가 어긋나 트랙 없는 태그가 남은 경우
+    return None
+
+
+async def get_tracks_by_tags(
+    db: AsyncSession,
+    names: Iterable[str],
+    match_all: bool = True,
+    skip: int = 0,
+    limit: int = 100,
+) -> List[models.Track]:
+    """
+    태그로 트랙 필터링, 최신순(id 역순)
+    match_all이면 모든 태그가 붙은 트랙(AND), 아니면 하나 이상 붙은 트랙(OR)
+
+    태그의 track_count로 트랙이 없는 태그를 미리 걸러, 모든 태그가 필요한데 없는 태그가
+    있으면 Redis/DB 조회 없이 빈 목록을 반환합니다.
+    """
+    names = tag_filter.normalize_tag_names(names)
+    if not names:
+        return []
+    tags = (await db.execute(
+        select(models.Tag.id, models.Tag.track_count)
+        .where(models.Tag.name.in_(names), models.Tag.track_count > 0)
+    )).all()
+    if not tags or (match_all and len(tags) < len(names)):
+        return []
+
+    tag_ids = [tag.id for tag in tags]
+    track_ids = await _tag_filter_page(db, tag_ids, match_all, skip, limit)
+    if track_ids is None:
+        track_ids = (await db.execute(
+            tag_filter.tagged_track_ids(tag_ids, match_all).offset(skip).limit(limit)
+        )).scalars().all()
+    if not track_ids:
+        return []
+
+    result = await db.execute(
+        select(models.Track)
+        .options(joinedload(models.Track.owner))
+        .where(models.Track.id.in_(track_ids))
+        .order_by(desc(models.Track.id))
+    )
+    return result.scalars().all()
+
+
+# Like CRUD
+async def _update_track_counts(db: AsyncSession, track_id: int, **deltas: int) -> None:
+    """
+    트랙 카운터(like_count/comment_count/play_count)를 UPDATE 한 번으로 갱신합니다.
+    쓰기와 같은 트랜잭션에서 count = count + delta로 더하므로 동시 요청에도 유실되지 않습니다.
+    """
+    track = models.Track
+    await db.execute(
+        update(track)
+        .where(track.id == track_id)
+        .values({getattr(track, name): getattr(track, name) + delta for name, delta in deltas.items()})
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def create_like(db: AsyncSession, track_id: int, user_id: int) -> models.Like:
+    """좋아요 추가"""
+    db_like = models.Like(track_id=track_id, user_id=user_id)
+    db.add(db_like)
+    await db.flush()
+    await _update_track_counts(db, track_id, like_count=1)
+    await _commit(db, f"track:{track_id}:likes")
+    return db_like
+
+
+async def delete_like(db: AsyncSession, track_id: int, user_id: int) -> bool:
+    """좋아요 삭제 (DELETE ... RETURNING 한 번으로 존재 확인과 삭제)"""
+    removed = (await db.execute(
+        delete(models.Like)
+        .where(models.Like.track_id == track_id, models.Like.user_id == user_id)
+        .returning(models.Like.track_id)
+        .execution_options(synchronize_session=False)
+    )).first()
+
+    if removed is not None:
+        await _update_track_counts(db, track_id, like_count=-1)
+        await _commit(db, f"track:{track_id}:likes")
+        return True
+    return False
+
+
+async def toggle_like(db: AsyncSession, track_id: int, user_id: int) -> Optional[Tuple[bool, int]]:
+    """
+    좋아요 토글 (있으면 삭제, 없으면 추가)
+
+    DELETE ... RETURNING으로 취소를 먼저 시도하고, 지운 행이 없으면
+    INSERT ... ON CONFLICT DO NOTHING RETURNING으로 추가합니다. 트랙 존재 여부는
+    미리 조회하지 않고 FK 오류로 판단하며, 카운터는 UPDATE ... RETURNING으로 갱신과
+    동시에 읽습니다. 연속 클릭으로 같은 요청이 동시에 들어와도 IntegrityError 없이
+    한쪽만 추가됩니다.
+
+    Returns:
+        (좋아요 여부, 좋아요 수) 또는 트랙이 없으면 None
+    """
+    removed = (await db.execute(
+        delete(models.Like)
+        .where(models.Like.track_id == track_id, models.Like.user_id == user_id)
+        .returning(models.Like.track_id)
+        .execution_options(synchronize_session=False)
+    )).first()
+
+    if removed is not None:
+        is_liked, delta = False, -1
+    else:
+        try:
+            async with _savepoint(db):
+                inserted = (await db.execute(
+                    _insert(db, models.Like)
+                    .values(track_id=track_id, user_id=user_id)
+                    .on_conflict_do_nothing()
+                    .returning(models.Like.track_id)
+                )).first()
+        except IntegrityError:
+            # 중복은 ON CONFLICT로 무시되므로 남은 무결성 오류는 트랙 FK 위반
+            return None
+        # 동시 요청이 먼저 추가했다면 카운터는 그대로
+        is_liked, delta = True, 1 if inserted is not None else 0
+
+    like_count = (await db.execute(
+        update(models.Track)
+        .where(models.Track.id == track_id)
+        .values(like_count=models.Track.like_count + delta)
+        .returning(models.Track.like_count)
+        .execution_options(synchronize_session=False)
+    )).scalar_one_or_none()
+    if like_count is None:
+        # 그 사이 트랙이 삭제됨
+        return None
+    await _commit(db, *([f"track:{track_id}:likes"] if delta else []))
+    return is_liked, like_count
+
+
+async def get_like(db: AsyncSession, track_id: int, user_id: int) -> Optional[models.Like]:
+    """특정 좋아요 조회"""
+    result = await db.execute(
+        select(models.Like).where(
+            models.Like.track_id == track_id,
+            models.Like.user_id == user_id
+        )
+    )
+    return result.scalars().first()
+
+
+@cached(
+    Tuple[List[schemas.Like], Optional[Cursor]],
+    tags=["track:{track_id}:likes"],
+    result_tags=lambda page: _user_tags(page[0], "user_id"),
+    ttl=settings.CACHE_TTL_LIST,
+)
+async def get_track_likes(
+    db: AsyncSession,
+    track_id: int,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[Cursor] = None,
+) -> Tuple[List[schemas.Like], Optional[Cursor]]:
+    """트랙의 좋아요 목록 (최신순), (목록, 다음 페이지 커서) 반환"""
+    return await _paginate(
+        db,
+        select(models.Like)
+        .options(joinedload(models.Like.user))
+        .where(models.Like.track_id == track_id),
+        models.Like.created_at, models.Like.user_id,
+        skip, limit, cursor,
+    )
+
+
+async def get_user_likes(db: AsyncSession, user_id: int, skip: int = 0, limit: int = 100) -> List[models.Like]:
+    """사용자가 좋아요한 목록"""
+    result = await db.execute(
+        select(models.Like)
+        .where(models.Like.user_id == user_id)
+        .offset(skip).limit(limit)
+    )
+    return result.scalars().all()
+
+
+async def get_user_liked_tracks(
+    db: AsyncSession,
+    user_id: int,
+    skip: int = 0,
+    limit: int = 50,
+    cursor: Optional[Cursor] = None,
+) -> Tuple[List[models.Track], Optional[Cursor]]:
+    """
+    사용자가 좋아요한 트랙 목록 (좋아요 최신순, 재생 가능한 트랙만)
+    likes -> tracks -> user_profiles를 한 쿼리로 조인합니다.
+
+    Returns:
+        (트랙 목록, 다음 페이지 커서 또는 None)
+    """
+    return await _paginate(
+        db,
+        select(models.Track)
+        .join(models.Like, models.Like.track_id == models.Track.id)
+        .options(joinedload(models.Track.owner))
+        .where(
+            models.Like.user_id == user_id,
+            models.Track.status == models.TrackStatus.ready,
+        ),
+        models.Like.created_at, models.Like.track_id,
+        skip, limit, cursor,
+    )
+
+
+@cached(int, tags=["track:{track_id}:likes"], ttl=settings.CACHE_TTL_LIST)
+async def get_track_like_count(db: AsyncSession, track_id: int) -> int:
+    """트랙의 총 좋아요 수 (카운터 컬럼)"""
+    result = await db.execute(
+        select(models.Track.like_count).where(models.Track.id == track_id)
+    )
+    return result.scalar_one_or_none() or 0
+
+
+# Comment CRUD
+async def create_comment(db: AsyncSession, comment: schemas.CommentCreate, user_id: int) -> models.Comment:
+    """댓글 작성"""
+    db_comment = models.Comment(
+        content=comment.content,
+        track_id=comment.track_id,
+        user_id=user_id
+    )
+    db.add(db_comment)
+    await db.flush()
+    await _update_track_counts(db, comment.track_id, comment_count=1)
+    await _commit(db, f"track:{comment.track_id}:comments")
+    await _load(db, db_comment, "user")
+    return db_comment
+
+
+async def get_comment(db: AsyncSession, comment_id: int) -> Optional[models.Comment]:
+    """댓글 조회"""
+    result = await db.execute(
+        select(models.Comment)
+        .options(joinedload(models.Comment.user))
+        .where(models.Comment.id == comment_id)
+    )
+    return result.scalars().first()
+
+
+@cached(
+    Tuple[List[schemas.Comment], Optional[Cursor]],
+    tags=["track:{track_id}:comments"],
+    result_tags=lambda page: _user_tags(page[0], "user_id"),
+    ttl=settings.CACHE_TTL_LIST,
+)
+async def get_track_comments(
+    db: AsyncSession,
+    track_id: int,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[Cursor] = None,
+) -> Tuple[List[schemas.Comment], Optional[Cursor]]:
+    """트랙의 댓글 목록 (최신순), (목록, 다음 페이지 커서) 반환"""
+    return await _paginate(
+        db,
+        select(models.Comment)
+        .options(joinedload(models.Comment.user))
+        .where(models.Comment.track_id == track_id),
+        models.Comment.created_at, models.Comment.id,
+        skip, limit, cursor,
+    )
+
+
+async def update_comment(db: AsyncSession, comment: models.Comment, content: str) -> models.Comment:
+    """댓글 수정 (수정 시각은 UPDATE ... RETURNING으로 받아옴)"""
+    updated_at = (await db.execute(
+        update(models.Comment)
+        .where(models.Comment.id == comment.id)
+        .values(content=content)
+        .returning(models.Comment.updated_at)
+        .execution_options(synchronize_session=False)
+    )).scalar_one()
+    set_committed_value(comment, "content", content)
+    set_committed_value(comment, "updated_at", updated_at)
+    await _commit(db, f"track:{comment.track_id}:comments")
+    return comment
+
+
+async def delete_comment(db: AsyncSession, comment: models.Comment) -> bool:
+    """댓글 삭제"""
+    await db.delete(comment)
+    await db.flush()
+    await _update_track_counts(db, comment.track_id, comment_count=-1)
+    await _commit(db, f"track:{comment.track_id}:comments")
+    return True
+
+
+@cached(int, tags=["track:{track_id}:comments"], ttl=settings.CACHE_TTL_LIST)
+async def get_track_comment_count(db: AsyncSession, track_id: int) -> int:
+    """트랙의 총 댓글 수 (카운터 컬럼)"""
+    result = await db.execute(
+        select(models.Track.comment_count).where(models.Track.id == track_id)
+    )
+    return result.scalar_one_or_none() or 0
+
+
+# Follow CRUD
+def _follow_tags(follower_id: int, following_id: int) -> List[str]:
+    return [f"user:{following_id}:followers", f"user:{follower_id}:following"]
+
+
+async def _update_follow_counts(
+    db: AsyncSession, follower_id: int, following_id: int, delta: int
+) -> Optional[Tuple[int, int]]:
+    """
+    팔로워/팔로잉 카운터를 UPDATE 한 번으로 갱신합니다 (팔로우 변경과 같은 트랜잭션).
+    count = count + delta 형태라 동시에 들어온 요청끼리도 값이 유실되지 않습니다.
+
+    Returns:
+        (대상 사용자의 팔로워 수, 팔로우한 사용자의 팔로잉 수), 어느 한쪽이 없으면 None
+    """
+    profile = models.UserProfile
+    rows = (await db.execute(
+        update(profile)
+        .where(profile.id.in_([follower_id, following_id]))
+        .values(
+            follower_count=profile.follower_count + case((profile.id == following_id, delta), else_=0),
+            following_count=profile.following_count + case((profile.id == follower_id, delta), else_=0),
+        )
+        .returning(profile.id, profile.follower_count, profile.following_count)
+        .execution_options(synchronize_session=False)
+    )).all()
+    counts = {row.id: row for row in rows}
+    if following_id not in counts or follower_id not in counts:
+        return None
+    return counts[following_id].follower_count, counts[follower_id].following_count
+
+
+async def create_follow(db: AsyncSession, follower_id: int, following_id: int) -> models.Follow:
+    """팔로우 추가"""
+    db_follow = models.Follow(follower_id=follower_id, following_id=following_id)
+    db.add(db_follow)
+    await db.flush()
+    await _update_follow_counts(db, follower_id, following_id, 1)
+    await _commit(db, *_follow_tags(follower_id, following_id))
+    return db_follow
+
+
+async def delete_follow(db: AsyncSession, follower_id: int, following_id: int) -> bool:
+    """언팔로우 (DELETE ... RETURNING 한 번으로 존재 확인과 삭제)"""
+    removed = (await db.execute(
+        delete(models.Follow)
+        .where(models.Follow.follower_id == follower_id, models.Follow.following_id == following_id)
+        .returning(models.Follow.following_id)
+        .execution_options(synchronize_session=False)
+    )).first()
+
+    if removed is not None:
+        await _update_follow_counts(db, follower_id, following_id, -1)
+        await _commit(db, *_follow_tags(follower_id, following_id))
+        return True
+    return False
+
+
+async def toggle_follow(
+    db: AsyncSession, follower_id: int, following_id: int
+) -> Optional[Tuple[bool, int, int]]:
+    """
+    팔로우 토글 (있으면 언팔로우, 없으면 팔로우)
+    toggle_like와 같은 방식으로 대상 사용자 존재 여부를 FK 오류로 판단합니다.
+
+    Returns:
+        (팔로우 여부, 대상의 팔로워 수, 내 팔로잉 수) 또는 대상 사용자가 없으면 None
+    """
+    removed = (await db.execute(
+        delete(models.Follow)
+        .where(models.Follow.follower_id == follower_id, models.Follow.following_id == following_id)
+        .returning(models.Follow.following_id)
+        .execution_options(synchronize_session=False)
+    )).first()
+
+    if removed is not None:
+        is_following, delta = False, -1
+    else:
+        try:
+            async with _savepoint(db):
+                inserted = (await db.execute(
+                    _insert(db, models.Follow)
+                    .values(follower_id=follower_id, following_id=following_id)
+                    .on_conflict_do_nothing()
+                    .returning(models.Follow.following_id)
+                )).first()
+        except IntegrityError:
+            return None
+        is_following, delta = True, 1 if inserted is not None else 0
+
+    counts = await _update_follow_counts(db, follower_id, following_id, delta)
+    if counts is None:
+        # 그 사이 사용자가 삭제됨
+        return None
+    follower_count, following_count = counts
+    await _commit(db, *(_follow_tags(follower_id, following_id) if delta else []))
+    return is_following, follower_count, following_count
+
+
+async def get_follow(db: AsyncSession, follower_id: int, following_id: int) -> Optional[models.Follow]:
+    """팔로우 관계 조회"""
+    result = await db.execute(
+        select(models.Follow).where(
+            models.Follow.follower_id == follower_id,
+            models.Follow.following_id == following_id
+        )
+    )
+    return result.scalars().first()
+
+
+async def _get_follow_page(
+    db: AsyncSession,
+    user_id: int,
+    total_column,
+    profile_column,
+    owner_column,
+    limit: int,
+    cursor: Optional[Cursor],
+    skip: int,
+) -> Optional[dict]:
+    """
+    팔로우 목록 한 페이지 (팔로우 최신순)
+
+    사용자 존재 확인과 총 개수는 user_profiles의 카운터 컬럼 조회 한 번으로,
+    목록은 follows와 user_profiles를 조인한 쿼리 한 번으로 가져옵니다.
+
+    Args:
+        total_column: 총 개수 카운터 (UserProfile.follower_count 등)
+        profile_column: 목록에 나올 사용자 FK (Follow.follower_id 등)
+        owner_column: 조회 대상 사용자 FK (Follow.following_id 등)
+
+    Returns:
+        {"users", "total", "next_cursor"} 또는 사용자가 없으면 None
+    """
+    total = (await db.execute(
+        select(total_column).where(models.UserProfile.id == user_id)
+    )).scalar_one_or_none()
+    if total is None:
+        return None
+
+    users, next_cursor = await _paginate(
+        db,
+        select(models.UserProfile)
+        .join(models.Follow, profile_column == models.UserProfile.id)
+        .where(owner_column == user_id),
+        models.Follow.created_at, profile_column,
+        skip, limit, cursor,
+    )
+    return {
+        "users": users,
+        "total": total,
+        "next_cursor": encode_cursor(next_cursor),
+    }
+
+
+@cached(
+    schemas.FollowListResponse,
+    tags=["user:{user_id}:followers"],
+    result_tags=lambda page: _user_tags(page.users),
+    ttl=settings.CACHE_TTL_LIST,
+)
+async def get_followers(
+    db: AsyncSession,
+    user_id: int,
+    limit: int = 100,
+    cursor: Optional[Cursor] = None,
+    skip: int = 0,
+) -> Optional[schemas.FollowListResponse]:
+    """팔로워 목록 (나를 팔로우하는 사람들), 사용자가 없으면 None"""
+    return await _get_follow_page(
+        db, user_id,
+        total_column=models.UserProfile.follower_count,
+        profile_column=models.Follow.follower_id,
+        owner_column=models.Follow.following_id,
+        limit=limit, cursor=cursor, skip=skip,
+    )
+
+
+@cached(
+    schemas.FollowListResponse,
+    tags=["user:{user_id}:following"],
+    result_tags=lambda page: _user_tags(page.users),
+    ttl=settings.CACHE_TTL_LIST,
+)
+async def get_following(
+    db: AsyncSession,
+    user_id: int,
+    limit: int = 100,
+    cursor: Optional[Cursor] = None,
+    skip: int = 0,
+) -> Optional[schemas.FollowListResponse]:
+    """팔로잉 목록 (내가 팔로우하는 사람들), 사용자가 없으면 None"""
+    return await _get_follow_page(
+        db, user_id,
+        total_column=models.UserProfile.following_count,
+        profile_column=models.Follow.following_id,
+        owner_column=models.Follow.follower_id,
+        limit=limit, cursor=cursor, skip=skip,
+    )
+
+
+@cached(int, tags=["user:{user_id}:followers"], ttl=settings.CACHE_TTL_LIST)
+async def get_follower_count(db: AsyncSession, user_id: int) -> int:
+    """팔로워 수 (카운터 컬럼)"""
+    result = await db.execute(
+        select(models.UserProfile.follower_count).where(models.UserProfile.id == user_id)
+    )
+    return result.scalar_one_or_none() or 0
+
+
+@cached(int, tags=["user:{user_id}:following"], ttl=settings.CACHE_TTL_LIST)
+async def get_following_count(db: AsyncSession, user_id: int) -> int:
+    """팔로잉 수 (카운터 컬럼)"""
+    result = await db.execute(
+        select(models.UserProfile.following_count).where(models.UserProfile.id == user_id)
+    )
+    return result.scalar_one_or_none() or 0
+
+
+# Playlist CRUD
+async def create_playlist(db: AsyncSession, playlist: schemas.PlaylistCreate, owner_id: int) -> models.Playlist:
+    """플레이리스트 생성"""
+    db_playlist = models.Playlist(
+        name=playlist.name,
+        description=playlist.description,
+        is_public=playlist.is_public,
+        owner_user_id=owner_id,
+        # 새 플레이리스트의 트랙 목록은 비어 있으므로 조회하지 않음
+        tracks=[]
+    )
+    db.add(db_playlist)
+    await _commit(db)
+    await _load(db, db_playlist, "owner")
+    return db_playlist
+
+
+async def get_playlist(db: AsyncSession, playlist_id: int) -> Optional[models.Playlist]:
+    """플레이리스트 조회"""
+    result = await db.execute(
+        select(models.Playlist)
+        .options(joinedload(models.Playlist.owner))
+        .where(models.Playlist.id == playlist_id)
+    )
+    return result.scalars().first()
+
+
+@cached(
+    schemas.Playlist,
+    key="playlist:{playlist_id}",
+    tags=["playlist:{playlist_id}"],
+    result_tags=lambda playlist: _user_tags([playlist], "owner_user_id"),
+    ttl=settings.CACHE_TTL_PLAYLIST,
+)
+async def get_playlist_cached(db: AsyncSession, playlist_id: int) -> Optional[schemas.Playlist]:
+    """플레이리스트 조회 (2단계 캐시 사용)"""
+    return await get_playlist(db, playlist_id=playlist_id)
+
+
+async def get_user_playlists(
+    db: AsyncSession,
+    user_id: int,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[Cursor] = None,
+    include_private: bool = True,
+) -> Tuple[List[models.Playlist], Optional[Cursor]]:
+    """
+    사용자의 플레이리스트 목록 (최신순), (목록, 다음 페이지 커서) 반환
+    include_private가 False면 공개 플레이리스트만 (페이지 크기가 유지되도록 SQL에서 필터링)
+    """
+    query = (
+        select(models.Playlist)
+        .options(joinedload(models.Playlist.owner))
+        .where(models.Playlist.owner_user_id == user_id)
+    )
+    if not include_private:
+        query = query.where(models.Playlist.is_public.is_(True))
+    return await _paginate(db, query, models.Playlist.created_at, models.Playlist.id, skip, limit, cursor)
+
+
+async def update_playlist(db: AsyncSession, playlist: models.Playlist, update_data: dict) -> models.Playlist:
+    """플레이리스트 수정"""
+    for field, value in update_data.items():
+        setattr(playlist, field, value)
+    await _commit(db, f"playlist:{playlist.id}")
+    return playlist
+
+
+async def delete_playlist(db: AsyncSession, playlist: models.Playlist) -> bool:
+    """플레이리스트 삭제"""
+    # cascade 삭제 대상(PlaylistTrack)을 미리 로딩
+    await db.refresh(playlist, attribute_names=["tracks"])
+    await db.delete(playlist)
+    await _commit(db, f"playlist:{playlist.id}", f"playlist:{playlist.id}:tracks")
+    return True
+
+
+async def add_track_to_playlist(db: AsyncSession, playlist_id: int, track_id: int) -> models.PlaylistTrack:
+    """
+    플레이리스트에 트랙 추가
+    다음 순서(현재 최대 순서 + 1)를 서브쿼리로 계산해 INSERT ... RETURNING 한 번으로 추가합니다.
+    이미 있는 트랙이면 IntegrityError를 그대로 올립니다 (unit_of_work 블록의 앞선 쓰기는 유지).
+    """
+    next_order = (
+        select(func.coalesce(func.max(models.PlaylistTrack.track_order), -1) + 1)
+        .where(models.PlaylistTrack.playlist_id == playlist_id)
+        .scalar_subquery()
+    )
+    async with _savepoint(db):
+        db_playlist_track = (await db.execute(
+            insert(models.PlaylistTrack)
+            .values(playlist_id=playlist_id, track_id=track_id, track_order=next_order)
+            .returning(models.PlaylistTrack)
+        )).scalar_one()
+    await _commit(db, f"playlist:{playlist_id}:tracks")
+    return db_playlist_track
+
+
+async def remove_track_from_playlist(db: AsyncSession, playlist_id: int, track_id: int) -> bool:
+    """플레이리스트에서 트랙 삭제 (DELETE ... RETURNING 한 번으로 존재 확인과 삭제)"""
+    removed = (await db.execute(
+        delete(models.PlaylistTrack)
+        .where(
+            models.PlaylistTrack.playlist_id == playlist_id,
+            models.PlaylistTrack.track_id == track_id
+        )
+        .returning(models.PlaylistTrack.track_id)
+        .execution_options(synchronize_session=False)
+    )).first()
+
+    if removed is not None:
+        await _commit(db, f"playlist:{playlist_id}:tracks")
+        return True
+    return False
+
+
+@cached(
+    List[schemas.Track],
+    tags=["playlist:{playlist_id}:tracks"],
+    result_tags=_track_tags,
+    ttl=settings.CACHE_TTL_LIST,
+    stampede=True,
+)
+async def get_playlist_tracks(
+    db: AsyncSession,
+    playlist_id: int,
+    offset: int = 0,
+    limit: Optional[int] = None,
+) -> List[schemas.Track]:
+    """
+    플레이리스트의 트랙 목록 (순서대로)
+    트랙과 트랙 소유자를 한 쿼리로 가져오므로 트랙 수와 관계없이 쿼리는 1회입니다.
+    limit을 주면 offset부터 limit개만 가져옵니다 (큰 플레이리스트 페이지네이션).
+    """
+    query = (
+        select(models.Track)
+        .join(models.PlaylistTrack, models.PlaylistTrack.track_id == models.Track.id)
+        .options(joinedload(models.Track.owner))
+        .where(models.PlaylistTrack.playlist_id == playlist_id)
+        .order_by(models.PlaylistTrack.track_order, models.PlaylistTrack.track_id)
+        .offset(offset)
+    )
+    if limit is not None:
+        query = query.limit(limit)
+    result = await db.execute(query)
+    return result.scalars().all()
+
+
+@cached(int, tags=["playlist:{playlist_id}:tracks"], ttl=settings.CACHE_TTL_LIST)
+async def get_playlist_track_count(db: AsyncSession, playlist_id: int) -> int:
+    """플레이리스트의 트랙 수"""
+    result = await db.execute(
+        select(func.count()).select_from(models.PlaylistTrack)
+        .where(models.PlaylistTrack.playlist_id == playlist_id)
+    )
+    return result.scalar_one()
+
+
+async def reorder_playlist_track(db: AsyncSession, playlist_id: int, track_id: int, new_order: int) -> bool:
+    """플레이리스트 트랙 순서 변경 (UPDATE ... RETURNING 한 번으로 존재 확인과 변경)"""
+    updated = (await db.execute(
+        update(models.PlaylistTrack)
+        .where(
+            models.PlaylistTrack.playlist_id == playlist_id,
+            models.PlaylistTrack.track_id == track_id
+        )
+        .values(track_order=new_order)
+        .returning(models.PlaylistTrack.track_id)
+        .execution_options(synchronize_session=False)
+    )).first()
+
+    if updated is not None:
+        await _commit(db, f"playlist:{playlist_id}:tracks")
+        return True
+    return False
+
+
+# PlayHistory CRUD
+async def create_play_history(db: AsyncSession, user_id: int, track_id: int) -> models.PlayHistory:
+    """재생 기록 생성"""
+    db_play_history = models.PlayHistory(
+        user_id=user_id,
+        track_id=track_id
+    )
+    db.add(db_play_history)
+    await db.flush()
+    await _update_track_counts(db, track_id, play_count=1)
+    await _commit(db)
+    return db_play_history
+
+
+async def get_user_play_history(
+    db: AsyncSession,
+    user_id: int,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[Cursor] = None,
+) -> Tuple[List[models.PlayHistory], Optional[Cursor]]:
+    """사용자의 재생 기록 (최신순), (목록, 다음 페이지 커서) 반환"""
+    return await _paginate(
+        db,
+        select(models.PlayHistory)
+        .options(joinedload(models.PlayHistory.track).joinedload(models.Track.owner))
+        .where(models.PlayHistory.user_id == user_id),
+        models.PlayHistory.played_at, models.PlayHistory.id,
+        skip, limit, cursor,
+    )
+
+
+async def get_recently_played_tracks(db: AsyncSession, user_id: int, limit: int = 50) -> List[models.Track]:
+    """최근 재생한 트랙 목록 (중복 제거, 마지막 재생 시각 최신순)"""
+    # 트랙별 마지막 재생 시각 (중복 제거)
+    last_played = (
+        select(
+            models.PlayHistory.track_id,
+            func.max(models.PlayHistory.played_at).label("last_played_at"),
+        )
+        .where(models.PlayHistory.user_id == user_id)
+        .group_by(models.PlayHistory.track_id)
+        .subquery()
+    )
+
+    # 트랙과 소유자를 한 쿼리로 가져오기
+    result = await db.execute(
+        select(models.Track)
+        .join(last_played, last_played.c.track_id == models.Track.id)
+        .options(joinedload(models.Track.owner))
+        .order_by(desc(last_played.c.last_played_at), desc(models.Track.id))
+        .limit(limit)
+    )
+    return result.scalars().all()
+
+
+async def get_play_count(db: AsyncSession, track_id: int) -> int:
+    """트랙의 총 재생 수 (카운터 컬럼)"""
+    result = await db.execute(
+        select(models.Track.play_count).where(models.Track.id == track_id)
+    )
+    return result.scalar_one_or_none() or 0
@@ -1,8 +1,9 @@
-from sqlalchemy.orm import Session
-from sqlalchemy import func, desc
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import func, desc, select, update
+from app.crud import track_search
 from app.models import models
 from app.schemas import schemas
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 # UserProfile CRUD
 def get_user_profile(db: Session, user_id: int):
@@ -25,19 +26,21 @@ def create_user_profile(db: Session, user: schemas.UserProfileCreate):
 
 # Track CRUD
 def get_track(db: Session, track_id: int):
-    return db.query(models.Track).filter(models.Track.id == track_id).first()
+    return db.query(models.Track).options(joinedload(models.Track.owner)).filter(models.Track.id == track_id).first()
 
 def get_tracks(db: Session, skip: int = 0, limit: int = 100):
-    return db.query(models.Track).offset(skip).limit(limit).all()
+    return db.query(models.Track).options(joinedload(models.Track.owner)).offset(skip).limit(limit).all()
 
 def search_tracks(db: Session, query: str, skip: int = 0, limit: int = 100):
-    """트랙 검색 (제목, 아티스트, 설명)"""
-    search_query = f"%{query}%"
-    return db.query(models.Track).filter(
-        (models.Track.title.ilike(search_query)) |
-        (models.Track.artist_name.ilike(search_query)) |
-        (models.Track.description.ilike(search_query))
-    ).offset(skip).limit(limit).all()
+    """트랙 전문 검색 (제목, 아티스트, 설명), 관련도 순"""
+    terms = track_search.search_terms(query)
+    if not terms:
+        return []
+    return db.execute(
+        track_search.ranked_search(db.get_bind().dialect.name, terms)
+        .options(joinedload(models.Track.owner))
+        .offset(skip).limit(limit)
+    ).scalars().all()
 
 def create_track(db: Session, track: schemas.TrackCreate, owner_id: int):
     db_track = models.Track(**track.dict(), owner_user_id=owner_id)
@@ -63,10 +66,20 @@ def update_track(db: Session, track_id: int, track_update: schemas.TrackUpdate):
 
 
 # Like CRUD
+def _update_track_counts(db: Session, track_id: int, **deltas: int) -> None:
+    """트랙 카운터 갱신 (좋아요/댓글/재생 기록 변경과 같은 트랜잭션)"""
+    db.query(models.Track).filter(models.Track.id == track_id).update(
+        {getattr(models.Track, name): getattr(models.Track, name) + delta for name, delta in deltas.items()},
+        synchronize_session=False
+    )
+
+
 def create_like(db: Session, track_id: int, user_id: int) -> models.Like:
     """좋아요 추가"""
     db_like = models.Like(track_id=track_id, user_id=user_id)
     db.add(db_like)
+    db.flush()
+    _update_track_counts(db, track_id, like_count=1)
     db.commit()
     db.refresh(db_like)
     return db_like
@@ -81,6 +94,8 @@ def delete_like(db: Session, track_id: int, user_id: int) -> bool:
     
     if db_like:
         db.delete(db_like)
+        db.flush()
+        _update_track_counts(db, track_id, like_count=-1)
         db.commit()
         return True
     return False
@@ -96,7 +111,7 @@ def get_like(db: Session, track_id: int, user_id: int) -> Optional[models.Like]:
 
 def get_track_likes(db: Session, track_id: int, skip: int = 0, limit: int = 100) -> List[models.Like]:
     """트랙의 좋아요 목록"""
-    return db.query(models.Like).filter(
+    return db.query(models.Like).options(joinedload(models.Like.user)).filter(
         models.Like.track_id == track_id
     ).offset(skip).limit(limit).all()
 
@@ -109,8 +124,8 @@ def get_user_likes(db: Session, user_id: int, skip: int = 0, limit: int = 100) -
 
 
 def get_track_like_count(db: Session, track_id: int) -> int:
-    """트랙의 총 좋아요 수"""
-    return db.query(models.Like).filter(models.Like.track_id == track_id).count()
+    """트랙의 총 좋아요 수 (카운터 컬럼)"""
+    return db.query(models.Track.like_count).filter(models.Track.id == track_id).scalar() or 0
 
 
 # Comment CRUD
@@ -122,6 +137,8 @@ def create_comment(db: Session, comment: schemas.CommentCreate, user_id: int) ->
         user_id=user_id
     )
     db.add(db_comment)
+    db.flush()
+    _update_track_counts(db, comment.track_id, comment_count=1)
     db.commit()
     db.refresh(db_comment)
     return db_comment
@@ -129,12 +146,12 @@ def create_comment(db: Session, comment: schemas.CommentCreate, user_id: int) ->
 
 def get_comment(db: Session, comment_id: int) -> Optional[models.Comment]:
     """댓글 조회"""
-    return db.query(models.Comment).filter(models.Comment.id == comment_id).first()
+    return db.query(models.Comment).options(joinedload(models.Comment.user)).filter(models.Comment.id == comment_id).first()
 
 
 def get_track_comments(db: Session, track_id: int, skip: int = 0, limit: int = 100) -> List[models.Comment]:
     """트랙의 댓글 목록 (최신순)"""
-    return db.query(models.Comment).filter(
+    return db.query(models.Comment).options(joinedload(models.Comment.user)).filter(
         models.Comment.track_id == track_id
     ).order_by(desc(models.Comment.created_at)).offset(skip).limit(limit).all()
 
@@ -150,20 +167,36 @@ def update_comment(db: Session, comment: models.Comment, content: str) -> models
 def delete_comment(db: Session, comment: models.Comment) -> bool:
     """댓글 삭제"""
     db.delete(comment)
+    db.flush()
+    _update_track_counts(db, comment.track_id, comment_count=-1)
     db.commit()
     return True
 
 
 def get_track_comment_count(db: Session, track_id: int) -> int:
-    """트랙의 총 댓글 수"""
-    return db.query(models.Comment).filter(models.Comment.track_id == track_id).count()
+    """트랙의 총 댓글 수 (카운터 컬럼)"""
+    return db.query(models.Track.comment_count).filter(models.Track.id == track_id).scalar() or 0
 
 
 # Follow CRUD
+def _update_follow_counts(db: Session, follower_id: int, following_id: int, delta: int) -> None:
+    """팔로워/팔로잉 카운터 갱신 (팔로우 변경과 같은 트랜잭션)"""
+    db.query(models.UserProfile).filter(models.UserProfile.id == following_id).update(
+        {models.UserProfile.follower_count: models.UserProfile.follower_count + delta},
+        synchronize_session=False
+    )
+    db.query(models.UserProfile).filter(models.UserProfile.id == follower_id).update(
+        {models.UserProfile.following_count: models.UserProfile.following_count + delta},
+        synchronize_session=False
+    )
+
+
 def create_follow(db: Session, follower_id: int, following_id: int) -> models.Follow:
     """팔로우 추가"""
     db_follow = models.Follow(follower_id=follower_id, following_id=following_id)
     db.add(db_follow)
+    db.flush()
+    _update_follow_counts(db, follower_id, following_id, 1)
     db.commit()
     db.refresh(db_follow)
     return db_follow
@@ -178,6 +211,8 @@ def delete_follow(db: Session, follower_id: int, following_id: int) -> bool:
     
     if db_follow:
         db.delete(db_follow)
+        db.flush()
+        _update_follow_counts(db, follower_id, following_id, -1)
         db.commit()
         return True
     return False
@@ -193,7 +228,7 @@ def get_follow(db: Session, follower_id: int, following_id: int) -> Optional[mod
 
 def get_followers(db: Session, user_id: int, skip: int = 0, limit: int = 100) -> List[models.UserProfile]:
     """팔로워 목록 (나를 팔로우하는 사람들)"""
-    follows = db.query(models.Follow).filter(
+    follows = db.query(models.Follow).options(joinedload(models.Follow.follower)).filter(
         models.Follow.following_id == user_id
     ).offset(skip).limit(limit).all()
     
@@ -203,7 +238,7 @@ def get_followers(db: Session, user_id: int, skip: int = 0, limit: int = 100) ->
 
 def get_following(db: Session, user_id: int, skip: int = 0, limit: int = 100) -> List[models.UserProfile]:
     """팔로잉 목록 (내가 팔로우하는 사람들)"""
-    follows = db.query(models.Follow).filter(
+    follows = db.query(models.Follow).options(joinedload(models.Follow.following)).filter(
         models.Follow.follower_id == user_id
     ).offset(skip).limit(limit).all()
     
@@ -212,13 +247,13 @@ def get_following(db: Session, user_id: int, skip: int = 0, limit: int = 100) ->
 
 
 def get_follower_count(db: Session, user_id: int) -> int:
-    """팔로워 수"""
-    return db.query(models.Follow).filter(models.Follow.following_id == user_id).count()
+    """팔로워 수 (카운터 컬럼)"""
+    return db.query(models.UserProfile.follower_count).filter(models.UserProfile.id == user_id).scalar() or 0
 
 
 def get_following_count(db: Session, user_id: int) -> int:
-    """팔로잉 수"""
-    return db.query(models.Follow).filter(models.Follow.follower_id == user_id).count()
+    """팔로잉 수 (카운터 컬럼)"""
+    return db.query(models.UserProfile.following_count).filter(models.UserProfile.id == user_id).scalar() or 0
 
 
 # Playlist CRUD
@@ -238,12 +273,12 @@ def create_playlist(db: Session, playlist: schemas.PlaylistCreate, owner_id: int
 
 def get_playlist(db: Session, playlist_id: int) -> Optional[models.Playlist]:
     """플레이리스트 조회"""
-    return db.query(models.Playlist).filter(models.Playlist.id == playlist_id).first()
+    return db.query(models.Playlist).options(joinedload(models.Playlist.owner)).filter(models.Playlist.id == playlist_id).first()
 
 
 def get_user_playlists(db: Session, user_id: int, skip: int = 0, limit: int = 100) -> List[models.Playlist]:
     """사용자의 플레이리스트 목록"""
-    return db.query(models.Playlist).filter(
+    return db.query(models.Playlist).options(joinedload(models.Playlist.owner)).filter(
         models.Playlist.owner_user_id == user_id
     ).offset(skip).limit(limit).all()
 
@@ -300,7 +335,9 @@ def remove_track_from_playlist(db: Session, playlist_id: int, track_id: int) ->
 
 def get_playlist_tracks(db: Session, playlist_id: int) -> List[models.Track]:
     """플레이리스트의 트랙 목록 (순서대로)"""
-    playlist_tracks = db.query(models.PlaylistTrack).filter(
+    playlist_tracks = db.query(models.PlaylistTrack).options(
+        joinedload(models.PlaylistTrack.track).joinedload(models.Track.owner)
+    ).filter(
         models.PlaylistTrack.playlist_id == playlist_id
     ).order_by(models.PlaylistTrack.track_order).all()
     
@@ -336,6 +373,8 @@ def create_play_history(db: Session, user_id: int, track_id: int) -> models.Play
         track_id=track_id
     )
     db.add(db_play_history)
+    db.flush()
+    _update_track_counts(db, track_id, play_count=1)
     db.commit()
     db.refresh(db_play_history)
     return db_play_history
@@ -343,32 +382,73 @@ def create_play_history(db: Session, user_id: int, track_id: int) -> models.Play
 
 def get_user_play_history(db: Session, user_id: int, skip: int = 0, limit: int = 100) -> List[models.PlayHistory]:
     """사용자의 재생 기록 (최신순)"""
-    return db.query(models.PlayHistory).filter(
+    return db.query(models.PlayHistory).options(
+        joinedload(models.PlayHistory.track).joinedload(models.Track.owner)
+    ).filter(
         models.PlayHistory.user_id == user_id
     ).order_by(desc(models.PlayHistory.played_at)).offset(skip).limit(limit).all()
 
 
 def get_recently_played_tracks(db: Session, user_id: int, limit: int = 50) -> List[models.Track]:
-    """최근 재생한 트랙 목록 (중복 제거)"""
-    # 최근 재생 기록에서 트랙 ID만 가져오기 (중복 제거)
-    recent_track_ids = db.query(models.PlayHistory.track_id).filter(
+    """최근 재생한 트랙 목록 (중복 제거, 마지막 재생 시각 최신순)"""
+    # 트랙별 마지막 재생 시각 (중복 제거)
+    last_played = db.query(
+        models.PlayHistory.track_id,
+        func.max(models.PlayHistory.played_at).label("last_played_at")
+    ).filter(
         models.PlayHistory.user_id == user_id
-    ).order_by(desc(models.PlayHistory.played_at)).distinct().limit(limit).all()
+    ).group_by(models.PlayHistory.track_id).subquery()
     
-    track_ids = [track_id for (track_id,) in recent_track_ids]
-    
-    # 트랙 정보 가져오기
-    if not track_ids:
-        return []
-    
-    tracks = db.query(models.Track).filter(models.Track.id.in_(track_ids)).all()
-    
-    # 재생 순서대로 정렬
-    track_dict = {track.id: track for track in tracks}
-    return [track_dict[track_id] for track_id in track_ids if track_id in track_dict]
+    # 트랙과 소유자를 한 쿼리로 가져오기
+    return db.query(models.Track).join(
+        last_played, last_played.c.track_id == models.Track.id
+    ).options(joinedload(models.Track.owner)).order_by(
+        desc(last_played.c.last_played_at), desc(models.Track.id)
+    ).limit(limit).all()
 
 
 def get_play_count(db: Session, track_id: int) -> int:
-    """트랙의 총 재생 수"""
-    return db.query(models.PlayHistory).filter(models.PlayHistory.track_id == track_id).count()
+    """트랙의 총 재생 수 (카운터 컬럼)"""
+    return db.query(models.Track.play_count).filter(models.Track.id == track_id).scalar() or 0
+
+
+# 카운터 재계산
+# (카운터 컬럼, 카운터를 가진 테이블의 키, 원본 테이블에서 집계할 FK)
+COUNTERS = [
+    (models.Track.like_count, models.Track.id, models.Like.track_id),
+    (models.Track.comment_count, models.Track.id, models.Comment.track_id),
+    (models.Track.play_count, models.Track.id, models.PlayHistory.track_id),
+    (models.UserProfile.follower_count, models.UserProfile.id, models.Follow.following_id),
+    (models.UserProfile.following_count, models.UserProfile.id, models.Follow.follower_id),
+    (models.Tag.track_count, models.Tag.id, models.TrackTag.tag_id),
+]
+
+
+def reconcile_counters(db: Session) -> Dict[str, int]:
+    """
+    비정규화 카운터를 원본 테이블 집계로 다시 맞춥니다.
+
+    값이 어긋난 행만 UPDATE ... SET count = (SELECT count(*) ...) 한 문장으로 고치므로
+    운영 중에도 주기적으로 실행할 수 있습니다 (reconcile_counters.py).
+
+    Returns:
+        {"tracks.like_count": 고친 행 수, ...}
+    """
+    fixed = {}
+    for counter, key, source in COUNTERS:
+        actual = (
+            select(func.count())
+            .select_from(source.table)
+            .where(source == key)
+            .scalar_subquery()
+        )
+        result = db.execute(
+            update(counter.table)
+            .where(counter != actual)
+            .values({counter: actual})
+            .execution_options(synchronize_session=False)
+        )
+        fixed[f"{counter.table.name}.{counter.name}"] = result.rowcount
+    db.commit()
+    return fixed
 
@@ -0,0 +1,91 @@
+"""
+트랙 검색 결과 캐시의 키/태그와 검색어 통계 (async_crud.py에서 사용)
+
+인기 검색어가 반복되는 경우가 많으므로, 정규화한 검색어와 페이지로 만든 키에 결과 트랙 id 목록만
+SEARCH_CACHE_TTL 동안 캐싱하고, 트랙 본문은 track:{id} 캐시(get_track_cached와 공유)에서
+한 번에 가져옵니다.
+
+무효화 태그
+  - search:term:{앞 3글자}   검색어 단어마다 (트랙의 제목/아티스트/설명 단어의 1~3글자 접두어로 무효화)
+  - search:fuzzy             오타 허용 검색 결과 (트랙 생성/수정 시 모두 무효화)
+전문 검색은 단어 접두어로 일치하므로, 트랙 단어가 검색어 단어로 시작하면 앞 3글자도 같습니다.
+트랙 텍스트도 검색어와 같이 track_search.search_terms로 나눠, DB 검색 인덱스와 단어 경계가 같습니다.
+"""
+from collections import Counter
+from typing import Any, Dict, List, Optional
+
+from app.core.autocomplete import normalize
+from app.crud.track_search import search_terms
+
+SEARCH_KEY = "search:{mode}:{query}:{skip}:{limit}"
+TERM_TAG = "search:term:{prefix}"
+FUZZY_TAG = "search:fuzzy"
+
+# 무효화 태그에 쓰는 단어 접두어 길이 (길수록 무효화 범위는 좁지만 트랙 쓰기마다 태그가 늘어남)
+_TERM_TAG_LENGTH = 3
+# 검색어 통계에 보관하는 최대 검색어 수 (넘으면 자주 나온 것만 남김)
+_MAX_TRACKED_QUERIES = 1000
+
+
+def normalize_query(query: str, fuzzy: bool) -> str:
+    """
+    같은 결과를 내는 검색어가 같은 키가 되도록 정규화합니다 (단어 순서, 중복, 대소문자 무시).
+    전문 검색은 search_terms와 같은 단어로, 오타 허용 검색은 trigram 인덱스와 같은 정규화로 나눕니다.
+    """
+    words = normalize(query).split() if fuzzy else search_terms(query)
+    return " ".join(sorted(set(words)))
+
+
+def result_key(query: str, fuzzy: bool, skip: int, limit: int) -> str:
+    return SEARCH_KEY.format(mode="fuzzy" if fuzzy else "text", query=query, skip=skip, limit=limit)
+
+
+def result_tags(query: str, fuzzy: bool) -> List[str]:
+    """검색 결과에 붙이는 무효화 태그"""
+    if fuzzy:
+        return [FUZZY_TAG]
+    return list(dict.fromkeys(TERM_TAG.format(prefix=word[:_TERM_TAG_LENGTH]) for word in query.split()))
+
+
+def track_text_tags(*texts: Optional[str]) -> List[str]:
+    """트랙 텍스트(제목, 아티스트, 설명)가 바뀌었을 때 무효화할 검색 결과 태그"""
+    prefixes = {
+        word[:end]
+        for text in texts if text
+        for word in search_terms(text)
+        for end in range(1, min(len(word), _TERM_TAG_LENGTH) + 1)
+    }
+    return [TERM_TAG.format(prefix=prefix) for prefix in sorted(prefixes)] + [FUZZY_TAG]
+
+
+class SearchStats:
+    """검색 결과 캐시 적중률과 자주 나온 검색어 (워커별)"""
+
+    def __init__(self, max_queries: int = _MAX_TRACKED_QUERIES):
+        self.max_queries = max_queries
+        self.lookups = 0
+        self.hits = 0
+        self._queries: Counter = Counter()
+
+    def record(self, query: str, hit: bool) -> None:
+        self.lookups += 1
+        if hit:
+            self.hits += 1
+        self._queries[query] += 1
+        # 한 번씩만 나온 검색어가 쌓이지 않도록 자주 나온 것만 남김
+        if len(self._queries) > self.max_queries * 2:
+            self._queries = Counter(dict(self._queries.most_common(self.max_queries)))
+
+    def top_queries(self, n: int = 10) -> List[Dict[str, Any]]:
+        return [{"query": query, "count": count} for query, count in self._queries.most_common(n)]
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "lookups": self.lookups,
+            "hits": self.hits,
+            "hit_rate": round(self.hits / self.lookups, 4) if self.lookups else 0.0,
+            "top_queries": self.top_queries(),
+        }
+
+
+search_stats = SearchStats()
@@ -0,0 +1,49 @@
+"""
+태그 이름 정규화와 태그 필터 쿼리 (async_crud.py 공용)
+
+태그 필터는 Redis의 태그별 트랙 id 집합(TAG_TRACKS_KEY)을 SINTER(모든 태그)/SUNION(하나 이상)한
+결과를 짧게 캐싱해 페이지를 꺼내며, 집합이 없으면 track_tags(tag_id, track_id) 인덱스로 채웁니다.
+Redis를 사용할 수 없으면 tagged_track_ids()로 DB에서 바로 집계합니다.
+"""
+from typing import Iterable, List
+
+from sqlalchemy import desc, func, select
+from sqlalchemy.sql import Select
+
+from app.models import models
+
+# 태그별 트랙 id 집합 (Redis SET)
+TAG_TRACKS_KEY = "tag_tracks:{tag_id}"
+# 여러 태그의 교집합/합집합 결과 (Redis SET, match: all | any)
+TAG_FILTER_KEY = "tag_filter:{match}:{tag_ids}"
+
+
+def normalize_tag_names(names: Iterable[str]) -> List[str]:
+    """
+    태그 이름을 소문자, 단어 사이 공백 하나로 정규화합니다 (앞의 '#' 제거).
+    빈 이름은 빼고, 중복은 처음 나온 순서대로 하나만 남깁니다.
+    """
+    normalized = (" ".join(name.lstrip("#").split()).lower() for name in names)
+    return list(dict.fromkeys(name for name in normalized if name))
+
+
+def filter_key(tag_ids: Iterable[int], match_all: bool) -> str:
+    """태그 조합의 결과 집합 키 (태그 순서와 관계없이 같은 키)"""
+    return TAG_FILTER_KEY.format(
+        match="all" if match_all else "any",
+        tag_ids=",".join(str(tag_id) for tag_id in sorted(tag_ids)),
+    )
+
+
+def tagged_track_ids(tag_ids: List[int], match_all: bool) -> Select:
+    """태그가 (모두 / 하나 이상) 붙은 트랙 id를 최신순(id 역순)으로 조회하는 SELECT"""
+    track_tag = models.TrackTag
+    query = (
+        select(track_tag.track_id)
+        .where(track_tag.tag_id.in_(tag_ids))
+        .group_by(track_tag.track_id)
+        .order_by(desc(track_tag.track_id))
+    )
+    if match_all:
+        query = query.having(func.count() == len(tag_ids))
+    return query
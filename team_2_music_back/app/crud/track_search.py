@@ -0,0 +1,79 @@
+"""
+트랙 전문 검색 쿼리 (crud.py, async_crud.py 공용)
+
+검색 인덱스는 models.py의 TRACK_SEARCH_DDL로 만들며, 트랙 INSERT/UPDATE 시 DB가 갱신합니다.
+  - PostgreSQL: search_vector @@ to_tsquery, ts_rank 순 (GIN 인덱스 사용)
+  - SQLite: tracks_fts MATCH, bm25 순 (FTS5)
+
+검색어는 단어 단위로 나누며, 모든 단어를 접두어로 포함하는 트랙을 찾습니다.
+("사랑"은 "사랑해"와도 일치하며, 따옴표/연산자 등 특수문자는 검색어에서 제외)
+밑줄도 단어 구분자로 봅니다 (PostgreSQL simple 파서, FTS5 unicode61 토크나이저와 같게).
+
+오타 허용 검색(fuzzy_search)은 PostgreSQL에서는 pg_trgm word_similarity로 조회하고,
+그 외 DB에서는 프로세스 내 trigram 인덱스(app/core/fuzzy_search.py)를 사용합니다.
+"""
+import re
+from typing import List
+
+from sqlalchemy import column, desc, func, literal, literal_column, or_, select, table
+from sqlalchemy.sql import Select
+
+from app.models import models
+
+# 제목 > 아티스트 > 설명 순 가중치 (bm25 컬럼 가중치)
+_FTS_WEIGHTS = (10.0, 5.0, 1.0)
+
+_tracks_fts = table("tracks_fts", column("rowid"), column("tracks_fts"))
+# 문자/숫자 연속 (\w에서 밑줄 제외)
+_WORD = re.compile(r"[^\W_]+")
+
+
+def search_terms(query: str) -> List[str]:
+    """검색어를 단어 목록으로 나눕니다 (검색할 단어가 없으면 빈 목록)."""
+    return _WORD.findall(query.lower())
+
+
+def ranked_search(dialect_name: str, terms: List[str]) -> Select:
+    """
+    모든 단어와 일치하는 트랙을 관련도 높은 순으로 조회하는 SELECT
+    (동점이면 최신 트랙 먼저)
+    """
+    track = models.Track
+    if dialect_name == "postgresql":
+        tsquery = func.to_tsquery("simple", " & ".join(f"{term}:*" for term in terms))
+        vector = literal_column("tracks.search_vector")
+        return (
+            select(track)
+            .where(vector.op("@@")(tsquery))
+            .order_by(desc(func.ts_rank(vector, tsquery)), desc(track.id))
+        )
+
+    match = " ".join(f'"{term}"*' for term in terms)
+    rank = func.bm25(literal_column("tracks_fts"), *_FTS_WEIGHTS)
+    return (
+        select(track)
+        .join(_tracks_fts, _tracks_fts.c.rowid == track.id)
+        .where(_tracks_fts.c.tracks_fts.op("MATCH")(match))
+        .order_by(rank, desc(track.id))
+    )
+
+
+def fuzzy_search(query: str) -> Select:
+    """
+    제목 또는 아티스트 이름과 비슷한 트랙을 (트랙, 점수) 점수 높은 순으로 조회하는 SELECT (PostgreSQL)
+    <% 연산자는 pg_trgm GIN 인덱스를 사용하며, 기준 점수는 같은 트랜잭션에서
+    fuzzy_threshold(threshold)로 설정합니다.
+    """
+    track = models.Track
+    q = literal(query)
+    score = func.greatest(func.word_similarity(q, track.title), func.word_similarity(q, track.artist_name))
+    return (
+        select(track, score.label("score"))
+        .where(or_(q.op("<%")(track.title), q.op("<%")(track.artist_name)))
+        .order_by(desc(score), desc(track.id))
+    )
+
+
+def fuzzy_threshold(threshold: float) -> Select:
+    """현재 트랜잭션의 word_similarity 기준 점수를 설정하는 SELECT"""
+    return select(func.set_config("pg_trgm.word_similarity_threshold", str(threshold), True))
@@ -1,16 +1,119 @@
-from sqlalchemy import create_engine
+from typing import Any, Dict, Type
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
 from app.core.config import settings
+from app.db.pool_metrics import PoolMetrics, instrumented_pool_class
+
+Base = declarative_base()
+
+
+def to_async_database_url(url: str) -> str:
+    """
+    동기 DATABASE_URL을 비동기 드라이버 URL로 변환합니다.
+    (postgresql -> asyncpg, sqlite -> aiosqlite)
+    """
+    if url.startswith("postgresql+asyncpg://") or url.startswith("sqlite+aiosqlite://"):
+        return url
+    if url.startswith("postgres://"):
+        return "postgresql+asyncpg://" + url[len("postgres://"):]
+    if url.startswith("postgresql://") or url.startswith("postgresql+psycopg2://"):
+        return "postgresql+asyncpg://" + url.split("://", 1)[1]
+    if url.startswith("sqlite://"):
+        return "sqlite+aiosqlite://" + url[len("sqlite://"):]
+    return url
+
+
+def _engine_options(url: str, pool_class: Type[Pool], metrics: PoolMetrics) -> Dict[str, Any]:
+    """
+    Settings의 풀/타임아웃 설정으로 create_engine 인자를 만듭니다.
+    인메모리 SQLite는 단일 커넥션을 공유해야 하므로 기본 풀을 그대로 사용합니다.
+    """
+    parsed = make_url(url)
+    options: Dict[str, Any] = {"pool_pre_ping": settings.DB_POOL_PRE_PING}
+
+    if parsed.get_backend_name() == "sqlite":
+        if parsed.get_driver_name() == "pysqlite":
+            options["connect_args"] = {"check_same_thread": False}
+        if parsed.database in (None, "", ":memory:") or parsed.query.get("mode") == "memory":
+            return options
+    elif parsed.get_backend_name() == "postgresql" and settings.DB_STATEMENT_TIMEOUT_MS:
+        timeout = str(settings.DB_STATEMENT_TIMEOUT_MS)
+        if parsed.get_driver_name() == "asyncpg":
+            options["connect_args"] = {"server_settings": {"statement_timeout": timeout}}
+        else:
+            options["connect_args"] = {"options": f"-c statement_timeout={timeout}"}
+
+    options.update(
+        poolclass=instrumented_pool_class(pool_class, metrics),
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+    )
+    return options
+
+
+engine_pool_metrics = PoolMetrics()
+async_engine_pool_metrics = PoolMetrics()
 
 engine = create_engine(
-    settings.DATABASE_URL, 
-    # connect_args is needed only for SQLite
-    connect_args={"check_same_thread": False} if "sqlite" in settings.DATABASE_URL else {}
+    settings.DATABASE_URL,
+    **_engine_options(settings.DATABASE_URL, QueuePool, engine_pool_metrics),
 )
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-Base = declarative_base()
+# 비동기 엔진 (async 엔드포인트에서 이벤트 루프를 막지 않도록 사용)
+_async_database_url = to_async_database_url(settings.DATABASE_URL)
+async_engine = create_async_engine(
+    _async_database_url,
+    **_engine_options(_async_database_url, AsyncAdaptedQueuePool, async_engine_pool_metrics),
+)
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """
+    SQLite 연결마다 PRAGMA를 설정합니다.
+      - foreign_keys: 좋아요/팔로우 토글이 대상 존재 여부를 FK 오류로 판단
+      - journal_mode=WAL, synchronous=NORMAL: 쓰기 중에도 읽기가 막히지 않고 커밋 fsync 감소
+      - busy_timeout: 동시에 쓰는 연결이 곧바로 "database is locked"로 실패하지 않고 대기
+      - mmap_size, cache_size: 읽기 I/O 감소
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.execute(f"PRAGMA busy_timeout={int(settings.SQLITE_BUSY_TIMEOUT_MS)}")
+    cursor.execute(f"PRAGMA journal_mode={settings.SQLITE_JOURNAL_MODE}")
+    cursor.execute(f"PRAGMA synchronous={settings.SQLITE_SYNCHRONOUS}")
+    cursor.execute(f"PRAGMA mmap_size={int(settings.SQLITE_MMAP_SIZE)}")
+    # 음수는 페이지 수가 아닌 KiB 단위
+    cursor.execute(f"PRAGMA cache_size=-{int(settings.SQLITE_CACHE_SIZE_KB)}")
+    cursor.close()
+
+
+if engine.dialect.name == "sqlite":
+    event.listen(engine, "connect", _set_sqlite_pragmas)
+    event.listen(async_engine.sync_engine, "connect", _set_sqlite_pragmas)
+
+
+def pool_stats() -> Dict[str, Any]:
+    """동기/비동기 엔진 커넥션 풀 상태 (헬스 체크용)"""
+    return {
+        "async": async_engine_pool_metrics.stats(async_engine.pool),
+        "sync": engine_pool_metrics.stats(engine.pool),
+    }
+
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    # 커밋 후에도 응답 직렬화 시 속성을 다시 조회하지 않도록 유지
+    expire_on_commit=False,
+)
+
 
 def get_db():
     db = SessionLocal()
@@ -18,3 +121,8 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
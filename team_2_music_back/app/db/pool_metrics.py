@@ -0,0 +1,72 @@
+"""
+DB 커넥션 풀 계측
+
+풀 클래스의 체크아웃(_do_get)을 감싸 커넥션을 얻기까지 기다린 시간과
+타임아웃 횟수를 집계하고, 현재 사용 중인 커넥션/오버플로우 수와 함께 보고합니다.
+대기 시간에는 풀에 여유가 있어 새 커넥션을 여는 시간도 포함됩니다.
+"""
+import time
+from typing import Any, Dict, Type
+
+from sqlalchemy import exc
+from sqlalchemy.pool import Pool, QueuePool
+
+
+class PoolMetrics:
+    """커넥션 체크아웃 대기 시간 집계"""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def record(self, wait: float, timed_out: bool = False) -> None:
+        if timed_out:
+            self.timeouts += 1
+        else:
+            self.checkouts += 1
+        self.wait_total += wait
+        self.wait_max = max(self.wait_max, wait)
+
+    def stats(self, pool: Pool) -> Dict[str, Any]:
+        attempts = self.checkouts + self.timeouts
+        result: Dict[str, Any] = {
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "wait_avg_ms": round(self.wait_total / attempts * 1000, 3) if attempts else 0.0,
+            "wait_max_ms": round(self.wait_max * 1000, 3),
+        }
+        if isinstance(pool, QueuePool):
+            result.update(
+                size=pool.size(),
+                in_use=pool.checkedout(),
+                idle=pool.checkedin(),
+                overflow=max(pool.overflow(), 0),
+            )
+        return result
+
+
+class _InstrumentedPoolMixin:
+    metrics: PoolMetrics
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            record = super()._do_get()
+        except exc.TimeoutError:
+            self.metrics.record(time.perf_counter() - start, timed_out=True)
+            raise
+        self.metrics.record(time.perf_counter() - start)
+        return record
+
+
+def instrumented_pool_class(base: Type[Pool], metrics: PoolMetrics) -> Type[Pool]:
+    """
+    체크아웃 대기 시간을 metrics에 기록하는 풀 클래스를 만듭니다.
+    (engine.dispose()가 같은 클래스로 풀을 다시 만들므로 metrics는 클래스에 둠)
+    """
+    return type(f"Instrumented{base.__name__}", (_InstrumentedPoolMixin, base), {"metrics": metrics})
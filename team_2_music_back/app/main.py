@@ -5,13 +5,19 @@ from pathlib import Path
 
 from app.api.v1.api import api_router
 from app.core.config import settings
-from app.core.redis_client import get_redis_client, close_redis_client
+from app.core.redis_client import get_redis_client, close_redis_client, redis_breaker
+from app.core.jwt_utils import jwks_store, token_cache
+from app.core.cache import cache
+from app.core.autocomplete import autocomplete_index
+from app.core.fuzzy_search import fuzzy_index
+from app.crud import async_crud
+from app.crud.search_cache import search_stats
 from app.core.exceptions import (
     MusicAPIException,
     music_api_exception_handler,
     general_exception_handler
 )
-from app.db.database import Base, engine
+from app.db.database import Base, engine, async_engine, pool_stats, AsyncSessionLocal
 
 # 데이터베이스 테이블 생성 (Alembic 사용 시 주석 처리)
 # Base.metadata.create_all(bind=engine)
@@ -43,24 +49,50 @@ app.add_exception_handler(MusicAPIException, music_api_exception_handler)
 app.add_exception_handler(Exception, general_exception_handler)
 
 
+async def _load_track_index_terms():
+    """프로세스 내 검색 인덱스 재구성용 DB 조회"""
+    async with AsyncSessionLocal() as db:
+        return await async_crud.get_track_index_terms(db)
+
+
 @app.on_event("startup")
 async def startup_event():
     """애플리케이션 시작 시 실행"""
     try:
         # Redis 연결 테스트
         redis_client = get_redis_client()
-        redis_client.ping()
+        await redis_client.ping()
         print("✅ Redis 연결 성공")
     except Exception as e:
         print(f"⚠️ Redis 연결 실패: {e}")
-        print("Redis 없이 계속 진행합니다 (캐싱 비활성화)")
+        print("Redis 없이 계속 진행합니다 (캐싱 비활성화, 백그라운드에서 재연결 시도)")
+        # 요청마다 연결을 기다리지 않도록 브레이커를 열어둠
+        redis_breaker.trip(e)
+
+    # JWKS 키를 미리 로딩하고 만료 전에 백그라운드로 갱신
+    jwks_store.start_background_refresh()
+
+    # 다른 워커의 캐시 무효화 메시지 구독
+    cache.start_invalidation_listener()
+
+    # 검색 인덱스를 만들고 주기적으로 다시 만듦 (다른 워커의 트랙 변경 반영)
+    autocomplete_index.start_background_refresh(_load_track_index_terms)
+    # Postgres는 pg_trgm으로 오타 허용 검색
+    if async_engine.dialect.name != "postgresql":
+        fuzzy_index.start_background_refresh(_load_track_index_terms)
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """애플리케이션 종료 시 실행"""
-    close_redis_client()
+    await jwks_store.stop_background_refresh()
+    await autocomplete_index.stop_background_refresh()
+    await fuzzy_index.stop_background_refresh()
+    await redis_breaker.stop()
+    await cache.stop_invalidation_listener()
+    await close_redis_client()
     print("✅ Redis 연결 종료")
+    await async_engine.dispose()
 
 
 # API 라우터 등록
@@ -85,5 +117,17 @@ def read_root():
 
 @app.get("/health", tags=["Health Check"])
 def health_check():
-    """헬스 체크 엔드포인트"""
-    return {"status": "healthy"}
+    """
+    헬스 체크 엔드포인트
+    Redis 서킷 브레이커가 열려 있으면 캐시 없이 동작 중이므로 degraded로 표시
+    """
+    return {
+        "status": "healthy" if redis_breaker.allow() else "degraded",
+        "redis": redis_breaker.status(),
+        "token_cache": token_cache.stats(),
+        "cache": cache.stats(),
+        "db_pool": pool_stats(),
+        "autocomplete": autocomplete_index.stats(),
+        "fuzzy_search": fuzzy_index.stats(),
+        "search_cache": search_stats.stats(),
+    }
@@ -1,4 +1,5 @@
 from sqlalchemy import (
+    DDL,
     Column,
     Integer,
     String,
@@ -8,6 +9,8 @@ from sqlalchemy import (
     Text,
     Enum,
     Float,
+    Index,
+    event,
 )
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -24,6 +27,9 @@ class UserProfile(Base):
     profile_image_url = Column(String)
     bio = Column(Text)
     is_active = Column(Boolean, default=True)
+    # 팔로우 생성/삭제와 같은 트랜잭션에서 갱신하는 비정규화 카운터
+    follower_count = Column(Integer, nullable=False, default=0, server_default="0")
+    following_count = Column(Integer, nullable=False, default=0, server_default="0")
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
@@ -50,6 +56,11 @@ class UserProfile(Base):
 
 class Follow(Base):
     __tablename__ = "follows"
+    __table_args__ = (
+        # 팔로워/팔로잉 목록 (팔로우 최신순 페이지네이션)
+        Index("ix_follows_following_id_created_at", "following_id", "created_at"),
+        Index("ix_follows_follower_id_created_at", "follower_id", "created_at"),
+    )
     follower_id = Column(Integer, ForeignKey("user_profiles.id"), primary_key=True)
     following_id = Column(Integer, ForeignKey("user_profiles.id"), primary_key=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -75,8 +86,12 @@ class Track(Base):
     duration = Column(Float) # in seconds
     status = Column(Enum(TrackStatus), default=TrackStatus.processing)
     trending_score = Column(Float, default=0.0, index=True)
+    # 좋아요/댓글/재생 기록 변경과 같은 트랜잭션에서 갱신하는 비정규화 카운터
+    like_count = Column(Integer, nullable=False, default=0, server_default="0")
+    comment_count = Column(Integer, nullable=False, default=0, server_default="0")
+    play_count = Column(Integer, nullable=False, default=0, server_default="0")
     
-    owner_user_id = Column(Integer, ForeignKey("user_profiles.id"), nullable=False)
+    owner_user_id = Column(Integer, ForeignKey("user_profiles.id"), nullable=False, index=True)
     owner = relationship("UserProfile", back_populates="tracks")
 
     created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
@@ -87,16 +102,74 @@ class Track(Base):
     tags = relationship("TrackTag", back_populates="track", cascade="all, delete-orphan")
 
 
+# 트랙 전문 검색 인덱스 (검색 쿼리는 app/crud/track_search.py)
+# 제목/아티스트/설명 순으로 가중치를 주며, 트랙 INSERT/UPDATE 시 DB가 함께 갱신합니다.
+#   - PostgreSQL: tsvector 생성 컬럼(search_vector) + GIN 인덱스
+#   - SQLite: tracks를 원본으로 하는 FTS5 가상 테이블(tracks_fts) + 동기화 트리거
+# 오타 허용 검색은 PostgreSQL에서는 제목/아티스트 pg_trgm GIN 인덱스를, SQLite에서는
+# 프로세스 내 n-gram 인덱스(app/core/fuzzy_search.py)를 사용합니다.
+TRACK_SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(artist_name, '')), 'B') || "
+    "setweight(to_tsvector('simple', coalesce(description, '')), 'C')"
+)
+_TRACK_FTS_ROW = "new.id, new.title, new.artist_name, new.description"
+_TRACK_FTS_DELETE = (
+    "INSERT INTO tracks_fts(tracks_fts, rowid, title, artist_name, description) "
+    "VALUES ('delete', old.id, old.title, old.artist_name, old.description);"
+)
+_TRACK_FTS_INSERT = (
+    "INSERT INTO tracks_fts(rowid, title, artist_name, description) "
+    f"VALUES ({_TRACK_FTS_ROW});"
+)
+TRACK_SEARCH_DDL = {
+    "postgresql": [
+        f"ALTER TABLE tracks ADD COLUMN search_vector tsvector "
+        f"GENERATED ALWAYS AS ({TRACK_SEARCH_VECTOR_SQL}) STORED",
+        "CREATE INDEX ix_tracks_search_vector ON tracks USING gin (search_vector)",
+        # 오타 허용 검색 (word_similarity, <% 연산자)
+        "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+        "CREATE INDEX ix_tracks_title_trgm ON tracks USING gin (title gin_trgm_ops)",
+        "CREATE INDEX ix_tracks_artist_name_trgm ON tracks USING gin (artist_name gin_trgm_ops)",
+    ],
+    "sqlite": [
+        "CREATE VIRTUAL TABLE tracks_fts USING fts5("
+        "title, artist_name, description, content='tracks', content_rowid='id', "
+        "tokenize='unicode61 remove_diacritics 2', prefix='2 3')",
+        f"CREATE TRIGGER tracks_fts_ai AFTER INSERT ON tracks BEGIN {_TRACK_FTS_INSERT} END",
+        f"CREATE TRIGGER tracks_fts_ad AFTER DELETE ON tracks BEGIN {_TRACK_FTS_DELETE} END",
+        # 카운터 갱신 등 다른 컬럼 UPDATE에는 실행되지 않음
+        "CREATE TRIGGER tracks_fts_au AFTER UPDATE OF title, artist_name, description ON tracks "
+        f"BEGIN {_TRACK_FTS_DELETE} {_TRACK_FTS_INSERT} END",
+    ],
+}
+
+for _dialect, _statements in TRACK_SEARCH_DDL.items():
+    for _statement in _statements:
+        event.listen(Track.__table__, "after_create", DDL(_statement).execute_if(dialect=_dialect))
+event.listen(Track.__table__, "before_drop", DDL("DROP TABLE IF EXISTS tracks_fts").execute_if(dialect="sqlite"))
+
+
 class Tag(Base):
     __tablename__ = "tags"
+    __table_args__ = (
+        # 인기 태그 목록 (트랙 수 내림차순)
+        Index("ix_tags_track_count", "track_count"),
+    )
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, unique=True, index=True, nullable=False)
+    # 트랙에 태그를 붙이는 것과 같은 트랜잭션에서 갱신하는 비정규화 카운터
+    track_count = Column(Integer, nullable=False, default=0, server_default="0")
 
     tracks = relationship("TrackTag", back_populates="tag")
 
 
 class TrackTag(Base):
     __tablename__ = "track_tags"
+    __table_args__ = (
+        # 태그별 트랙 목록 (태그 필터, Redis 태그 집합 채우기), PK는 (track_id, tag_id) 순서
+        Index("ix_track_tags_tag_id_track_id", "tag_id", "track_id"),
+    )
     track_id = Column(Integer, ForeignKey("tracks.id"), primary_key=True)
     tag_id = Column(Integer, ForeignKey("tags.id"), primary_key=True)
 
@@ -106,6 +179,12 @@ class TrackTag(Base):
 
 class Like(Base):
     __tablename__ = "likes"
+    __table_args__ = (
+        # 내가 좋아요한 트랙 목록 (좋아요 최신순 커서 페이지네이션)
+        Index("ix_likes_user_id_created_at", "user_id", "created_at"),
+        # 트랙의 좋아요 목록 (최신순 커서 페이지네이션)
+        Index("ix_likes_track_id_created_at", "track_id", "created_at"),
+    )
     track_id = Column(Integer, ForeignKey("tracks.id"), primary_key=True)
     user_id = Column(Integer, ForeignKey("user_profiles.id"), primary_key=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -116,6 +195,10 @@ class Like(Base):
 
 class Comment(Base):
     __tablename__ = "comments"
+    __table_args__ = (
+        # 트랙의 댓글 목록 (최신순 커서 페이지네이션)
+        Index("ix_comments_track_id_created_at", "track_id", "created_at"),
+    )
     id = Column(Integer, primary_key=True, index=True)
     content = Column(Text, nullable=False)
     
@@ -131,6 +214,10 @@ class Comment(Base):
 
 class Playlist(Base):
     __tablename__ = "playlists"
+    __table_args__ = (
+        # 사용자의 플레이리스트 목록 (최신순 커서 페이지네이션)
+        Index("ix_playlists_owner_user_id_created_at", "owner_user_id", "created_at"),
+    )
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, nullable=False)
     description = Column(Text)
@@ -147,6 +234,10 @@ class Playlist(Base):
 
 class PlaylistTrack(Base):
     __tablename__ = "playlist_tracks"
+    __table_args__ = (
+        # 플레이리스트 상세 (순서대로 정렬, 트랙 페이지네이션)
+        Index("ix_playlist_tracks_playlist_id_track_order", "playlist_id", "track_order"),
+    )
     playlist_id = Column(Integer, ForeignKey("playlists.id"), primary_key=True)
     track_id = Column(Integer, ForeignKey("tracks.id"), primary_key=True)
     track_order = Column(Integer)
@@ -157,9 +248,13 @@ class PlaylistTrack(Base):
 
 class PlayHistory(Base):
     __tablename__ = "play_history"
+    __table_args__ = (
+        # 내 재생 기록 (최신순 커서 페이지네이션)
+        Index("ix_play_history_user_id_played_at", "user_id", "played_at"),
+    )
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("user_profiles.id"), nullable=False, index=True)
-    track_id = Column(Integer, ForeignKey("tracks.id"), nullable=False)
+    track_id = Column(Integer, ForeignKey("tracks.id"), nullable=False, index=True)
     played_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
 
     user = relationship("UserProfile", back_populates="play_history")
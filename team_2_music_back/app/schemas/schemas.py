@@ -1,6 +1,7 @@
-from pydantic import BaseModel
-from typing import List, Optional
+from pydantic import BaseModel, Field
+from typing import Annotated, List, Literal, Optional
 from datetime import datetime
+from app.core.config import settings
 from app.models.models import TrackStatus
 
 # Base Schemas
@@ -53,6 +54,26 @@ class Track(TrackBase):
         from_attributes = True
 
 
+class TrackSearchResult(Track):
+    """트랙 검색 결과 (오타 허용 검색에서는 유사도 점수 포함)"""
+    score: Optional[float] = None
+
+
+class Tag(BaseModel):
+    """태그와 태그가 붙은 트랙 수"""
+    name: str
+    track_count: int
+
+    class Config:
+        from_attributes = True
+
+
+class AutocompleteSuggestion(BaseModel):
+    """검색창 자동완성 추천어"""
+    text: str
+    type: Literal["track", "artist", "tag"]
+
+
 class CommentBase(BaseModel):
     content: str
 
@@ -99,12 +120,14 @@ class LikeResponse(BaseModel):
 class LikeListResponse(BaseModel):
     likes: List[Like]
     total: int
+    next_cursor: Optional[str] = None
 
 
 # 댓글 응답 스키마
 class CommentListResponse(BaseModel):
     comments: List[Comment]
     total: int
+    next_cursor: Optional[str] = None
 
 
 # 팔로우 스키마
@@ -131,6 +154,7 @@ class FollowResponse(BaseModel):
 class FollowListResponse(BaseModel):
     users: List[UserProfile]
     total: int
+    next_cursor: Optional[str] = None  # 다음 페이지 조회 시 cursor로 전달
 
 
 class PlaylistBase(BaseModel):
@@ -157,6 +181,7 @@ class Playlist(PlaylistBase):
 class PlaylistWithTracks(Playlist):
     """트랙 목록을 포함한 플레이리스트"""
     tracks: List[Track] = []
+    track_count: int = 0  # 전체 트랙 수 (트랙 페이지네이션 시 tracks보다 클 수 있음)
 
 
 class AddTrackRequest(BaseModel):
@@ -206,7 +231,9 @@ class UploadInitiateResponse(BaseModel):
 class UploadFinalizeRequest(BaseModel):
     upload_id: str
     title: str
-    tags: Optional[List[str]] = []
+    tags: Optional[List[Annotated[str, Field(max_length=settings.TAG_NAME_MAX_LENGTH)]]] = Field(
+        default=[], max_length=settings.TAG_MAX_PER_TRACK
+    )
     description: Optional[str] = None
     cover_image_url: Optional[str] = None
 
@@ -0,0 +1,250 @@
+"""
+CRUD 쿼리 실행 계획 점검 스크립트
+
+DATABASE_URL의 DB에 시드 데이터를 넣고 async_crud의 조회/토글 함수를 실행하면서,
+함수가 보내는 SQL마다 EXPLAIN을 실행해 인덱스 없이 테이블 전체를 읽는 경우(순차 스캔)를 표시합니다.
+  - SQLite: EXPLAIN QUERY PLAN의 "SCAN <테이블>" (인덱스 순서로 전체를 읽는 SCAN ... USING INDEX 포함,
+    인덱스로 범위를 좁히는 경우는 SEARCH로 표시됨)
+  - Postgres: enable_seqscan = off에서도 남는 Seq Scan, 그리고 Index Cond 없이 Filter로만
+    거르는 인덱스 스캔 (시드 데이터가 작아 플래너가 순차 스캔을 고르는 경우를 제외)
+
+테이블 생성부터 시드, 쿼리 실행까지 모두 하나의 트랜잭션 안에서 하고 마지막에 롤백하므로
+DB에는 아무것도 남지 않습니다. 허용 목록(KNOWN_SCANS)에 없는 순차 스캔이 있으면
+종료 코드 1로 끝나므로 CI에서도 사용할 수 있습니다.
+"""
+import asyncio
+import json
+import re
+import sys
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Awaitable, Callable, Dict, List, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.core.config import settings
+from app.core.pagination import Cursor
+from app.crud import async_crud
+from app.db.database import Base, to_async_database_url
+from app.models import models
+
+# 순차 스캔이 불가피한 쿼리 (함수 이름 -> 이유)
+KNOWN_SCANS: Dict[str, str] = {
+    "get_tracks": "전체 목록을 created_at 인덱스 순서로 LIMIT만큼만 읽음",
+}
+
+SEED_USERS = 5
+SEED_TRACKS = 30
+
+_STATEMENT = re.compile(r"^\s*(SELECT|INSERT|UPDATE|DELETE|WITH)\b", re.IGNORECASE)
+_SQLITE_SCAN = re.compile(r"^SCAN (?:TABLE )?(\w+)")
+
+
+def _create_engine():
+    engine = create_async_engine(to_async_database_url(settings.DATABASE_URL))
+    if engine.dialect.name == "sqlite":
+        # pysqlite/aiosqlite의 자체 트랜잭션 처리를 끄고 BEGIN을 직접 보내야
+        # DDL까지 포함한 전체 작업과 SAVEPOINT가 하나의 트랜잭션으로 묶임
+        @event.listens_for(engine.sync_engine, "connect")
+        def _disable_driver_transactions(dbapi_connection, connection_record):
+            dbapi_connection.isolation_level = None
+
+        @event.listens_for(engine.sync_engine, "begin")
+        def _begin(conn):
+            conn.exec_driver_sql("BEGIN")
+
+    return engine
+
+
+@contextmanager
+def _capture(engine, statements: List[Tuple[str, object]]):
+    """engine에서 실행되는 SQL과 파라미터를 statements에 기록"""
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if _STATEMENT.match(statement):
+            statements.append((statement, parameters))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+
+
+async def _seed(db: AsyncSession) -> Dict[str, int]:
+    """시드 데이터를 넣고 쿼리에 사용할 id들을 반환"""
+    users = [
+        models.UserProfile(user_id=f"explain-user-{i}", nickname=f"explain{i}")
+        for i in range(SEED_USERS)
+    ]
+    db.add_all(users)
+    await db.flush()
+
+    tracks = [
+        models.Track(
+            title=f"explain track {i}",
+            artist_name=users[i % SEED_USERS].nickname,
+            file_url=f"https://example.com/explain/{i}.mp3",
+            owner_user_id=users[i % SEED_USERS].id,
+            status=models.TrackStatus.ready,
+        )
+        for i in range(SEED_TRACKS)
+    ]
+    db.add_all(tracks)
+    await db.flush()
+
+    playlist = models.Playlist(name="explain playlist", owner_user_id=users[0].id)
+    db.add(playlist)
+    await db.flush()
+
+    for i, track in enumerate(tracks):
+        user = users[i % SEED_USERS]
+        db.add(models.Like(track_id=track.id, user_id=user.id))
+        db.add(models.Comment(track_id=track.id, user_id=user.id, content=f"comment {i}"))
+        db.add(models.PlayHistory(track_id=track.id, user_id=user.id))
+        if track is not tracks[-1]:
+            db.add(models.PlaylistTrack(playlist_id=playlist.id, track_id=track.id, track_order=i))
+    for follower in users[1:]:
+        db.add(models.Follow(follower_id=follower.id, following_id=users[0].id))
+    tags = [models.Tag(name="explain", track_count=SEED_TRACKS), models.Tag(name="even", track_count=SEED_TRACKS // 2)]
+    db.add_all(tags)
+    await db.flush()
+    for i, track in enumerate(tracks):
+        db.add(models.TrackTag(track_id=track.id, tag_id=tags[0].id))
+        if i % 2 == 0:
+            db.add(models.TrackTag(track_id=track.id, tag_id=tags[1].id))
+    await db.commit()
+
+    return {
+        "user_id": users[0].id,
+        "other_user_id": users[1].id,
+        "track_id": tracks[0].id,
+        "unlisted_track_id": tracks[-1].id,
+        "playlist_id": playlist.id,
+    }
+
+
+def _queries(ids: Dict[str, int]) -> List[Tuple[str, Callable[[AsyncSession], Awaitable]]]:
+    """(이름, 실행 함수) 목록. @cached 함수는 __wrapped__로 캐시를 거치지 않고 실행"""
+    user_id, other_user_id = ids["user_id"], ids["other_user_id"]
+    track_id, playlist_id = ids["track_id"], ids["playlist_id"]
+    # 다음 페이지 조회(커서 조건) 계획도 확인
+    cursor = Cursor(datetime.now(), 2 ** 31 - 1)
+
+    return [
+        ("get_user_profile", lambda db: async_crud.get_user_profile(db, user_id=user_id)),
+        ("get_user_profile_by_user_id", lambda db: async_crud.get_user_profile_by_user_id(db, user_id="explain-user-0")),
+        ("get_track", lambda db: async_crud.get_track(db, track_id=track_id)),
+        ("get_tracks", lambda db: async_crud.get_tracks.__wrapped__(db, limit=10)),
+        ("get_tracks (cursor)", lambda db: async_crud.get_tracks.__wrapped__(db, limit=10, cursor=cursor)),
+        ("search_tracks", lambda db: async_crud.search_tracks(db, query="explain", limit=10)),
+        ("get_tracks_by_tags", lambda db: async_crud.get_tracks_by_tags(db, ["explain", "even"], limit=10)),
+        ("get_popular_tags", lambda db: async_crud.get_popular_tags.__wrapped__(db)),
+        ("get_like", lambda db: async_crud.get_like(db, track_id=track_id, user_id=user_id)),
+        ("get_track_likes", lambda db: async_crud.get_track_likes.__wrapped__(db, track_id=track_id, cursor=cursor)),
+        ("get_user_likes", lambda db: async_crud.get_user_likes(db, user_id=user_id)),
+        ("get_user_liked_tracks", lambda db: async_crud.get_user_liked_tracks(db, user_id=user_id, cursor=cursor)),
+        ("get_track_like_count", lambda db: async_crud.get_track_like_count.__wrapped__(db, track_id=track_id)),
+        ("get_track_comments", lambda db: async_crud.get_track_comments.__wrapped__(db, track_id=track_id, cursor=cursor)),
+        ("get_track_comment_count", lambda db: async_crud.get_track_comment_count.__wrapped__(db, track_id=track_id)),
+        ("get_follow", lambda db: async_crud.get_follow(db, follower_id=other_user_id, following_id=user_id)),
+        ("get_followers", lambda db: async_crud.get_followers.__wrapped__(db, user_id=user_id, cursor=cursor)),
+        ("get_following", lambda db: async_crud.get_following.__wrapped__(db, user_id=other_user_id, cursor=cursor)),
+        ("get_follower_count", lambda db: async_crud.get_follower_count.__wrapped__(db, user_id=user_id)),
+        ("get_playlist", lambda db: async_crud.get_playlist(db, playlist_id=playlist_id)),
+        ("get_user_playlists", lambda db: async_crud.get_user_playlists(db, user_id=user_id, cursor=cursor)),
+        ("get_playlist_tracks", lambda db: async_crud.get_playlist_tracks.__wrapped__(db, playlist_id=playlist_id, limit=10)),
+        ("get_playlist_track_count", lambda db: async_crud.get_playlist_track_count.__wrapped__(db, playlist_id=playlist_id)),
+        ("get_user_play_history", lambda db: async_crud.get_user_play_history(db, user_id=user_id, cursor=cursor)),
+        ("get_recently_played_tracks", lambda db: async_crud.get_recently_played_tracks(db, user_id=user_id)),
+        ("get_play_count", lambda db: async_crud.get_play_count(db, track_id=track_id)),
+        ("toggle_like", lambda db: async_crud.toggle_like(db, track_id=track_id, user_id=other_user_id)),
+        ("toggle_follow", lambda db: async_crud.toggle_follow(db, follower_id=user_id, following_id=other_user_id)),
+        ("add_track_to_playlist", lambda db: async_crud.add_track_to_playlist(db, playlist_id=playlist_id, track_id=ids["unlisted_track_id"])),
+        ("reorder_playlist_track", lambda db: async_crud.reorder_playlist_track(db, playlist_id=playlist_id, track_id=track_id, new_order=99)),
+        ("remove_track_from_playlist", lambda db: async_crud.remove_track_from_playlist(db, playlist_id=playlist_id, track_id=track_id)),
+    ]
+
+
+async def _explain(conn, dialect: str, statement: str, parameters) -> Tuple[List[str], List[str]]:
+    """(실행 계획 줄 목록, 순차 스캔한 테이블 목록)"""
+    tables = set(Base.metadata.tables)
+    if dialect == "sqlite":
+        rows = (await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)).all()
+        plan = [row[-1] for row in rows]
+        scans = [m.group(1) for line in plan if (m := _SQLITE_SCAN.match(line))]
+    else:
+        raw = (await conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters)).scalar_one()
+        plan, scans = [], []
+        nodes = [(json.loads(raw) if isinstance(raw, str) else raw)[0]["Plan"]]
+        while nodes:
+            node = nodes.pop()
+            node_type = node["Node Type"]
+            plan.append(f"{node_type} {node.get('Relation Name', '')} {node.get('Index Name', '')}".strip())
+            full_index_scan = (
+                node_type in ("Index Scan", "Index Only Scan")
+                and "Index Cond" not in node
+                and "Filter" in node
+            )
+            if node_type == "Seq Scan" or full_index_scan:
+                scans.append(node["Relation Name"])
+            nodes.extend(node.get("Plans", []))
+    return plan, [table for table in scans if table in tables]
+
+
+async def explain_queries() -> int:
+    engine = _create_engine()
+    dialect = engine.dialect.name
+    failures = 0
+
+    async with engine.connect() as conn:
+        transaction = await conn.begin()
+        try:
+            if dialect == "postgresql":
+                await conn.exec_driver_sql("SET LOCAL enable_seqscan = off")
+            await conn.run_sync(Base.metadata.create_all)
+
+            # CRUD 함수의 커밋은 SAVEPOINT 해제로 바뀌고, 바깥 트랜잭션은 마지막에 롤백
+            db = AsyncSession(
+                bind=conn,
+                join_transaction_mode="create_savepoint",
+                expire_on_commit=False,
+                autoflush=False,
+            )
+            ids = await _seed(db)
+
+            for name, query in _queries(ids):
+                statements: List[Tuple[str, object]] = []
+                with _capture(engine, statements):
+                    await query(db)
+
+                scanned = []
+                for statement, parameters in statements:
+                    plan, scans = await _explain(conn, dialect, statement, parameters)
+                    if scans:
+                        scanned.append((statement, plan, scans))
+
+                base_name = name.split(" ")[0]
+                if not scanned:
+                    print(f"✅ {name} ({len(statements)} statements)")
+                elif base_name in KNOWN_SCANS:
+                    print(f"➖ {name}: 순차 스캔 허용 ({KNOWN_SCANS[base_name]})")
+                else:
+                    failures += 1
+                    for statement, plan, scans in scanned:
+                        print(f"⚠️ {name}: 순차 스캔 {', '.join(dict.fromkeys(scans))}")
+                        print("    " + " ".join(statement.split())[:200])
+                        for line in plan:
+                            print(f"      {line}")
+            await db.close()
+        finally:
+            await transaction.rollback()
+
+    await engine.dispose()
+    print(f"\n{dialect}: 순차 스캔 {failures}건")
+    return failures
+
+
+if __name__ == "__main__":
+    sys.exit(1 if asyncio.run(explain_queries()) else 0)
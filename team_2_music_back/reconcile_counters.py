@@ -0,0 +1,24 @@
+"""
+비정규화 카운터 재계산 스크립트
+좋아요/댓글/재생/팔로우/태그 카운터를 원본 테이블 집계와 비교해 어긋난 값을 고칩니다.
+cron 등으로 주기적으로 실행합니다.
+"""
+from app.db.database import SessionLocal
+from app.crud import crud
+
+
+def reconcile():
+    print("Reconciling counters...")
+    db = SessionLocal()
+    try:
+        fixed = crud.reconcile_counters(db)
+    finally:
+        db.close()
+
+    for counter, rows in fixed.items():
+        print(f"  - {counter}: {rows} rows fixed")
+    print("✅ Counters reconciled")
+
+
+if __name__ == "__main__":
+    reconcile()
@@ -1,11 +1,11 @@
 import asyncio
 from app.api.v1.endpoints.tracks import finalize_upload
 from app.schemas import schemas
-from app.db.database import SessionLocal
+from app.db.database import AsyncSessionLocal
 from unittest.mock import MagicMock
 
 async def test_finalize():
-    db = SessionLocal()
+    db = AsyncSessionLocal()
     
     # Mock request
     request = schemas.UploadFinalizeRequest(
@@ -32,7 +32,7 @@ async def test_finalize():
         import traceback
         traceback.print_exc()
     finally:
-        db.close()
+        await db.close()
 
 if __name__ == "__main__":
     asyncio.run(test_finalize())
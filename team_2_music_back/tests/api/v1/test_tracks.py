@@ -50,3 +50,26 @@ async def test_upload_finalize_flow(authorized_client: AsyncClient):
     response = await authorized_client.get(f"/api/v1/tracks/{data['id']}")
     assert response.status_code == 200
     assert response.json()["title"] == "My New Song"
+
+@pytest.mark.asyncio
+async def test_finalize_saves_tags_and_filters_by_tag(authorized_client: AsyncClient):
+    created = []
+    for title, tags in [("Tagged A", ["Bossa", "rainy"]), ("Tagged B", ["bossa"])]:
+        response = await authorized_client.post("/api/v1/tracks/upload/finalize", json={
+            "upload_id": f"upload-{title}", "title": title, "tags": tags,
+        })
+        assert response.status_code == 200
+        created.append(response.json()["id"])
+
+    response = await authorized_client.get("/api/v1/tracks/", params={"tags": "bossa,RAINY"})
+    assert [t["id"] for t in response.json()] == [created[0]]
+    response = await authorized_client.get("/api/v1/tracks/", params={"tags": "rainy,bossa", "match": "any"})
+    assert [t["id"] for t in response.json()] == created[::-1]
+
+    response = await authorized_client.get("/api/v1/tracks/tags")
+    assert {"name": "bossa", "track_count": 2} in response.json()
+
+    response = await authorized_client.post("/api/v1/tracks/upload/finalize", json={
+        "upload_id": "too-many", "title": "Too many tags", "tags": [f"t{i}" for i in range(11)],
+    })
+    assert response.status_code == 422
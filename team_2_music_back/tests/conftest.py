@@ -1,9 +1,13 @@
+import uuid
 import pytest
-from typing import AsyncGenerator
+import redis
+from typing import AsyncGenerator, Iterable, Optional, Sequence, Union
 from httpx import AsyncClient, ASGITransport
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.main import app
+from app.core.config import settings
 from app.db.database import get_db, SessionLocal, engine, Base
 from app.api.dependencies import get_current_user, get_optional_user
 
@@ -14,6 +18,32 @@ def setup_database():
     yield
     Base.metadata.drop_all(bind=engine)
 
+# Isolate Redis per test session
+@pytest.fixture(scope="session", autouse=True)
+def isolate_redis():
+    """
+    테스트 세션마다 고유한 Redis 키 접두사(CACHE_KEY_VERSION)를 사용합니다.
+    DB는 세션마다 새로 만들어 id가 다시 1부터 시작하므로, 이전 실행이 남긴 캐시
+    (프로필, 태그별 트랙 id 집합, 검색 결과 등)를 읽지 않도록 하고 종료 시 지웁니다.
+    """
+    prefix = f"test-{uuid.uuid4().hex}"
+    original, settings.CACHE_KEY_VERSION = settings.CACHE_KEY_VERSION, prefix
+    yield
+    settings.CACHE_KEY_VERSION = original
+    try:
+        client = redis.Redis(
+            host=settings.REDIS_HOST,
+            port=settings.REDIS_PORT,
+            socket_connect_timeout=settings.REDIS_SOCKET_CONNECT_TIMEOUT,
+        )
+        keys = list(client.scan_iter(match=f"{prefix}:*", count=1000))
+        for i in range(0, len(keys), 1000):
+            client.delete(*keys[i:i + 1000])
+        client.close()
+    except (redis.RedisError, OSError):
+        # Redis 없이 실행한 경우 정리할 키가 없음
+        pass
+
 # Database Session Fixture
 @pytest.fixture(scope="function")
 def db() -> Session:
@@ -66,3 +96,47 @@ async def authorized_client(client: AsyncClient, mock_user_data, db: Session) ->
     app.dependency_overrides[get_optional_user] = mock_get_current_user
     yield client
     app.dependency_overrides.clear()
+
+# Async CRUD Data Fixtures
+@pytest.fixture
+def make_user():
+    """사용자 프로필을 만드는 팩토리 (같은 user_id면 기존 프로필 반환, 닉네임 기본값은 user_id)"""
+    from app.crud import async_crud
+    from app.schemas import schemas
+
+    async def make(db: AsyncSession, user_id: str, nickname: Optional[str] = None):
+        return await async_crud.get_or_create_user_profile(
+            db, schemas.UserProfileCreate(user_id=user_id, nickname=nickname or user_id)
+        )
+    return make
+
+@pytest.fixture
+def make_tracks():
+    """
+    트랙을 titles 순서대로 추가하고 flush해 id를 채운 목록을 반환하는 팩토리 (커밋은 호출자가)
+    owner_id에 목록을 주면 트랙마다 돌아가며 소유자로 지정합니다.
+    """
+    from app.models import models
+
+    async def make(
+        db: AsyncSession,
+        owner_id: Union[int, Sequence[int]],
+        titles: Iterable[str],
+        artist_name: str = "artist",
+        **fields,
+    ):
+        owner_ids = [owner_id] if isinstance(owner_id, int) else list(owner_id)
+        tracks = [
+            models.Track(
+                title=title,
+                artist_name=artist_name,
+                file_url=f"https://example.com/{title}.mp3",
+                owner_user_id=owner_ids[i % len(owner_ids)],
+                **fields,
+            )
+            for i, title in enumerate(titles)
+        ]
+        db.add_all(tracks)
+        await db.flush()
+        return tracks
+    return make
@@ -0,0 +1,119 @@
+import pytest
+
+from app.core.autocomplete import AutocompleteIndex, autocomplete_index, decompose_jamo, normalize
+from app.crud import async_crud
+from app.db.database import AsyncSessionLocal
+from app.schemas import schemas
+
+
+def texts(suggestions):
+    return [s["text"] for s in suggestions]
+
+
+def test_hangul_prefixes_match_partial_syllables_initials_and_word_starts():
+    index = AutocompleteIndex()
+    index.update_track(1, title="사랑해 오늘도", artist_name="아이유")
+    index.update_track(2, title="Moonlit Walk", artist_name="Band")
+    index.update_track(3, title="과일 노래", artist_name="band", tags=["Café", "닭강정"])
+
+    assert normalize("  Moonlit-WALK!! ") == "moonlit walk"
+    assert decompose_jamo("과닭") == "ㄱㅗㅏㄷㅏㄹㄱ"
+
+    assert texts(index.suggest("사랑")) == ["사랑해 오늘도"]
+    # 입력 중인 글자 (받침이 다음 음절 초성이 될 수 있음)
+    assert texts(index.suggest("살")) == ["사랑해 오늘도"]
+    assert texts(index.suggest("고")) == ["과일 노래"]
+    assert texts(index.suggest("달ㄱ")) == ["닭강정"]
+    # 초성, 중간 단어, 대소문자/악센트 정규화
+    assert texts(index.suggest("ㅅㄹㅎ")) == ["사랑해 오늘도"]
+    assert texts(index.suggest("ㄴㄹ")) == ["과일 노래"]
+    assert texts(index.suggest("오늘")) == ["사랑해 오늘도"]
+    assert texts(index.suggest("WALK")) == ["Moonlit Walk"]
+    assert index.suggest("cafe") == [] and texts(index.suggest("CAF")) == ["Café"]
+    assert index.suggest("") == [] and index.suggest("!!") == []
+
+
+def test_incremental_updates_and_popularity_ranking():
+    index = AutocompleteIndex()
+    index.update_track(1, title="bandit", artist_name="solo")
+    index.update_track(2, title="first", artist_name="band")
+    index.update_track(3, title="second", artist_name="Band")
+
+    # 같은 추천어를 가진 트랙이 많을수록 먼저 (표기는 처음 등록된 것)
+    assert index.suggest("ban") == [
+        {"text": "band", "type": "artist"},
+        {"text": "bandit", "type": "track"},
+    ]
+    assert len(index.suggest("ban", limit=1)) == 1
+
+    index.update_track(1, title="renamed")  # 아티스트는 유지
+    assert texts(index.suggest("ban")) == ["band"]
+    assert texts(index.suggest("sol")) == ["solo"]
+
+    index.remove_track(2)
+    index.remove_track(3)
+    assert index.suggest("ban") == []
+    assert index.stats()["terms"] == 2
+
+    index.replace_all([(7, "바람", None, ["band"])])
+    assert index.suggest("ren") == []
+    assert index.suggest("ban") == [{"text": "band", "type": "tag"}]
+
+
+@pytest.mark.parametrize("bulk", [False, True])
+def test_ranking_is_exact_when_popular_term_sorts_after_scan_limit(bulk):
+    rows = [(n, f"sa{n:04d}", None, None) for n in range(600)]
+    rows += [(1000 + n, f"sabc{n:04d}", None, None) for n in range(600)]
+    rows += [(2000 + n, "summer", None, ["sabcz"]) for n in range(50)]
+    index = AutocompleteIndex()
+    if bulk:
+        index.replace_all(rows)
+    else:
+        for track_id, title, artist_name, tags in rows:
+            index.update_track(track_id, title=title, artist_name=artist_name, tags=tags)
+
+    # 키 순으로 _MAX_SCAN개를 넘긴 뒤에 오는 인기 추천어도 먼저
+    assert texts(index.suggest("s", 3)) == ["summer", "sabcz", "sa0000"]
+    assert texts(index.suggest("sa", 2)) == ["sabcz", "sa0000"]
+    # 범위가 넓은 긴 접두어
+    assert texts(index.suggest("sabc", 2)) == ["sabcz", "sabc0000"]
+
+    # 인기가 바뀌면 순위도 바뀜
+    for n in range(50):
+        index.remove_track(2000 + n)
+    for n in range(3):
+        index.update_track(1000 + n, title="sabc0599")
+    assert texts(index.suggest("s", 2)) == ["sabc0599", "sa0000"]
+    assert texts(index.suggest("sabc", 2)) == ["sabc0599", "sabc0003"]
+
+
+@pytest.mark.asyncio
+async def test_track_writes_update_autocomplete_after_commit(authorized_client, mock_user_data):
+    owner_id = mock_user_data["db_user_id"]
+    async with AsyncSessionLocal() as db:
+        track = await async_crud.create_track(db, schemas.TrackCreate(
+            title="Zephyr Lullaby", artist_name="zephyr trio", file_url="https://example.com/zephyr.mp3",
+        ), owner_id=owner_id)
+        track_id = track.id
+
+        # 롤백된 unit_of_work의 변경은 반영되지 않음
+        with pytest.raises(RuntimeError):
+            async with async_crud.unit_of_work(db):
+                await async_crud.update_track(db, track_id, schemas.TrackUpdate(title="Zephyr Nocturne"))
+                raise RuntimeError("rollback")
+
+    response = await authorized_client.get("/api/v1/tracks/autocomplete", params={"prefix": "zeph"})
+    assert response.status_code == 200
+    assert response.json() == [
+        {"text": "Zephyr Lullaby", "type": "track"},
+        {"text": "zephyr trio", "type": "artist"},
+    ]
+
+    async with AsyncSessionLocal() as db:
+        async with async_crud.unit_of_work(db):
+            await async_crud.update_track(db, track_id, schemas.TrackUpdate(title="Zephyr Nocturne"))
+    assert texts(autocomplete_index.suggest("zephyr n")) == ["Zephyr Nocturne"]
+    assert autocomplete_index.suggest("zephyr l") == []
+
+    response = await authorized_client.get("/api/v1/tracks/autocomplete", params={"prefix": "z", "limit": 0})
+    assert response.status_code == 422
@@ -0,0 +1,97 @@
+import asyncio
+import time
+import pytest
+from redis.exceptions import RedisError
+
+from typing import List
+from pydantic import BaseModel
+
+from app.core import redis_client
+from app.core.cache import LocalLRUCache, TwoTierCache, cache, cached
+
+
+@pytest.fixture
+async def redis_available():
+    try:
+        await redis_client.get_redis_client().ping()
+    except RedisError:
+        pytest.skip("Redis 서버가 필요합니다")
+
+
+def test_local_lru_evicts_least_recently_used_and_expires():
+    lru = LocalLRUCache(max_size=2, ttl=60)
+    lru.set("a", 1)
+    lru.set("b", 2)
+    lru.get("a")
+    lru.set("c", 3)
+
+    assert lru.get("b") is None
+    assert lru.get("a") == 1
+    assert lru.get("c") == 3
+
+    lru.set("short", 4, ttl=0)
+    time.sleep(0.001)
+    assert lru.get("short") is None
+
+
+@pytest.mark.asyncio
+async def test_invalidation_is_broadcast_to_other_workers(redis_available):
+    worker_a = TwoTierCache(local_max_size=100, local_ttl=60, default_ttl=60)
+    worker_b = TwoTierCache(local_max_size=100, local_ttl=60, default_ttl=60)
+    worker_b.start_invalidation_listener()
+    try:
+        # 구독이 시작될 때까지 대기
+        await asyncio.sleep(0.2)
+
+        await worker_a.set("test:track:1", {"title": "old"})
+        assert await worker_b.get("test:track:1") == {"title": "old"}
+        assert worker_b.stats()["redis_hits"] == 1
+
+        # 두 번째 조회는 로컬 메모리에서 응답
+        assert await worker_b.get("test:track:1") == {"title": "old"}
+        assert worker_b.stats()["local_hits"] == 1
+
+        await worker_a.invalidate("test:track:1")
+        await asyncio.sleep(0.2)
+
+        assert worker_b.local.get("test:track:1") is None
+        assert await worker_b.get("test:track:1") is None
+    finally:
+        await worker_b.stop_invalidation_listener()
+
+
+class _Item(BaseModel):
+    id: int
+    name: str
+
+
+@pytest.mark.asyncio
+async def test_cached_decorator_invalidates_by_tag(redis_available):
+    # 같은 Redis에서 이전에 실행하며 남은 항목이 있으면 첫 호출부터 캐시에서 응답하므로 비움
+    await cache.invalidate_tags("test:group:7", "test:item:1", "test:item:2")
+    calls = []
+
+    @cached(List[_Item], tags=["test:group:{group_id}"], result_tags=lambda items: [f"test:item:{i.id}" for i in items])
+    async def list_items(db, group_id: int, limit: int = 10):
+        calls.append(group_id)
+        return [{"id": 1, "name": "a"}, {"id": 2, "name": "b"}][:limit]
+
+    first = await list_items(None, group_id=7)
+    assert [item.name for item in first] == ["a", "b"]
+    # 같은 인자는 캐시에서 스키마 인스턴스로 응답
+    second = await list_items(None, 7)
+    assert isinstance(second[0], _Item)
+    assert calls == [7]
+    # 다른 인자는 다른 키
+    await list_items(None, 7, limit=1)
+    assert calls == [7, 7]
+
+    # 결과에서 계산한 태그로도 무효화됨
+    await cache.invalidate_tags("test:item:1")
+    await list_items(None, 7)
+    await list_items(None, 7, limit=1)
+    assert calls == [7, 7, 7, 7]
+
+    await cache.invalidate_tags("test:group:7")
+    await list_items(None, 7)
+    assert calls == [7, 7, 7, 7, 7]
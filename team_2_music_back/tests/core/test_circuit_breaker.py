@@ -0,0 +1,41 @@
+import asyncio
+import pytest
+
+from app.core.circuit_breaker import CircuitBreaker
+
+
+@pytest.mark.asyncio
+async def test_breaker_opens_after_threshold_and_recovers_by_probe():
+    redis_up = False
+
+    async def probe():
+        if not redis_up:
+            raise ConnectionError("down")
+
+    breaker = CircuitBreaker("test", failure_threshold=3, probe_interval=0.01, probe=probe)
+
+    for _ in range(2):
+        breaker.record_failure(ConnectionError("down"))
+    assert breaker.allow()
+
+    breaker.record_failure(ConnectionError("down"))
+    assert not breaker.allow()
+    assert breaker.status()["state"] == CircuitBreaker.OPEN
+
+    # probe가 실패하는 동안은 계속 열려 있음
+    await asyncio.sleep(0.05)
+    assert not breaker.allow()
+
+    redis_up = True
+    await asyncio.sleep(0.05)
+    assert breaker.allow()
+    assert breaker.status()["consecutive_failures"] == 0
+    await breaker.stop()
+
+
+def test_success_resets_failure_count():
+    breaker = CircuitBreaker("test", failure_threshold=2, probe_interval=1)
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.allow()
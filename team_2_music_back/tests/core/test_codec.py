@@ -0,0 +1,50 @@
+from datetime import datetime
+
+import pytest
+
+from app.core.codec import CacheCodec, CodecError
+from app.models.models import TrackStatus
+from app.schemas import schemas
+
+
+def _track(track_id: int) -> schemas.Track:
+    return schemas.Track(
+        id=track_id,
+        title=f"트랙 {track_id}",
+        description="설명 " * 20,
+        artist_name="아티스트",
+        file_url=f"https://example.com/{track_id}.mp3",
+        status=TrackStatus.ready,
+        trending_score=0.0,
+        owner_user_id=1,
+        created_at=datetime(2025, 1, 1, 12, 30, 15, 123456),
+        owner=schemas.UserProfile(
+            id=1, user_id="u1", nickname="닉네임", is_active=True, created_at=datetime(2024, 12, 31)
+        ),
+    )
+
+
+def test_codec_round_trips_schema_lists_with_datetimes():
+    codec = CacheCodec(serializer="orjson", compression="zlib", compress_min_size=256)
+    tracks = [_track(i) for i in range(50)]
+
+    # 스키마 인스턴스를 그대로 넣어도 직렬화되고, 응답 스키마로 검증하면 원래 값으로 복원됨
+    data = codec.encode(tracks)
+    restored = [schemas.Track.model_validate(item) for item in codec.decode(data)]
+    assert restored == tracks
+    assert restored[0].created_at == datetime(2025, 1, 1, 12, 30, 15, 123456)
+
+    # 큰 목록은 압축되어 저장됨
+    assert data[:2] == b"jz"
+    plain = CacheCodec(serializer="json", compression="none").encode(tracks)
+    assert plain[:2] == b"jn"
+    assert len(data) < len(plain) / 3
+    # 코덱 설정이 달라도 헤더로 형식을 판별함
+    assert codec.decode(plain) == CacheCodec(compression="none").decode(data)
+
+
+def test_codec_rejects_unknown_payloads():
+    codec = CacheCodec()
+    assert codec.decode(codec.encode({"a": 1})) == {"a": 1}
+    with pytest.raises(CodecError):
+        codec.decode(b'{"a": 1}')
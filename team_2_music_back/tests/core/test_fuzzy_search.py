@@ -0,0 +1,74 @@
+import pytest
+
+from app.core.fuzzy_search import TrigramIndex, trigrams
+from app.crud import async_crud
+from app.db.database import AsyncSessionLocal
+from app.schemas import schemas
+
+
+def ids(results):
+    return [track_id for track_id, _ in results]
+
+
+def test_trigram_index_tolerates_typos_in_korean_and_english_names():
+    index = TrigramIndex()
+    index.replace_all([
+        (1, "Yesterday", "The Beatles", []),
+        (2, "밤편지", "아이유", []),
+        (3, "Dynamite", "방탄소년단", []),
+        (4, "Beat It", "Michael Jackson", []),
+    ])
+
+    assert trigrams("Ab") == {"  a", " ab", "ab "}
+
+    # 철자 순서, 모음/받침 하나 틀린 입력
+    assert ids(index.search("beatels"))[0] == 1
+    assert ids(index.search("아이우")) == [2]
+    assert ids(index.search("방탄소녕단")) == [3]
+    assert ids(index.search("micheal jakson")) == [4]
+    assert index.search("zzzz") == [] and index.search("!!") == []
+
+    # 정확히 일치하면 점수 1, 오타가 많을수록 낮음
+    [(_, exact)] = index.search("아이유")
+    [(_, typo)] = index.search("아이우")
+    assert exact == 1.0 and 0 < typo < exact
+
+    index.update_track(2, title="Through the Night")  # 아티스트는 유지
+    assert ids(index.search("아이유")) == [2]
+    assert index.search("밤편지") == []
+    index.remove_track(1)
+    assert 1 not in ids(index.search("beatles"))
+
+
+def test_candidates_are_capped_to_newest_tracks(monkeypatch):
+    index = TrigramIndex()
+    index.replace_all([(i, f"love song {i}", "band", []) for i in range(1, 201)])
+    monkeypatch.setattr("app.core.fuzzy_search.settings.SEARCH_FUZZY_MAX_CANDIDATES", 20)
+
+    results = index.search("love", limit=100)
+    assert len(results) == 20
+    assert min(ids(results)) > 180
+    assert ids(index.search("love", skip=5, limit=5)) == ids(results)[5:10]
+
+
+@pytest.mark.asyncio
+async def test_fuzzy_search_endpoint_returns_scored_tracks(authorized_client, mock_user_data):
+    async with AsyncSessionLocal() as db:
+        track = await async_crud.create_track(db, schemas.TrackCreate(
+            title="Quixotic Serenade", artist_name="Xylophonia", file_url="https://example.com/q.mp3",
+        ), owner_id=mock_user_data["db_user_id"])
+        track_id = track.id
+
+    response = await authorized_client.get(
+        "/api/v1/tracks/search", params={"q": "xylofonia", "fuzzy": "true"}
+    )
+    assert response.status_code == 200
+    [result] = response.json()
+    assert result["id"] == track_id and 0 < result["score"] < 1
+    assert result["owner"]["id"] == mock_user_data["db_user_id"]
+
+    # 일반 검색은 오타와 일치하지 않으며 점수 없음
+    response = await authorized_client.get("/api/v1/tracks/search", params={"q": "xylofonia"})
+    assert response.json() == []
+    response = await authorized_client.get("/api/v1/tracks/search", params={"q": "quixotic"})
+    assert [r["score"] for r in response.json()] == [None]
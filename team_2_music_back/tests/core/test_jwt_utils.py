@@ -0,0 +1,130 @@
+import asyncio
+import time
+import pytest
+from unittest.mock import patch
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jose import jwk, jwt
+
+from app.core import jwt_utils
+from app.core.jwt_utils import JWKSStore
+
+
+def _make_key(kid: str):
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    private_pem = private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ).decode()
+    public_pem = private_key.public_key().public_bytes(
+        serialization.Encoding.PEM,
+        serialization.PublicFormat.SubjectPublicKeyInfo,
+    ).decode()
+    public_jwk = jwk.construct(public_pem, "RS256").to_dict()
+    public_jwk["kid"] = kid
+    return private_pem, public_jwk
+
+
+@pytest.fixture(scope="module")
+def signing_key():
+    return _make_key("key-1")
+
+
+def _fake_get_jwks(jwks_list, calls):
+    async def fake_get_jwks(force_refresh: bool = False):
+        calls.append(force_refresh)
+        await asyncio.sleep(0.01)
+        return {"keys": list(jwks_list)}
+    return fake_get_jwks
+
+
+@pytest.mark.asyncio
+async def test_concurrent_cache_miss_fetches_jwks_once(signing_key):
+    _, public_jwk = signing_key
+    calls = []
+    store = JWKSStore()
+
+    with patch.object(jwt_utils, "get_jwks", _fake_get_jwks([public_jwk], calls)):
+        keys = await asyncio.gather(*[store.get_key("key-1") for _ in range(20)])
+
+    assert len(calls) == 1
+    assert all(key is keys[0] for key in keys)
+
+
+@pytest.mark.asyncio
+async def test_unknown_kid_refetches_once(signing_key):
+    _, public_jwk = signing_key
+    calls = []
+    store = JWKSStore()
+
+    with patch.object(jwt_utils, "get_jwks", _fake_get_jwks([public_jwk], calls)):
+        assert await store.get_key("key-1") is not None
+        assert await store.get_key("rotated-key") is None
+        # 쿨다운 동안에는 다시 조회하지 않음
+        assert await store.get_key("rotated-key") is None
+
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_verify_token_uses_cached_key(signing_key):
+    private_pem, public_jwk = signing_key
+    calls = []
+    store = JWKSStore()
+    token = jwt.encode(
+        {"sub": "user-1", "exp": int(time.time()) + 60},
+        private_pem,
+        algorithm="RS256",
+        headers={"kid": "key-1"},
+    )
+
+    with patch.object(jwt_utils, "get_jwks", _fake_get_jwks([public_jwk], calls)), \
+            patch.object(jwt_utils, "jwks_store", store):
+        for _ in range(3):
+            payload = await jwt_utils.verify_token(token)
+            assert payload["sub"] == "user-1"
+
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_verified_token_cache_skips_signature_check(signing_key):
+    private_pem, public_jwk = signing_key
+    store = JWKSStore()
+    cache = jwt_utils.VerifiedTokenCache(max_size=10)
+    token = jwt.encode(
+        {"sub": "user-2", "exp": int(time.time()) + 60},
+        private_pem,
+        algorithm="RS256",
+        headers={"kid": "key-1"},
+    )
+
+    with patch.object(jwt_utils, "get_jwks", _fake_get_jwks([public_jwk], [])), \
+            patch.object(jwt_utils, "jwks_store", store), \
+            patch.object(jwt_utils, "token_cache", cache), \
+            patch.object(jwt_utils.jwt, "decode", wraps=jwt.decode) as decode:
+        for _ in range(5):
+            payload = await jwt_utils.verify_token(token)
+            assert payload["sub"] == "user-2"
+
+    assert decode.call_count == 1
+    assert cache.stats()["hits"] == 4
+    assert cache.stats()["misses"] == 1
+
+
+def test_verified_token_cache_expires_and_evicts():
+    cache = jwt_utils.VerifiedTokenCache(max_size=2)
+    now = time.time()
+    cache.set("expired", {"sub": "a", "exp": now - 1})
+    assert cache.get("expired") is None
+
+    cache.set("t1", {"sub": "1", "exp": now + 60})
+    cache.set("t2", {"sub": "2", "exp": now + 60})
+    cache.get("t1")
+    cache.set("t3", {"sub": "3", "exp": now + 60})
+
+    # 가장 오래 사용되지 않은 t2가 제거됨
+    assert cache.get("t2") is None
+    assert cache.get("t1")["sub"] == "1"
+    assert cache.get("t3")["sub"] == "3"
@@ -0,0 +1,117 @@
+import asyncio
+import time
+import pytest
+from redis.exceptions import RedisError
+
+from app.core import redis_client
+from app.core.redis_client import (
+    cache_get,
+    cache_set,
+    cache_get_many,
+    cache_set_many,
+    cache_delete,
+    cache_acquire_lock,
+    cache_release_lock,
+    cache_get_or_compute,
+    cache_set_add_existing,
+    cache_set_combine_page,
+    cache_set_fill,
+)
+
+
+@pytest.fixture
+async def redis_available():
+    try:
+        await redis_client.get_redis_client().ping()
+    except RedisError:
+        pytest.skip("Redis 서버가 필요합니다")
+
+
+@pytest.mark.asyncio
+async def test_cache_set_many_and_get_many(redis_available):
+    items = {f"test:many:{i}": {"id": i, "title": f"track {i}"} for i in range(10)}
+
+    assert await cache_set_many(items, ttl=60)
+    result = await cache_get_many(list(items) + ["test:many:missing"])
+
+    assert result == items
+    assert await cache_get("test:many:3") == {"id": 3, "title": "track 3"}
+
+    for key in items:
+        await cache_delete(key)
+    assert await cache_get_many(items) == {}
+
+
+@pytest.mark.asyncio
+async def test_get_or_compute_rebuilds_once_for_concurrent_misses(redis_available):
+    key = "test:stampede:miss"
+    await cache_delete(key)
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        await asyncio.sleep(0.2)
+        return ["hot", "list"]
+
+    results = await asyncio.gather(*[cache_get_or_compute(key, compute, ttl=60) for _ in range(20)])
+
+    assert len(calls) == 1
+    assert all(value == ["hot", "list"] for value, _ in results)
+    assert sum(computed for _, computed in results) == 1
+    await cache_delete(key)
+
+
+@pytest.mark.asyncio
+async def test_get_or_compute_serves_stale_while_another_worker_rebuilds(redis_available):
+    key = "test:stampede:stale"
+    # 논리적으로 만료된 값
+    await cache_set(key, {"value": "old", "delta": 0.1, "expiry": time.time() - 1}, ttl=60)
+
+    async def compute():
+        return "new"
+
+    # 다른 워커가 재계산 락을 잡고 있으면 이전 값을 응답
+    token = await cache_acquire_lock(key, ttl=10)
+    assert await cache_get_or_compute(key, compute, ttl=60) == ("old", False)
+    await cache_release_lock(key, token)
+
+    # 락이 없으면 이 요청이 재계산
+    assert await cache_get_or_compute(key, compute, ttl=60) == ("new", True)
+    assert await cache_get_or_compute(key, compute, ttl=60) == ("new", False)
+
+    # 재계산이 실패해도 이전 값으로 응답
+    async def failing():
+        raise RuntimeError("backend down")
+
+    await cache_set(key, {"value": "old", "delta": 0.1, "expiry": time.time() - 1}, ttl=60)
+    assert await cache_get_or_compute(key, failing, ttl=60) == ("old", False)
+    await cache_delete(key)
+
+
+@pytest.mark.asyncio
+async def test_set_fill_skips_snapshot_taken_before_concurrent_add(redis_available):
+    await cache_delete("test:posting:a", "test:posting:a:gen", "test:posting:b", "test:posting:b:gen")
+
+    _, missing = await cache_set_combine_page(
+        "test:combined", ["test:posting:a"], union=False, ttl=60, offset=0, count=10,
+    )
+    # DB 스냅숏([1, 2])을 읽는 사이 3이 추가됨 (집합이 없으므로 세대 번호만 올라감)
+    assert await cache_set_add_existing(["test:posting:a"], 3, ttl=60)
+    assert not await cache_set_fill("test:posting:a", [1, 2], ttl=60, generation=missing[0])
+    _, missing = await cache_set_combine_page(
+        "test:combined", ["test:posting:a"], union=False, ttl=60, offset=0, count=10,
+    )
+    assert await cache_set_fill("test:posting:a", [1, 2, 3], ttl=60, generation=missing[0])
+
+    # 채우기는 기존 멤버를 지우지 않음
+    _, missing = await cache_set_combine_page(
+        "test:combined", ["test:posting:a", "test:posting:b"], union=True, ttl=60, offset=0, count=10,
+    )
+    assert list(missing) == [1]
+    assert await cache_set_fill("test:posting:b", [4], ttl=60, generation=missing[1])
+    await cache_set_add_existing(["test:posting:b"], 5, ttl=60)
+    assert await cache_set_fill("test:posting:a", [1], ttl=60, generation="0") is False
+    page, _ = await cache_set_combine_page(
+        "test:combined", ["test:posting:a", "test:posting:b"], union=True, ttl=60, offset=0, count=10,
+    )
+    assert page == [5, 4, 3, 2, 1]
@@ -0,0 +1,457 @@
+import asyncio
+from contextlib import contextmanager
+import pytest
+from sqlalchemy import event, select, func
+from sqlalchemy.exc import IntegrityError
+
+from app.core.pagination import decode_cursor, encode_cursor
+from app.core.redis_client import redis_breaker
+from app.crud import async_crud, crud, search_cache
+from app.crud.search_cache import search_stats
+from app.db.database import AsyncSessionLocal, async_engine
+from app.models import models
+from app.schemas import schemas
+
+
+@pytest.mark.asyncio
+async def test_get_or_create_user_profile_concurrent_first_requests():
+    user = schemas.UserProfileCreate(user_id="concurrent-user", nickname="concurrent")
+
+    async def first_request():
+        async with AsyncSessionLocal() as db:
+            profile = await async_crud.get_or_create_user_profile(db, user=user)
+            return profile.id
+
+    ids = await asyncio.gather(*[first_request() for _ in range(5)])
+
+    assert len(set(ids)) == 1
+    async with AsyncSessionLocal() as db:
+        count = (await db.execute(
+            select(func.count()).select_from(models.UserProfile)
+            .where(models.UserProfile.user_id == "concurrent-user")
+        )).scalar_one()
+    assert count == 1
+
+
+@contextmanager
+def count_queries():
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(async_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+
+
+@pytest.mark.asyncio
+async def test_track_list_queries_do_not_grow_with_page_size(make_user, make_tracks):
+    async with AsyncSessionLocal() as db:
+        owners = [await make_user(db, f"n-plus-one-{i}", f"owner{i}") for i in range(3)]
+        listener = owners[0]
+        tracks = await make_tracks(
+            db, [owner.id for owner in owners], [f"eager track {i}" for i in range(30)],
+            artist_name="eager artist",
+        )
+        db.add_all([models.PlayHistory(user_id=listener.id, track_id=track.id) for track in tracks])
+        await db.commit()
+
+    # 캐시를 거치지 않는 원래 조회 함수로 쿼리 수 측정 (검색은 결과 캐시를 비운 뒤 미스로 측정)
+    get_tracks = async_crud.get_tracks.__wrapped__
+    await async_crud.cache.invalidate_tags(*search_cache.track_text_tags("eager"))
+    for limit in (5, 30):
+        async with AsyncSessionLocal() as db:
+            with count_queries() as statements:
+                tracks, _ = await get_tracks(db, skip=0, limit=limit)
+                searched = await async_crud.search_tracks(db, query="eager", limit=limit)
+                recent = await async_crud.get_recently_played_tracks(db, user_id=listener.id, limit=limit)
+            for track in [*tracks, *searched, *recent]:
+                schemas.Track.model_validate(track)
+
+        assert len(recent) == len(searched) == limit
+        assert len(statements) == 3
+
+
+@pytest.mark.asyncio
+async def test_liked_tracks_single_query_cursor_pagination(make_user, make_tracks):
+    async with AsyncSessionLocal() as db:
+        user = await make_user(db, "liker")
+        tracks = await make_tracks(db, user.id, [f"liked {i}" for i in range(7)])
+        for i, track in enumerate(tracks):
+            track.status = models.TrackStatus.ready if i % 3 else models.TrackStatus.processing
+        # 같은 초에 생성된 좋아요 (created_at 동률은 track_id로 구분)
+        db.add_all([models.Like(user_id=user.id, track_id=track.id) for track in tracks])
+        await db.commit()
+        ready_ids = sorted((t.id for t in tracks if t.status == models.TrackStatus.ready), reverse=True)
+
+    seen, cursor, pages = [], None, 0
+    while True:
+        async with AsyncSessionLocal() as db:
+            with count_queries() as statements:
+                page, cursor = await async_crud.get_user_liked_tracks(db, user_id=user.id, limit=2, cursor=cursor)
+            assert len(statements) == 1
+            seen.extend(schemas.Track.model_validate(track).id for track in page)
+        pages += 1
+        if cursor is None:
+            break
+
+    assert seen == ready_ids
+    assert pages == 2
+
+
+@pytest.mark.asyncio
+async def test_comment_cursor_pages_are_stable_under_inserts(make_user, make_tracks):
+    async with AsyncSessionLocal() as db:
+        user = await make_user(db, "commenter")
+        [track] = await make_tracks(db, user.id, ["commented"])
+        db.add_all([
+            models.Comment(track_id=track.id, user_id=user.id, content=f"comment {i}")
+            for i in range(5)
+        ])
+        await db.commit()
+
+    get_comments = async_crud.get_track_comments.__wrapped__
+    async with AsyncSessionLocal() as db:
+        first, cursor = await get_comments(db, track_id=track.id, limit=2)
+
+    # 페이지 사이에 새 댓글이 달려도 다음 페이지가 밀리거나 중복되지 않음
+    async with AsyncSessionLocal() as db:
+        await async_crud.create_comment(
+            db, schemas.CommentCreate(track_id=track.id, content="late comment"), user_id=user.id
+        )
+
+    seen = [comment.id for comment in first]
+    while cursor is not None:
+        async with AsyncSessionLocal() as db:
+            with count_queries() as statements:
+                # 클라이언트가 받은 문자열 커서를 다시 넘기는 흐름
+                page, cursor = await get_comments(
+                    db, track_id=track.id, limit=2, cursor=decode_cursor(encode_cursor(cursor))
+                )
+            assert len(statements) == 1
+            seen.extend(comment.id for comment in page)
+
+    assert len(seen) == len(set(seen)) == 5
+    assert seen == sorted(seen, reverse=True)
+
+
+@pytest.mark.asyncio
+async def test_follower_page_uses_counter_and_joined_query(make_user):
+    async with AsyncSessionLocal() as db:
+        artist = await make_user(db, "artist")
+        fans = [await make_user(db, f"fan-{i}", f"fan{i}") for i in range(5)]
+        for fan in fans:
+            await async_crud.create_follow(db, follower_id=fan.id, following_id=artist.id)
+        await async_crud.delete_follow(db, follower_id=fans[0].id, following_id=artist.id)
+
+    get_followers = async_crud.get_followers.__wrapped__
+    seen, cursor = [], None
+    while True:
+        async with AsyncSessionLocal() as db:
+            with count_queries() as statements:
+                page = await get_followers(db, user_id=artist.id, limit=3, cursor=cursor)
+            page = schemas.FollowListResponse.model_validate(page)
+        # 카운터 조회 1회 + 조인 쿼리 1회
+        assert len(statements) == 2
+        assert page.total == 4
+        seen.extend(user.id for user in page.users)
+        if page.next_cursor is None:
+            break
+        cursor = decode_cursor(page.next_cursor)
+
+    assert seen == sorted((fan.id for fan in fans[1:]), reverse=True)
+    async with AsyncSessionLocal() as db:
+        assert await get_followers(db, user_id=999999) is None
+        assert await async_crud.get_following_count.__wrapped__(db, user_id=fans[1].id) == 1
+
+
+@pytest.mark.asyncio
+async def test_playlist_detail_statement_count_is_bounded(make_user, make_tracks):
+    async with AsyncSessionLocal() as db:
+        owner = await make_user(db, "curator")
+        playlist = await async_crud.create_playlist(db, schemas.PlaylistCreate(name="big"), owner_id=owner.id)
+        tracks = await make_tracks(db, owner.id, [f"playlist track {i}" for i in range(40)])
+        # 역순으로 배치하여 track_order 정렬 확인
+        db.add_all([
+            models.PlaylistTrack(playlist_id=playlist.id, track_id=track.id, track_order=40 - i)
+            for i, track in enumerate(tracks)
+        ])
+        await db.commit()
+
+    async with AsyncSessionLocal() as db:
+        with count_queries() as statements:
+            meta = await async_crud.get_playlist_cached.__wrapped__(db, playlist_id=playlist.id)
+            tracks = await async_crud.get_playlist_tracks.__wrapped__(db, playlist_id=playlist.id)
+            total = await async_crud.get_playlist_track_count.__wrapped__(db, playlist_id=playlist.id)
+        page = await async_crud.get_playlist_tracks.__wrapped__(db, playlist_id=playlist.id, offset=10, limit=5)
+
+    assert len(statements) == 3
+    detail = schemas.PlaylistWithTracks.model_validate(
+        {**schemas.Playlist.model_validate(meta).model_dump(), "tracks": tracks, "track_count": total}
+    )
+    assert detail.track_count == len(detail.tracks) == 40
+    assert detail.tracks[0].title == "playlist track 39"
+    assert [t.id for t in page] == [t.id for t in detail.tracks[10:15]]
+
+
+@pytest.mark.asyncio
+async def test_track_counters_follow_writes_and_reconcile(db, make_user, make_tracks):
+    async with AsyncSessionLocal() as adb:
+        user = await make_user(adb, "counter-user", "counter")
+        [track] = await make_tracks(adb, user.id, ["counted"])
+        await adb.commit()
+
+        await async_crud.create_like(adb, track_id=track.id, user_id=user.id)
+        comment = await async_crud.create_comment(
+            adb, schemas.CommentCreate(track_id=track.id, content="hi"), user_id=user.id
+        )
+        await async_crud.create_comment(
+            adb, schemas.CommentCreate(track_id=track.id, content="again"), user_id=user.id
+        )
+        await async_crud.delete_comment(adb, comment)
+        for _ in range(3):
+            await async_crud.create_play_history(adb, user_id=user.id, track_id=track.id)
+
+    async with AsyncSessionLocal() as adb:
+        with count_queries() as statements:
+            counts = (
+                await async_crud.get_track_like_count.__wrapped__(adb, track_id=track.id),
+                await async_crud.get_track_comment_count.__wrapped__(adb, track_id=track.id),
+                await async_crud.get_play_count(adb, track_id=track.id),
+            )
+        assert counts == (1, 1, 3)
+        assert all("count(" not in statement.lower() for statement in statements)
+
+    # 카운터가 어긋나도 재계산 작업이 원본 집계로 되돌림
+    db.query(models.Track).filter(models.Track.id == track.id).update(
+        {models.Track.like_count: 42, models.Track.play_count: 0}
+    )
+    db.commit()
+    fixed = crud.reconcile_counters(db)
+    assert fixed["tracks.like_count"] >= 1
+    assert fixed["tracks.play_count"] >= 1
+    assert (crud.get_track_like_count(db, track.id), crud.get_play_count(db, track.id)) == (1, 3)
+
+
+@pytest.mark.asyncio
+async def test_toggle_like_and_follow_without_pre_queries(make_user, make_tracks):
+    async with AsyncSessionLocal() as db:
+        user = await make_user(db, "toggler")
+        other = await make_user(db, "toggled")
+        [track] = await make_tracks(db, other.id, ["toggled"])
+        await db.commit()
+
+    async def toggle():
+        async with AsyncSessionLocal() as db:
+            with count_queries() as statements:
+                result = await async_crud.toggle_like(db, track_id=track.id, user_id=user.id)
+            return result, statements
+
+    # 좋아요: DELETE(없음) -> INSERT -> 카운터 UPDATE
+    (is_liked, like_count), statements = await toggle()
+    assert (is_liked, like_count) == (True, 1)
+    assert len(statements) == 3
+    # 취소: DELETE -> 카운터 UPDATE
+    (is_liked, like_count), statements = await toggle()
+    assert (is_liked, like_count) == (False, 0)
+    assert len(statements) == 2
+
+    # 없는 트랙은 FK 오류로 판단
+    async with AsyncSessionLocal() as db:
+        assert await async_crud.toggle_like(db, track_id=track.id + 1000, user_id=user.id) is None
+
+    async with AsyncSessionLocal() as db:
+        assert await async_crud.toggle_follow(db, follower_id=user.id, following_id=other.id) == (True, 1, 1)
+        assert await async_crud.toggle_follow(db, follower_id=user.id, following_id=other.id) == (False, 0, 0)
+        assert await async_crud.toggle_follow(db, follower_id=user.id, following_id=other.id + 1000) is None
+
+
+@pytest.mark.asyncio
+async def test_unit_of_work_commits_once_and_rolls_back_on_error(make_user):
+    commits = []
+
+    def on_commit(conn):
+        commits.append(conn)
+
+    async with AsyncSessionLocal() as db:
+        owner = await make_user(db, "uow-owner", "uow")
+        event.listen(async_engine.sync_engine, "commit", on_commit)
+        try:
+            with count_queries() as statements:
+                async with async_crud.unit_of_work(db):
+                    track = await async_crud.create_track(
+                        db,
+                        schemas.TrackCreate(title="uow track", artist_name="uow", file_url="https://example.com/uow.mp3"),
+                        owner_id=owner.id,
+                    )
+                    playlist = await async_crud.create_playlist(
+                        db, schemas.PlaylistCreate(name="uow playlist"), owner_id=owner.id
+                    )
+                    await async_crud.add_track_to_playlist(db, playlist_id=playlist.id, track_id=track.id)
+        finally:
+            event.remove(async_engine.sync_engine, "commit", on_commit)
+
+        assert len(commits) == 1
+        # 서버 기본값은 RETURNING으로 채워져 커밋 후 재조회 없음
+        # (INSERT 3 + 관계 로딩 2 + 플레이리스트 트랙 추가의 SAVEPOINT/RELEASE 2)
+        assert len(statements) == 7
+        assert schemas.Track.model_validate(track).created_at is not None
+        assert schemas.PlaylistWithTracks.model_validate(playlist).tracks == []
+
+    with pytest.raises(RuntimeError):
+        async with AsyncSessionLocal() as db:
+            async with async_crud.unit_of_work(db):
+                await async_crud.create_playlist(
+                    db, schemas.PlaylistCreate(name="rolled back"), owner_id=owner.id
+                )
+                raise RuntimeError("abort")
+
+    # 블록 안의 무결성 오류는 해당 쓰기만 되돌리고 앞선 쓰기는 커밋
+    async with AsyncSessionLocal() as db:
+        async with async_crud.unit_of_work(db):
+            await async_crud.create_playlist(db, schemas.PlaylistCreate(name="kept"), owner_id=owner.id)
+            with pytest.raises(IntegrityError):
+                await async_crud.add_track_to_playlist(db, playlist_id=playlist.id, track_id=track.id)
+            assert await async_crud.toggle_like(db, track_id=track.id + 1000, user_id=owner.id) is None
+            assert await async_crud.toggle_follow(db, follower_id=owner.id, following_id=owner.id + 1000) is None
+
+    async with AsyncSessionLocal() as db:
+        names = (await db.execute(
+            select(models.Playlist.name).where(models.Playlist.owner_user_id == owner.id)
+            .order_by(models.Playlist.id)
+        )).scalars().all()
+    assert names == ["uow playlist", "kept"]
+
+
+@pytest.mark.asyncio
+async def test_search_tracks_ranks_full_text_matches_and_follows_updates(make_user):
+    async with AsyncSessionLocal() as db:
+        user = await make_user(db, "searcher")
+
+        async def create(title, artist_name, description=None):
+            return await async_crud.create_track(db, schemas.TrackCreate(
+                title=title, artist_name=artist_name, description=description,
+                file_url=f"https://example.com/{title}.mp3",
+            ), owner_id=user.id)
+
+        in_description = await create("quiet night", "band", "a moonlit serenade")
+        in_title = await create("Moonlit Walk", "band")
+        in_artist = await create("untitled", "moonlit quartet")
+        korean = await create("사랑해 오늘도", "가수")
+
+        with count_queries() as statements:
+            found = await async_crud.search_tracks(db, query="moonlit")
+        assert [t.id for t in found] == [in_title.id, in_artist.id, in_description.id]
+        assert len(statements) == 1 and " LIKE " not in statements[0].upper()
+
+        # 단어 접두어 일치, 모든 단어 AND, 특수문자 무시
+        assert [t.id for t in await async_crud.search_tracks(db, query="사랑")] == [korean.id]
+        assert [t.id for t in await async_crud.search_tracks(db, query='moon* "walk')] == [in_title.id]
+        assert await async_crud.search_tracks(db, query="^*()") == []
+
+        # 수정한 내용으로 검색 인덱스도 갱신
+        await async_crud.update_track(db, in_title.id, schemas.TrackUpdate(title="Sunrise Walk"))
+        assert [t.id for t in await async_crud.search_tracks(db, query="moonlit")] == [
+            in_artist.id, in_description.id,
+        ]
+        assert [t.id for t in await async_crud.search_tracks(db, query="sunrise")] == [in_title.id]
+
+
+@pytest.mark.asyncio
+async def test_search_results_cached_by_normalized_query_and_invalidated_on_writes(make_user):
+    async with AsyncSessionLocal() as db:
+        user = await make_user(db, "search-cache")
+
+        async def create(title):
+            return await async_crud.create_track(db, schemas.TrackCreate(
+                title=title, artist_name="cache band", file_url=f"https://example.com/{title}.mp3",
+            ), owner_id=user.id)
+
+        first = await create("Glimmer Tide")
+        second = await create("glimmer dawn")
+        lookups, hits = search_stats.lookups, search_stats.hits
+
+        with count_queries() as statements:
+            found = await async_crud.search_tracks(db, query="glimmer")
+        assert [t.id for t in found] == [second.id, first.id]
+        assert len(statements) == 1
+
+        # 단어 순서/대소문자/특수문자가 달라도 같은 키, 트랙 본문은 track:{id} 캐시에서
+        async_crud.cache.local.clear()
+        await async_crud.cache.invalidate(f"track:{first.id}")
+        with count_queries() as statements:
+            found = await async_crud.search_tracks(db, query="GLIMMER! glimmer")
+        assert [t.id for t in found] == [second.id, first.id]
+        assert found[1].owner.nickname == "search-cache"
+        assert len(statements) == 1 and " IN " in statements[0].upper()
+
+        # 같은 단어의 트랙이 생기거나 수정되면 결과 목록을 무효화
+        third = await create("Glimmering Lights")
+        assert [t.id for t in await async_crud.search_tracks(db, query="glimmer")] == [
+            third.id, second.id, first.id,
+        ]
+        await async_crud.update_track(db, first.id, schemas.TrackUpdate(title="Ocean Tide"))
+        assert [t.id for t in await async_crud.search_tracks(db, query="glimmer")] == [third.id, second.id]
+        # 밑줄은 DB 검색 인덱스처럼 단어 구분자 ("Glimmer_Veil"은 "veil"로도 검색)
+        assert await async_crud.search_tracks(db, query="veil") == []
+        await async_crud.update_track(db, second.id, schemas.TrackUpdate(title="Glimmer_Veil"))
+        assert [t.id for t in await async_crud.search_tracks(db, query="veil")] == [second.id]
+
+        # 오타 허용 검색도 캐싱하고, 트랙 생성/수정 시 무효화
+        fuzzy = await async_crud.search_tracks_fuzzy(db, query="ocaen tide")
+        assert [t.id for t in fuzzy] == [first.id] and fuzzy[0].score > 0
+        with count_queries() as statements:
+            cached = await async_crud.search_tracks_fuzzy(db, query="Tide ocaen")
+        assert [(t.id, t.score) for t in cached] == [(t.id, t.score) for t in fuzzy]
+        assert statements == []
+        await async_crud.update_track(db, first.id, schemas.TrackUpdate(title="Desert Wind"))
+        assert first.id not in [t.id for t in await async_crud.search_tracks_fuzzy(db, query="ocaen tide")]
+
+    assert search_stats.lookups - lookups == 9
+    assert search_stats.hits - hits == 2
+    top = {entry["query"]: entry["count"] for entry in search_stats.top_queries(100)}
+    assert top["glimmer"] >= 4
+
+
+@pytest.mark.asyncio
+async def test_tag_filter_and_or_with_redis_sets_and_sql_fallback(monkeypatch, make_user):
+    async with AsyncSessionLocal() as db:
+        user = await make_user(db, "tagger")
+
+        async def create(title, tags):
+            async with async_crud.unit_of_work(db):
+                track = await async_crud.create_track(db, schemas.TrackCreate(
+                    title=title, artist_name="tagger", file_url=f"https://example.com/{title}.mp3",
+                ), owner_id=user.id)
+                await async_crud.add_track_tags(db, track.id, tags)
+            return track.id
+
+        async def ids(names, match_all=True, **kwargs):
+            return [t.id for t in await async_crud.get_tracks_by_tags(db, names, match_all, **kwargs)]
+
+        jazz = await create("tag one", ["Swing", "#Mellow "])
+        both = await create("tag two", ["mellow", "swing", "SWING"])
+        mellow = await create("tag three", ["Late  Night", "mellow"])
+
+        counts = {tag.name: tag.track_count for tag in await async_crud.get_popular_tags(db, limit=100)}
+        assert (counts["mellow"], counts["swing"], counts["late night"]) == (3, 2, 1)
+
+        assert await ids(["swing", "mellow"]) == [both, jazz]
+        assert await ids(["swing", "late night"], match_all=False) == [mellow, both, jazz]
+        assert await ids(["swing", "unknown"]) == []
+        assert await ids(["swing", "unknown"], match_all=False) == [both, jazz]
+        assert await ids(["mellow"], skip=1, limit=1) == [both]
+
+        # 결과가 캐싱된 뒤 태그가 붙은 트랙도 바로 반영
+        newest = await create("tag four", ["swing", "mellow"])
+        assert await ids(["mellow", "swing"]) == [newest, both, jazz]
+
+        # Redis를 사용할 수 없으면 DB에서 집계
+        monkeypatch.setattr(redis_breaker, "allow", lambda: False)
+        with count_queries() as statements:
+            assert await ids(["swing", "mellow"]) == [newest, both, jazz]
+        assert len(statements) == 3
+        assert await ids(["swing", "late night"], match_all=False) == [newest, mellow, both, jazz]
@@ -0,0 +1,44 @@
+import pytest
+from sqlalchemy import create_engine, event, exc, text
+from sqlalchemy.pool import QueuePool
+
+from app.db.database import _set_sqlite_pragmas
+from app.db.pool_metrics import PoolMetrics, instrumented_pool_class
+
+
+def test_pool_metrics_record_checkout_wait_and_timeouts(tmp_path):
+    metrics = PoolMetrics()
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=instrumented_pool_class(QueuePool, metrics),
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.05,
+    )
+    event.listen(engine, "connect", _set_sqlite_pragmas)
+
+    conn = engine.connect()
+    assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+    assert conn.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+    assert conn.execute(text("PRAGMA foreign_keys")).scalar() == 1
+
+    stats = metrics.stats(engine.pool)
+    assert stats["checkouts"] == 1
+    assert stats["in_use"] == 1 and stats["idle"] == 0
+
+    # 풀이 가득 찬 상태에서는 pool_timeout만큼 기다린 뒤 실패
+    with pytest.raises(exc.TimeoutError):
+        engine.connect()
+    stats = metrics.stats(engine.pool)
+    assert stats["timeouts"] == 1
+    assert stats["wait_max_ms"] >= 50
+
+    conn.close()
+    # dispose 후 다시 만든 풀도 같은 metrics에 기록
+    engine.dispose()
+    with engine.connect():
+        pass
+    stats = metrics.stats(engine.pool)
+    assert stats["checkouts"] == 2
+    assert stats["in_use"] == 0 and stats["idle"] == 1
+    engine.dispose()